@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, Request, status
 from fastapi.routing import APIRouter
 from fastapi.responses import JSONResponse
@@ -7,11 +8,17 @@ from src.apps.users.routers import user_router
 from src.apps.jwt.routers import jwt_router
 from src.apps.groups.routers import group_router
 from src.apps.emails.routers import email_router
+from src.apps.monitoring.routers import monitoring_router
 from src.core.exceptions import (
     APIException,
     DoesNotExistException,
     PermissionDeniedException,
+    ServiceUnavailableException,
 )
+from src.apps.jwt.services import TokenService
+from src.apps.users.utils import password_executor
+from src.database.instrumentation import QueryInstrumentationMiddleware
+from src.settings import settings
 
 app = FastAPI(
     title="Netizen",
@@ -21,6 +28,10 @@ app = FastAPI(
     redoc_url="/api/v1/redoc",
 )
 
+# ----- Middleware -----
+
+app.add_middleware(QueryInstrumentationMiddleware)
+
 # ----- Routing -----
 
 app.include_router(email_router)
@@ -29,10 +40,28 @@ router = APIRouter(prefix="/api/v1")
 router.include_router(user_router)
 router.include_router(jwt_router)
 router.include_router(group_router)
+if settings.DEBUG:
+    router.include_router(monitoring_router)
 
 app.include_router(router)
 
 
+# ----- Lifecycle -----
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    app.state.revocation_refresh = asyncio.create_task(
+        TokenService.keep_revocation_list_fresh()
+    )
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    app.state.revocation_refresh.cancel()
+    password_executor.shutdown()
+
+
 # ----- Exception handlers -----
 
 
@@ -50,6 +79,15 @@ def api_error_handler(request: Request, exc: APIException):
     )
 
 
+@app.exception_handler(ServiceUnavailableException)
+def api_error_handler(request: Request, exc: APIException):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(APIException)
 def api_error_handler(request: Request, exc: APIException):
     return JSONResponse(
@@ -0,0 +1,74 @@
+"""Add pending request partial indexes
+
+Revision ID: 01da14540374
+Revises: 5cf734695d30
+Create Date: 2026-10-17 01:04:48.746969
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '01da14540374'
+down_revision = '5cf734695d30'
+branch_labels = None
+depends_on = None
+
+PENDING = sa.text("status = 'PENDING'")
+
+LOOKUP_INDEXES = [
+    ('ix_friendrequest_from_user_id', 'friendrequest', ['from_user_id'], None),
+    ('ix_grouprequest_group_id_pending', 'grouprequest', ['group_id'], PENDING),
+    ('ix_grouprequest_user_id_pending', 'grouprequest', ['user_id'], PENDING),
+]
+
+REPLACED_INDEXES = [
+    ('ix_friendrequest_from_user_id_to_user_id_status', 'friendrequest', ['from_user_id', 'to_user_id', 'status']),
+    ('ix_grouprequest_group_id_status', 'grouprequest', ['group_id', 'status']),
+    ('ix_grouprequest_user_id_status', 'grouprequest', ['user_id', 'status']),
+]
+
+
+def upgrade():
+    # Only the oldest pending request between two users is kept pending, or
+    # the unique index below could not be built.
+    op.execute(
+        """
+        UPDATE friendrequest SET status = 'DENIED'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY least(from_user_id, to_user_id),
+                                 greatest(from_user_id, to_user_id)
+                    ORDER BY created_at, id
+                ) AS position
+                FROM friendrequest WHERE status = 'PENDING'
+            ) AS pending
+            WHERE position > 1
+        )
+        """
+    )
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in LOOKUP_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_where=where, postgresql_concurrently=True)
+        op.create_index(
+            'uq_friendrequest_pending_user_pair',
+            'friendrequest',
+            [sa.text('least(from_user_id, to_user_id)'), sa.text('greatest(from_user_id, to_user_id)')],
+            unique=True,
+            postgresql_where=PENDING,
+            postgresql_concurrently=True,
+        )
+        for name, table, columns in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        op.drop_index('uq_friendrequest_pending_user_pair', table_name='friendrequest', postgresql_concurrently=True)
+        for name, table, columns, where in reversed(LOOKUP_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
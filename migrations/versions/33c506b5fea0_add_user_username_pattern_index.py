@@ -0,0 +1,29 @@
+"""Add user username pattern index
+
+Revision ID: 33c506b5fea0
+Revises: 9ee00fd47ead
+Create Date: 2026-10-17 00:19:34.524949
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '33c506b5fea0'
+down_revision = '9ee00fd47ead'
+branch_labels = None
+depends_on = None
+
+
+# Built concurrently: every authenticated request reads "user", and a plain
+# CREATE INDEX would block writes to it for the whole build.
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_user_username_pattern', 'user', ['username'], unique=False, postgresql_ops={'username': 'text_pattern_ops'}, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_username_pattern', table_name='user', postgresql_concurrently=True)
@@ -0,0 +1,64 @@
+"""Add one reaction per user unique indexes
+
+Revision ID: 57dbb284c428
+Revises: 01da14540374
+Create Date: 2026-10-17 01:10:56.459391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '57dbb284c428'
+down_revision = '01da14540374'
+branch_labels = None
+depends_on = None
+
+REACTION_TABLES = ['userpostreaction', 'grouppostreaction']
+BUILD_ATTEMPTS = 3
+
+
+def delete_duplicate_reactions(table):
+    # Only the latest reaction of each user on a post is kept.
+    op.execute(
+        f"""
+        DELETE FROM {table}
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY post_id, user_id
+                    ORDER BY created_at DESC, id DESC
+                ) AS position
+                FROM {table}
+            ) AS reactions
+            WHERE position > 1
+        )
+        """
+    )
+
+
+def upgrade():
+    # The index is built CONCURRENTLY, after the duplicates were deleted in a
+    # transaction of their own, so a duplicate inserted in between fails the
+    # build. The INVALID index it leaves behind is dropped and the duplicates
+    # deleted again before retrying.
+    with op.get_context().autocommit_block():
+        for table in REACTION_TABLES:
+            name = f'uq_{table}_post_id_user_id'
+            for attempt in range(BUILD_ATTEMPTS):
+                delete_duplicate_reactions(table)
+                try:
+                    op.create_index(name, table, ['post_id', 'user_id'], unique=True, postgresql_concurrently=True)
+                    break
+                except sa.exc.IntegrityError:
+                    op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+                    if attempt == BUILD_ATTEMPTS - 1:
+                        raise
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in REACTION_TABLES:
+            op.drop_index(f'uq_{table}_post_id_user_id', table_name=table, postgresql_concurrently=True)
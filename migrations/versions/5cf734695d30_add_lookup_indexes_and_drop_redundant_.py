@@ -0,0 +1,63 @@
+"""Add lookup indexes and drop redundant id indexes
+
+Revision ID: 5cf734695d30
+Revises: b67d4671e1b8
+Create Date: 2026-10-17 00:52:55.034885
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '5cf734695d30'
+down_revision = 'b67d4671e1b8'
+branch_labels = None
+depends_on = None
+
+# Built with CONCURRENTLY so writes are not blocked on a live database. The
+# statements cannot run in a transaction, hence the autocommit block; if a
+# build fails, drop the INVALID index it leaves behind before retrying.
+LOOKUP_INDEXES = [
+    ('ix_friend_user_id_created_at_id', 'friend', ['user_id', 'created_at', 'id']),
+    ('ix_friendrequest_from_user_id_to_user_id_status', 'friendrequest', ['from_user_id', 'to_user_id', 'status']),
+    ('ix_friendrequest_to_user_id', 'friendrequest', ['to_user_id']),
+    ('ix_groupmembership_group_id_user_id', 'groupmembership', ['group_id', 'user_id']),
+    ('ix_groupmembership_user_id', 'groupmembership', ['user_id']),
+    ('ix_grouprequest_group_id_status', 'grouprequest', ['group_id', 'status']),
+    ('ix_grouprequest_user_id_status', 'grouprequest', ['user_id', 'status']),
+]
+
+# Duplicates of the primary keys.
+ID_INDEXES = [
+    ('ix_friend_id', 'friend'),
+    ('ix_friendrequest_id', 'friendrequest'),
+    ('ix_group_id', 'group'),
+    ('ix_groupmembership_id', 'groupmembership'),
+    ('ix_grouppost_id', 'grouppost'),
+    ('ix_grouppostcomment_id', 'grouppostcomment'),
+    ('ix_grouppostreaction_id', 'grouppostreaction'),
+    ('ix_grouprequest_id', 'grouprequest'),
+    ('ix_revokedtoken_id', 'revokedtoken'),
+    ('ix_user_id', 'user'),
+    ('ix_userpost_id', 'userpost'),
+    ('ix_userpostcomment_id', 'userpostcomment'),
+    ('ix_userpostreaction_id', 'userpostreaction'),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in LOOKUP_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table in ID_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table in ID_INDEXES:
+            op.create_index(name, table, ['id'], unique=False, postgresql_concurrently=True)
+        for name, table, columns in reversed(LOOKUP_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,138 @@
+"""Add post reaction counters
+
+Revision ID: 7b7ae5cf3837
+Revises: 57dbb284c428
+Create Date: 2026-10-17 01:19:26.251423
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '7b7ae5cf3837'
+down_revision = '57dbb284c428'
+branch_labels = None
+depends_on = None
+
+# (post table, reaction table, counter table)
+REACTION_COUNTERS = [
+    ('userpost', 'userpostreaction', 'userpostreactioncounter'),
+    ('grouppost', 'grouppostreaction', 'grouppostreactioncounter'),
+]
+
+ADD_REACTION_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {post}_add_reaction_count(
+    target uuid, likes integer, dislikes integer
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    shards integer;
+BEGIN
+    IF likes = 0 AND dislikes = 0 THEN
+        RETURN;
+    END IF;
+    SELECT reaction_counter_shards INTO shards
+    FROM {post} WHERE id = target FOR KEY SHARE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+    IF shards > 0 THEN
+        INSERT INTO {counter} AS counter (post_id, shard, like_count, dislike_count)
+        VALUES (target, floor(random() * shards)::integer, likes, dislikes)
+        ON CONFLICT (post_id, shard) DO UPDATE SET
+            like_count = counter.like_count + excluded.like_count,
+            dislike_count = counter.dislike_count + excluded.dislike_count;
+    ELSE
+        UPDATE {post} SET
+            like_count = like_count + likes,
+            dislike_count = dislike_count + dislikes
+        WHERE id = target;
+    END IF;
+END
+$$
+"""
+
+REACTION_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {reaction}_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.post_id = NEW.post_id THEN
+        PERFORM {post}_add_reaction_count(
+            NEW.post_id,
+            (NEW.reaction = 'LIKE')::integer - (OLD.reaction = 'LIKE')::integer,
+            (NEW.reaction = 'DISLIKE')::integer - (OLD.reaction = 'DISLIKE')::integer
+        );
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM {post}_add_reaction_count(
+            OLD.post_id,
+            -(OLD.reaction = 'LIKE')::integer,
+            -(OLD.reaction = 'DISLIKE')::integer
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM {post}_add_reaction_count(
+            NEW.post_id,
+            (NEW.reaction = 'LIKE')::integer,
+            (NEW.reaction = 'DISLIKE')::integer
+        );
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+REACTION_COUNTER_TRIGGER = """
+CREATE TRIGGER {reaction}_count
+AFTER INSERT OR DELETE OR UPDATE OF post_id, reaction ON {reaction}
+FOR EACH ROW EXECUTE FUNCTION {reaction}_count()
+"""
+
+
+def upgrade():
+    for post, reaction, counter in REACTION_COUNTERS:
+        op.create_table(counter,
+        sa.Column('post_id', sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column('shard', sa.Integer(), nullable=False),
+        sa.Column('like_count', sa.Integer(), nullable=False),
+        sa.Column('dislike_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], [f'{post}.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('post_id', 'shard')
+        )
+        op.add_column(post, sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(post, sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(post, sa.Column('reaction_counter_shards', sa.Integer(), server_default='0', nullable=False))
+
+        names = dict(post=post, reaction=reaction, counter=counter)
+        op.execute(ADD_REACTION_COUNT_FUNCTION.format(**names))
+        op.execute(REACTION_COUNT_FUNCTION.format(**names))
+        # Creating the trigger blocks writes to the reactions until the
+        # migration commits, so the backfill below counts all of them.
+        op.execute(REACTION_COUNTER_TRIGGER.format(**names))
+        op.execute(
+            f"""
+            UPDATE {post} SET like_count = counts.like_count, dislike_count = counts.dislike_count
+            FROM (
+                SELECT
+                    post_id,
+                    count(*) FILTER (WHERE reaction = 'LIKE') AS like_count,
+                    count(*) FILTER (WHERE reaction = 'DISLIKE') AS dislike_count
+                FROM {reaction}
+                GROUP BY post_id
+            ) AS counts
+            WHERE {post}.id = counts.post_id
+            """
+        )
+
+
+def downgrade():
+    for post, reaction, counter in REACTION_COUNTERS:
+        op.execute(f'DROP TRIGGER {reaction}_count ON {reaction}')
+        op.execute(f'DROP FUNCTION {reaction}_count()')
+        op.execute(f'DROP FUNCTION {post}_add_reaction_count(uuid, integer, integer)')
+        op.drop_column(post, 'reaction_counter_shards')
+        op.drop_column(post, 'dislike_count')
+        op.drop_column(post, 'like_count')
+        op.drop_table(counter)
@@ -0,0 +1,84 @@
+"""Add group member counts
+
+Revision ID: 8dc0877a0129
+Revises: b18fd8b9dd58
+Create Date: 2026-10-17 01:33:58.054756
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '8dc0877a0129'
+down_revision = 'b18fd8b9dd58'
+branch_labels = None
+depends_on = None
+
+MEMBER_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION groupmembership_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE "group" SET
+            member_count = member_count - 1,
+            admin_count = admin_count
+                - ((OLD.membership_status = 'ADMIN') IS TRUE)::integer,
+            moderator_count = moderator_count
+                - ((OLD.membership_status = 'MODERATOR') IS TRUE)::integer
+        WHERE id = OLD.group_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE "group" SET
+            member_count = member_count + 1,
+            admin_count = admin_count
+                + ((NEW.membership_status = 'ADMIN') IS TRUE)::integer,
+            moderator_count = moderator_count
+                + ((NEW.membership_status = 'MODERATOR') IS TRUE)::integer
+        WHERE id = NEW.group_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+MEMBER_COUNT_TRIGGER = """
+CREATE TRIGGER groupmembership_count
+AFTER INSERT OR DELETE OR UPDATE OF group_id, membership_status ON groupmembership
+FOR EACH ROW EXECUTE FUNCTION groupmembership_count()
+"""
+
+
+def upgrade():
+    for column in ['member_count', 'admin_count', 'moderator_count']:
+        op.add_column('group', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+    op.execute(MEMBER_COUNT_FUNCTION)
+    # Creating the trigger blocks writes to the memberships until the
+    # migration commits, so the backfill below counts all of them.
+    op.execute(MEMBER_COUNT_TRIGGER)
+    op.execute(
+        """
+        UPDATE "group" SET
+            member_count = members.member_count,
+            admin_count = members.admin_count,
+            moderator_count = members.moderator_count
+        FROM (
+            SELECT
+                group_id,
+                count(*) AS member_count,
+                count(*) FILTER (WHERE membership_status = 'ADMIN') AS admin_count,
+                count(*) FILTER (WHERE membership_status = 'MODERATOR') AS moderator_count
+            FROM groupmembership
+            GROUP BY group_id
+        ) AS members
+        WHERE "group".id = members.group_id
+        """
+    )
+
+
+def downgrade():
+    op.execute('DROP TRIGGER groupmembership_count ON groupmembership')
+    op.execute('DROP FUNCTION groupmembership_count()')
+    for column in ['moderator_count', 'admin_count', 'member_count']:
+        op.drop_column('group', column)
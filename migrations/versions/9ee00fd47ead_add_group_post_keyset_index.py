@@ -0,0 +1,29 @@
+"""Add group post keyset index
+
+Revision ID: 9ee00fd47ead
+Revises: ae7415a56be8
+Create Date: 2026-10-17 00:13:33.272197
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '9ee00fd47ead'
+down_revision = 'ae7415a56be8'
+branch_labels = None
+depends_on = None
+
+
+# Built concurrently, like ix_userpost_user_id_created_at_id, so writes to
+# grouppost are not blocked while it builds.
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_grouppost_group_id_created_at_id', 'grouppost', ['group_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_grouppost_group_id_created_at_id', table_name='grouppost', postgresql_concurrently=True)
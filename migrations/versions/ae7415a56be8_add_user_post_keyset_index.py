@@ -0,0 +1,30 @@
+"""Add user post keyset index
+
+Revision ID: ae7415a56be8
+Revises: 2babf4ba8a32
+Create Date: 2026-10-17 00:09:07.325786
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'ae7415a56be8'
+down_revision = '2babf4ba8a32'
+branch_labels = None
+depends_on = None
+
+
+# Built with CONCURRENTLY so writes to userpost are not blocked on a live
+# database. That cannot run in a transaction, hence the autocommit block; if
+# the build fails, drop the INVALID index it leaves behind before retrying.
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_userpost_user_id_created_at_id', 'userpost', ['user_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_userpost_user_id_created_at_id', table_name='userpost', postgresql_concurrently=True)
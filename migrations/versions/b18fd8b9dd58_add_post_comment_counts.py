@@ -0,0 +1,101 @@
+"""Add post comment counts
+
+Revision ID: b18fd8b9dd58
+Revises: 7b7ae5cf3837
+Create Date: 2026-10-17 01:27:11.364117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'b18fd8b9dd58'
+down_revision = '7b7ae5cf3837'
+branch_labels = None
+depends_on = None
+
+# (post table, comment table, activity index, parent column)
+COMMENT_COUNTERS = [
+    ('userpost', 'userpostcomment', 'ix_userpost_user_id_last_commented_at_id', 'user_id'),
+    ('grouppost', 'grouppostcomment', 'ix_grouppost_group_id_last_commented_at_id', 'group_id'),
+]
+
+COMMENT_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {comment}_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE {post} SET
+            comment_count = comment_count + 1,
+            last_commented_at = greatest(last_commented_at, NEW.created_at)
+        WHERE id = NEW.post_id;
+    ELSE
+        UPDATE {post} SET
+            comment_count = comment_count - 1,
+            last_commented_at = CASE
+                WHEN last_commented_at > OLD.created_at THEN last_commented_at
+                ELSE (
+                    SELECT max(created_at) FROM {comment}
+                    WHERE post_id = OLD.post_id
+                )
+            END
+        WHERE id = OLD.post_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+COMMENT_COUNT_TRIGGER = """
+CREATE TRIGGER {comment}_count
+AFTER INSERT OR DELETE ON {comment}
+FOR EACH ROW EXECUTE FUNCTION {comment}_count()
+"""
+
+
+def upgrade():
+    for post, comment, index, parent in COMMENT_COUNTERS:
+        op.add_column(post, sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(post, sa.Column('last_commented_at', sa.DateTime(timezone=True), nullable=True))
+
+        names = dict(post=post, comment=comment)
+        op.execute(COMMENT_COUNT_FUNCTION.format(**names))
+        # Creating the trigger blocks writes to the comments until the
+        # migration commits, so the backfill below sees all of them.
+        op.execute(COMMENT_COUNT_TRIGGER.format(**names))
+        op.execute(
+            f"""
+            UPDATE {post} SET
+                comment_count = comments.comment_count,
+                last_commented_at = comments.last_commented_at
+            FROM (
+                SELECT post_id, count(*) AS comment_count, max(created_at) AS last_commented_at
+                FROM {comment}
+                GROUP BY post_id
+            ) AS comments
+            WHERE {post}.id = comments.post_id
+            """
+        )
+    with op.get_context().autocommit_block():
+        for post, comment, index, parent in COMMENT_COUNTERS:
+            op.create_index(
+                index,
+                post,
+                [parent, 'last_commented_at', 'id'],
+                unique=False,
+                postgresql_where=sa.text('last_commented_at IS NOT NULL'),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for post, comment, index, parent in COMMENT_COUNTERS:
+            op.drop_index(index, table_name=post, postgresql_concurrently=True)
+    for post, comment, index, parent in COMMENT_COUNTERS:
+        op.execute(f'DROP TRIGGER {comment}_count ON {comment}')
+        op.execute(f'DROP FUNCTION {comment}_count()')
+        op.drop_column(post, 'last_commented_at')
+        op.drop_column(post, 'comment_count')
@@ -0,0 +1,39 @@
+"""Add comment and reaction keyset indexes
+
+Revision ID: b67d4671e1b8
+Revises: 33c506b5fea0
+Create Date: 2026-10-17 00:25:22.970200
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'b67d4671e1b8'
+down_revision = '33c506b5fea0'
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = [
+    ('ix_grouppostcomment_post_id_created_at_id', 'grouppostcomment'),
+    ('ix_grouppostreaction_post_id_created_at_id', 'grouppostreaction'),
+    ('ix_userpostcomment_post_id_created_at_id', 'userpostcomment'),
+    ('ix_userpostreaction_post_id_created_at_id', 'userpostreaction'),
+]
+
+
+# Built concurrently so comments and reactions can still be written while the
+# indexes build.
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table in KEYSET_INDEXES:
+            op.create_index(name, table, ['post_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table in reversed(KEYSET_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
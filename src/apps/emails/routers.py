@@ -4,8 +4,9 @@ from fastapi_another_jwt_auth import AuthJWT
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.apps.users.services import UserService
 from src.database.connection import get_db
+from src.database.routing import DatabaseRoute
 
-email_router = APIRouter()
+email_router = APIRouter(route_class=DatabaseRoute)
 
 
 @email_router.post(
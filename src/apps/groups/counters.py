@@ -0,0 +1,43 @@
+from sqlalchemy import DDL, Table, event
+
+# Keeps the member counts of a group, overall and per role, in step with its
+# memberships in the transaction that changes them, as the post counters do.
+MEMBER_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {membership}_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE {group} SET
+            member_count = member_count - 1,
+            admin_count = admin_count
+                - ((OLD.membership_status = 'ADMIN') IS TRUE)::integer,
+            moderator_count = moderator_count
+                - ((OLD.membership_status = 'MODERATOR') IS TRUE)::integer
+        WHERE id = OLD.group_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE {group} SET
+            member_count = member_count + 1,
+            admin_count = admin_count
+                + ((NEW.membership_status = 'ADMIN') IS TRUE)::integer,
+            moderator_count = moderator_count
+                + ((NEW.membership_status = 'MODERATOR') IS TRUE)::integer
+        WHERE id = NEW.group_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+MEMBER_COUNT_TRIGGER = """
+CREATE TRIGGER {membership}_count
+AFTER INSERT OR DELETE OR UPDATE OF group_id, membership_status ON {membership}
+FOR EACH ROW EXECUTE FUNCTION {membership}_count()
+"""
+
+
+def count_members(group: Table, membership: Table) -> None:
+    # "group" is a reserved word.
+    names = dict(group=f'"{group.name}"', membership=membership.name)
+    for statement in (MEMBER_COUNT_FUNCTION, MEMBER_COUNT_TRIGGER):
+        event.listen(membership, "after_create", DDL(statement.format(**names)))
@@ -1,9 +1,11 @@
 from uuid import UUID
 from typing import TYPE_CHECKING, Optional
-from sqlmodel import Field, Relationship, Column, String
+from sqlmodel import Field, Relationship, Column, String, Index
+from sqlalchemy import literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Enum
 from src.core.models import TimeStampedUUIDModelBase
+from src.apps.groups.counters import count_members
 from src.apps.groups.enums import GroupMemberStatus, GroupRequestStatus, GroupStatus
 
 
@@ -31,7 +33,29 @@ class GroupRequest(TimeStampedUUIDModelBase, table=True):
     )
 
 
+# Handled requests are kept but never listed, so the indexes leave them out.
+# The literal lets prepared statements use them, as for friend requests.
+is_pending_group_request = GroupRequest.status == literal_column("'PENDING'")
+
+Index(
+    "ix_grouprequest_group_id_pending",
+    GroupRequest.group_id,
+    postgresql_where=is_pending_group_request,
+)
+Index(
+    "ix_grouprequest_user_id_pending",
+    GroupRequest.user_id,
+    postgresql_where=is_pending_group_request,
+)
+
+
 class GroupMembership(TimeStampedUUIDModelBase, table=True):
+    # The primary key leads with `id`, so it does not serve lookups by group.
+    __table_args__ = (
+        Index("ix_groupmembership_group_id_user_id", "group_id", "user_id"),
+        Index("ix_groupmembership_user_id", "user_id"),
+    )
+
     group_id: UUID = Field(foreign_key="group.id", primary_key=True)
     user_id: UUID = Field(foreign_key="user.id", primary_key=True)
 
@@ -53,6 +77,15 @@ class Group(TimeStampedUUIDModelBase, table=True):
     name: str = Field(sa_column=Column("name", String, unique=True))
     description: str
     status: GroupStatus = Field(sa_column=Column(Enum(GroupStatus)))
+    member_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    admin_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    moderator_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
 
     requests: list[GroupRequest] = Relationship(
         sa_relationship=relationship(
@@ -68,3 +101,6 @@ class Group(TimeStampedUUIDModelBase, table=True):
             back_populates="group",
         )
     )
+
+
+count_members(Group.__table__, GroupMembership.__table__)
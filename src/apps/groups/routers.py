@@ -5,7 +5,8 @@ from fastapi import Depends, status
 from fastapi.routing import APIRouter
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.database.connection import get_db
+from src.database.connection import get_db, get_read_db
+from src.database.routing import DatabaseRoute
 from src.apps.users.models import User
 from src.dependencies.users import authenticate_user, get_user_or_none
 from src.apps.groups.schemas import (
@@ -18,8 +19,10 @@ from src.apps.groups.schemas import (
 )
 from src.apps.groups.services import GroupService
 from src.apps.posts.routers import group_post_router
+from src.core.responses import list_response
+from src.core.streaming import NDJSON_RESPONSES, NDJSONResponse, accepts_ndjson
 
-group_router = APIRouter(prefix="/groups")
+group_router = APIRouter(prefix="/groups", route_class=DatabaseRoute)
 group_router.include_router(group_post_router)
 
 
@@ -32,16 +35,12 @@ group_router.include_router(group_post_router)
 async def get_user_group_requests(
     group_service: GroupService = Depends(),
     request_user: User = Depends(authenticate_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[GroupRequestOutputSchema]:
-    return [
-        GroupRequestOutputSchema.from_orm(group_request)
-        for group_request in (
-            await group_service.filter_get_user_group_request_list(
-                request_user=request_user, session=session
-            )
-        )
-    ]
+    rows = await group_service.filter_get_user_group_request_list(
+        request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=GroupRequestOutputSchema)
 
 
 @group_router.get(
@@ -54,7 +53,7 @@ async def get_user_group_request_by_id(
     request_id: UUID,
     group_service: GroupService = Depends(),
     request_user: User = Depends(authenticate_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> GroupRequestOutputSchema:
     request = await group_service.filter_get_user_group_request_by_id(
         request_id=request_id,
@@ -88,20 +87,25 @@ async def delete_user_group_request(
     tags=["groups"],
     status_code=status.HTTP_200_OK,
     response_model=list[GroupOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_groups(
     group_service: GroupService = Depends(),
     request_user: Union[User, None] = Depends(get_user_or_none),
-    session: AsyncSession = Depends(get_db),
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[GroupOutputSchema]:
-    return [
-        GroupOutputSchema.from_orm(group)
-        for group in (
-            await group_service.filter_get_group_list(
+    if stream:
+        return NDJSONResponse(
+            await group_service.stream_group_list(
                 request_user=request_user, session=session
-            )
+            ),
+            schema=GroupOutputSchema,
         )
-    ]
+    rows = await group_service.filter_get_group_list(
+        request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=GroupOutputSchema)
 
 
 @group_router.get(
@@ -114,7 +118,7 @@ async def get_group_by_id(
     group_id: UUID,
     group_service: GroupService = Depends(),
     request_user: Union[User, None] = Depends(get_user_or_none),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> GroupOutputSchema:
     group = await group_service.filter_get_group_by_id(
         group_id=group_id, request_user=request_user, session=session
@@ -219,16 +223,12 @@ async def get_group_requests(
     group_id: UUID,
     group_service: GroupService = Depends(),
     request_user: User = Depends(authenticate_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[GroupRequestOutputSchema]:
-    return [
-        GroupRequestOutputSchema.from_orm(group_request)
-        for group_request in (
-            await group_service.filter_get_group_request_list(
-                group_id=group_id, request_user=request_user, session=session
-            )
-        )
-    ]
+    rows = await group_service.filter_get_group_request_list(
+        group_id=group_id, request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=GroupRequestOutputSchema)
 
 
 @group_router.get(
@@ -242,7 +242,7 @@ async def get_group_request_by_id(
     request_id: UUID,
     group_service: GroupService = Depends(),
     request_user: User = Depends(authenticate_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> GroupRequestOutputSchema:
     request = await group_service.filter_get_group_request_by_id(
         group_id=group_id,
@@ -287,14 +287,12 @@ async def get_group_members(
     group_id: UUID,
     group_service: GroupService = Depends(),
     request_user: Union[User, None] = Depends(get_user_or_none),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[GroupMembershipOutputSchema]:
-    return [
-        GroupMembershipOutputSchema.from_orm(member)
-        for member in await group_service.filter_get_group_members_list(
-            group_id=group_id, request_user=request_user, session=session
-        )
-    ]
+    rows = await group_service.filter_get_group_members_list(
+        group_id=group_id, request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=GroupMembershipOutputSchema)
 
 
 @group_router.get(
@@ -308,7 +306,7 @@ async def get_group_member_by_id(
     membership_id: UUID,
     group_service: GroupService = Depends(),
     request_user: User = Depends(get_user_or_none),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> GroupMembershipOutputSchema:
     membership = await group_service.filter_get_group_member_by_id(
         group_id=group_id,
@@ -15,6 +15,9 @@ class GroupOutputSchema(TimeStampedUUIDModelBase):
     name: str
     description: str
     status: GroupStatus
+    member_count: int
+    admin_count: int
+    moderator_count: int
 
 
 class GroupMembershipUpdateSchema(BaseModel):
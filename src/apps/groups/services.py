@@ -1,6 +1,9 @@
 from typing import Union
 from uuid import UUID
-from sqlmodel import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from sqlmodel.sql.expression import Select
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.exceptions import (
@@ -14,10 +17,14 @@ from src.apps.groups.models import (
     Group,
     GroupMembership,
     GroupRequest,
+    is_pending_group_request,
 )
 from src.apps.groups.schemas import (
     GroupInputSchema,
+    GroupMembershipOutputSchema,
     GroupMembershipUpdateSchema,
+    GroupOutputSchema,
+    GroupRequestOutputSchema,
     GroupRequestUpdateSchema,
 )
 from src.apps.groups.permissions import (
@@ -25,7 +32,21 @@ from src.apps.groups.permissions import (
     validate_user_is_moderator_or_admin,
 )
 from src.apps.users.models import User
-from src.core.utils import get_object_by_id
+from src.core.streaming import stream_scalars
+from src.core.utils import (
+    create_object,
+    get_object_by_id,
+    OutputColumns,
+    OutputRow,
+    update_object_by_id,
+)
+
+
+MEMBER_COUNTS = ["member_count", "admin_count", "moderator_count"]
+
+group_columns = OutputColumns(Group, GroupOutputSchema)
+group_membership_columns = OutputColumns(GroupMembership, GroupMembershipOutputSchema)
+group_request_columns = OutputColumns(GroupRequest, GroupRequestOutputSchema)
 
 
 class GroupService:
@@ -45,9 +66,7 @@ class GroupService:
             user_id=user.id,
             membership_status=membership_status,
         )
-        session.add(membership)
-        await session.commit()
-        await session.refresh(membership)
+        membership = await create_object(membership, session=session)
         return membership
 
     @classmethod
@@ -63,18 +82,13 @@ class GroupService:
             group_id=group_id, user_id=request_user.id, session=session
         )
         await validate_user_is_moderator_or_admin(membership=request_user_membership)
-        membership = await get_object_by_id(
-            Table=GroupMembership, id=membership_id, session=session
-        )
         update_data = schema.dict()
-        await session.exec(
-            update(GroupMembership)
-            .where(GroupMembership.id == membership_id)
-            .values(**update_data)
+        membership = await update_object_by_id(
+            Table=GroupMembership,
+            id=membership_id,
+            values=update_data,
+            session=session,
         )
-
-        await session.refresh(membership)
-
         return membership
 
     @classmethod
@@ -93,7 +107,7 @@ class GroupService:
             Table=GroupMembership, id=membership_id, session=session
         )
         await session.delete(membership)
-        await session.commit()
+        await session.flush()
         return
 
     @classmethod
@@ -108,7 +122,7 @@ class GroupService:
         )
 
         await session.delete(membership)
-        await session.commit()
+        await session.flush()
         return
 
     @classmethod
@@ -149,13 +163,15 @@ class GroupService:
         group_id: UUID,
         request_user: User,
         session: AsyncSession,
-    ) -> list[GroupMembership | None]:
+    ) -> list[OutputRow]:
         group = await cls.filter_get_group_by_id(
             group_id=group_id, request_user=request_user, session=session
         )
         return (
             await session.exec(
-                select(GroupMembership).where(GroupMembership.group_id == group.id)
+                select(group_membership_columns).where(
+                    GroupMembership.group_id == group.id
+                )
             )
         ).all()
 
@@ -186,9 +202,11 @@ class GroupService:
         session: AsyncSession,
     ) -> Group:
         group_data = schema.dict()
-        group = Group(**group_data)
-        session.add(group)
-        await session.commit()
+        try:
+            async with session.begin_nested():
+                group = await create_object(Group(**group_data), session=session)
+        except IntegrityError:
+            raise AlreadyExistsException("Group with given name already exists.")
 
         admin = await cls.create_membership(
             group_id=group.id,
@@ -196,8 +214,8 @@ class GroupService:
             membership_status=GroupMemberStatus.ADMIN,
             session=session,
         )
-
-        await session.refresh(group)
+        # The membership was counted by the database, after the group was read.
+        await session.refresh(group, attribute_names=MEMBER_COUNTS)
         return group
 
     @classmethod
@@ -214,10 +232,9 @@ class GroupService:
         await validate_user_is_admin(membership=membership)
 
         update_data = schema.dict()
-        await session.exec(
-            update(Group).where(Group.id == group_id).values(**update_data)
+        group = await update_object_by_id(
+            Table=Group, id=group_id, values=update_data, session=session
         )
-        group = await get_object_by_id(Table=Group, id=group_id, session=session)
         return group
 
     @classmethod
@@ -234,32 +251,50 @@ class GroupService:
 
         group = (await session.exec(select(Group).where(Group.id == group_id))).first()
         await session.delete(group)
-        await session.commit()
+        await session.flush()
         return
 
+    @classmethod
+    def _select_group_list(cls, request_user: Union[User, None]) -> Select:
+        if not request_user:
+            return select(group_columns).where(Group.status != GroupStatus.CLOSED)
+        # EXISTS keeps the membership lookup on its index and lists each group
+        # once, rather than once per member.
+        is_member = (
+            select(GroupMembership.id)
+            .where(
+                (GroupMembership.group_id == Group.id)
+                & (GroupMembership.user_id == request_user.id)
+            )
+            .exists()
+        )
+        return select(group_columns).where(
+            is_member | (Group.status != GroupStatus.CLOSED)
+        )
+
     @classmethod
     async def filter_get_group_list(
         cls,
         request_user: Union[User, None],
         session: AsyncSession,
-    ) -> list[Group]:
-        if not request_user:
-            return (
-                await session.exec(
-                    select(Group).where(Group.status != GroupStatus.CLOSED)
-                )
-            ).all()
+    ) -> list[OutputRow]:
         return (
-            await session.exec(
-                select(Group)
-                .join(Group.members)
-                .join(GroupMembership.user)
-                .where(
-                    (User.id == request_user.id) | (Group.status != GroupStatus.CLOSED)
-                )
-            )
+            await session.exec(cls._select_group_list(request_user=request_user))
         ).all()
 
+    @classmethod
+    async def stream_group_list(
+        cls,
+        request_user: Union[User, None],
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        return await stream_scalars(
+            cls._select_group_list(request_user=request_user).order_by(
+                Group.created_at, Group.id
+            ),
+            session=session,
+        )
+
     @classmethod
     async def filter_get_group_by_id(
         cls,
@@ -293,11 +328,11 @@ class GroupService:
             raise AlreadyExistsException("User is already a member of this group")
 
         request = GroupRequest(
-            group=group, user=request_user, status=GroupRequestStatus.PENDING
+            group_id=group.id,
+            user_id=request_user.id,
+            status=GroupRequestStatus.PENDING,
         )
-        session.add(request)
-        await session.commit()
-        await session.refresh(request)
+        request = await create_object(request, session=session)
         return request
 
     @classmethod
@@ -330,18 +365,10 @@ class GroupService:
                 membership_status=GroupMemberStatus.REGULAR,
                 session=session,
             )
-        await session.exec(
-            update(GroupRequest)
-            .where(GroupRequest.id == request_id)
-            .values(**update_data)
+        return await update_object_by_id(
+            Table=GroupRequest, id=request_id, values=update_data, session=session
         )
 
-        return (
-            await session.exec(
-                select(GroupRequest).where(GroupRequest.id == request_id)
-            )
-        ).first()
-
     @classmethod
     async def _find_group_request(
         cls,
@@ -368,16 +395,15 @@ class GroupService:
         group_id: UUID,
         request_user: User,
         session: AsyncSession,
-    ) -> list[GroupRequest]:
+    ) -> list[OutputRow]:
         membership = await cls._find_membership_or_raise_exception(
             group_id=group_id, user_id=request_user.id, session=session
         )
         await validate_user_is_moderator_or_admin(membership=membership)
         return (
             await session.exec(
-                select(GroupRequest).where(
-                    (GroupRequest.group_id == group_id)
-                    & (GroupRequest.status == GroupRequestStatus.PENDING)
+                select(group_request_columns).where(
+                    (GroupRequest.group_id == group_id) & is_pending_group_request
                 )
             )
         ).all()
@@ -404,12 +430,11 @@ class GroupService:
         cls,
         request_user: User,
         session: AsyncSession,
-    ) -> list[GroupRequest]:
+    ) -> list[OutputRow]:
         requests = (
             await session.exec(
-                select(GroupRequest).where(
-                    (GroupRequest.user_id == request_user.id)
-                    & (GroupRequest.status == GroupRequestStatus.PENDING)
+                select(group_request_columns).where(
+                    (GroupRequest.user_id == request_user.id) & is_pending_group_request
                 )
             )
         ).all()
@@ -425,7 +450,7 @@ class GroupService:
         request = await get_object_by_id(
             Table=GroupRequest, id=request_id, session=session
         )
-        if request.user != request_user:
+        if request.user_id != request_user.id:
             raise PermissionDeniedException("Invalid group request id.")
         return request
 
@@ -442,5 +467,5 @@ class GroupService:
         if request.status != GroupRequestStatus.PENDING:
             raise GroupRequestAlreadyHandled("Group request was already handled.")
         await session.delete(request)
-        await session.commit()
+        await session.flush()
         return
@@ -0,0 +1,18 @@
+import datetime as dt
+from uuid import UUID
+from typing import Optional
+from sqlmodel import Field, Column, DateTime
+from src.core.models import TimeStampedUUIDModelBase
+
+
+class RevokedToken(TimeStampedUUIDModelBase, table=True):
+    """
+    Either a single revoked token (`jti`) or a revoked user (`user_id`), in
+    which case every token issued to that user before `created_at` is rejected.
+    """
+
+    jti: Optional[str] = None
+    user_id: Optional[UUID] = None
+    expires_at: dt.datetime = Field(
+        sa_column=Column(DateTime(timezone=True), index=True)
+    )
@@ -1,12 +1,38 @@
 from fastapi import APIRouter, Depends, Response, status
+from fastapi_another_jwt_auth import AuthJWT
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.apps.jwt.services import TokenService
 from src.apps.users.models import User
-from src.dependencies.users import authenticate_user
+from src.database.connection import get_db
+from src.database.routing import DatabaseRoute
+from src.dependencies.users import authenticate_user_claims
 
 
-jwt_router = APIRouter(prefix="/token")
+jwt_router = APIRouter(prefix="/token", route_class=DatabaseRoute)
 
 
 @jwt_router.post("/verify/", status_code=status.HTTP_204_NO_CONTENT)
-def verify_token(request_user: User = Depends(authenticate_user)) -> Response:
+def verify_token(request_user: User = Depends(authenticate_user_claims)) -> Response:
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@jwt_router.post("/revoke/", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_token(
+    auth_jwt: AuthJWT = Depends(),
+    token_service: TokenService = Depends(),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    auth_jwt.jwt_required()
+    await token_service.revoke_token(raw_token=auth_jwt.get_raw_jwt(), session=session)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@jwt_router.post("/revoke-all/", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_user_tokens(
+    request_user: User = Depends(authenticate_user_claims),
+    token_service: TokenService = Depends(),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    await token_service.revoke_user_tokens(user_id=request_user.id, session=session)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,208 @@
+import asyncio
+import datetime as dt
+import hashlib
+import json
+import logging
+import math
+import time
+from typing import Any, Optional, Union
+from uuid import UUID
+from fastapi import Request
+from fastapi_another_jwt_auth import AuthJWT
+from fastapi_another_jwt_auth.exceptions import RevokedTokenError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.jwt.models import RevokedToken
+from src.core.cache import LRUCache
+from src.core.utils import create_object
+from src.database.connection import async_session
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    In-memory copy of the unexpired rows of `RevokedToken`.
+
+    Every worker keeps its own copy and reloads it periodically, so checking a
+    token never touches the database. Revocations made by the worker itself
+    are added once they commit, and survive a reload of rows read before that.
+    """
+
+    def __init__(self):
+        self.jtis: set[str] = set()
+        self.users: dict[str, int] = {}
+        self._recent: list[tuple[float, RevokedToken]] = []
+
+    def _add(self, revoked_token: RevokedToken) -> None:
+        if revoked_token.jti is not None:
+            self.jtis.add(revoked_token.jti)
+        if revoked_token.user_id is not None:
+            # `iat` only has second precision, so the revocation covers the
+            # whole second it was made in: tokens issued later within that
+            # second are rejected too, rather than letting earlier ones pass.
+            self.users[str(revoked_token.user_id)] = max(
+                math.floor(revoked_token.created_at.timestamp()),
+                self.users.get(str(revoked_token.user_id), 0),
+            )
+
+    def add(self, revoked_token: RevokedToken) -> None:
+        self._recent.append((time.monotonic(), revoked_token))
+        self._add(revoked_token)
+
+    def add_on_commit(self, revoked_token: RevokedToken, session: AsyncSession) -> None:
+        """
+        Adds the revocation once the request's transaction commits, so a
+        failed commit does not leave one behind that was never stored.
+        """
+        session.info.setdefault("revoked_tokens", []).append(revoked_token)
+
+    def load(
+        self, revoked_tokens: list[RevokedToken], read_at: Optional[float] = None
+    ) -> None:
+        """
+        Replaces the list with `revoked_tokens`, read from the database at
+        `read_at` (by `time.monotonic()`). Revocations added since then are
+        kept, as the rows may predate their commit.
+        """
+        if read_at is None:
+            read_at = time.monotonic()
+        self._recent = [
+            (added_at, revoked_token)
+            for added_at, revoked_token in self._recent
+            if added_at >= read_at
+        ]
+        self.jtis, self.users = set(), {}
+        for revoked_token in revoked_tokens:
+            self._add(revoked_token)
+        for _, revoked_token in self._recent:
+            self._add(revoked_token)
+
+    def is_revoked(self, raw_token: dict[str, Union[str, int, bool]]) -> bool:
+        if raw_token.get("jti") in self.jtis:
+            return True
+        if not self.users:
+            return False
+        user_id = json.loads(raw_token["sub"]).get("id")
+        revoked_at = self.users.get(user_id)
+        return revoked_at is not None and raw_token["iat"] <= revoked_at
+
+
+revocation_list = RevocationList()
+
+
+@event.listens_for(Session, "after_commit")
+def add_committed_revocations(session: Session) -> None:
+    for revoked_token in session.info.pop("revoked_tokens", []):
+        revocation_list.add(revoked_token)
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_rolled_back_revocations(session: Session) -> None:
+    session.info.pop("revoked_tokens", None)
+
+
+def check_if_token_in_denylist(decrypted_token: dict) -> bool:
+    return revocation_list.is_revoked(decrypted_token)
+
+
+# The loader decorator does not return the function, so it is registered here.
+AuthJWT.token_in_denylist_loader(check_if_token_in_denylist)
+
+
+token_cache = LRUCache(
+    maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.authjwt_access_token_expires
+)
+
+
+def check_token_is_not_revoked(claims: dict[str, Union[str, int, bool]]) -> None:
+    if not settings.authjwt_denylist_enabled:
+        return
+    if claims["type"] not in settings.authjwt_denylist_token_checks:
+        return
+    if check_if_token_in_denylist(claims):
+        raise RevokedTokenError(status_code=401, message="Token has been revoked")
+
+
+def get_verified_subject(request: Request, auth_jwt: AuthJWT) -> dict[str, Any]:
+    """
+    Verifies the request's access token and returns its decoded subject.
+
+    Tokens that were already verified are cached by the digest of the header
+    carrying them until they expire, skipping the signature check and JSON
+    decoding. The revocation check still runs on every call.
+    """
+    authorization = request.headers.get(settings.authjwt_header_name)
+    if not authorization:
+        auth_jwt.jwt_required()
+
+    key = hashlib.sha256(authorization.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        claims, subject = cached
+        check_token_is_not_revoked(claims)
+        return subject
+
+    auth_jwt.jwt_required()
+    claims = auth_jwt.get_raw_jwt()
+    subject = json.loads(claims["sub"])
+    if "exp" in claims:
+        token_cache.set(key, (claims, subject), ttl=claims["exp"] - time.time())
+    return subject
+
+
+class TokenService:
+    @classmethod
+    async def revoke_token(
+        cls,
+        raw_token: dict[str, Union[str, int, bool]],
+        session: AsyncSession,
+    ) -> RevokedToken:
+        revoked_token = RevokedToken(
+            jti=raw_token["jti"],
+            expires_at=dt.datetime.fromtimestamp(raw_token["exp"], tz=dt.timezone.utc),
+        )
+        revoked_token = await create_object(revoked_token, session=session)
+        revocation_list.add_on_commit(revoked_token, session=session)
+        return revoked_token
+
+    @classmethod
+    async def revoke_user_tokens(
+        cls,
+        user_id: UUID,
+        session: AsyncSession,
+    ) -> RevokedToken:
+        revoked_token = RevokedToken(
+            user_id=user_id,
+            expires_at=dt.datetime.now(tz=dt.timezone.utc)
+            + dt.timedelta(seconds=settings.authjwt_access_token_expires),
+        )
+        revoked_token = await create_object(revoked_token, session=session)
+        revocation_list.add_on_commit(revoked_token, session=session)
+        return revoked_token
+
+    @classmethod
+    async def refresh_revocation_list(cls, session: AsyncSession) -> None:
+        read_at = time.monotonic()
+        revoked_tokens = (
+            await session.exec(
+                select(RevokedToken).where(
+                    RevokedToken.expires_at > dt.datetime.now(tz=dt.timezone.utc)
+                )
+            )
+        ).all()
+        revocation_list.load(revoked_tokens, read_at=read_at)
+
+    @classmethod
+    async def keep_revocation_list_fresh(cls) -> None:
+        while True:
+            try:
+                async with async_session() as session:
+                    await cls.refresh_revocation_list(session=session)
+            except Exception:
+                logger.exception("Could not refresh the token revocation list.")
+            await asyncio.sleep(settings.authjwt_revocation_refresh_interval)
@@ -0,0 +1,34 @@
+from typing import Any
+from fastapi import APIRouter, status
+
+from src.apps.jwt.services import token_cache
+from src.apps.users.cache import user_cache
+from src.apps.users.utils import password_executor
+from src.database.connection import get_pool_stats
+
+
+monitoring_router = APIRouter(prefix="/monitoring")
+
+
+@monitoring_router.get(
+    "/database/",
+    status_code=status.HTTP_200_OK,
+)
+def get_database_stats() -> dict[str, Any]:
+    return {"pools": get_pool_stats()}
+
+
+@monitoring_router.get(
+    "/executors/",
+    status_code=status.HTTP_200_OK,
+)
+def get_executor_stats() -> dict[str, Any]:
+    return {"password": password_executor.stats()}
+
+
+@monitoring_router.get(
+    "/caches/",
+    status_code=status.HTTP_200_OK,
+)
+def get_cache_stats() -> dict[str, Any]:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
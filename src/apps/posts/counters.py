@@ -0,0 +1,136 @@
+from sqlalchemy import DDL, Table, event
+
+# Keeps the like and dislike counts of a post in step with its reactions, in
+# the transaction that changes them, whichever statement does it: inserts,
+# upserts, updates and (cascaded) deletes alike.
+#
+# A post with `reaction_counter_shards` > 0 has its changes added to one of
+# that many counter rows picked at random instead of its own row, so that
+# concurrent reactions do not all queue on the post's row lock. The
+# reconciliation job folds those rows back into the post.
+#
+# Every change holds a key share lock on the post, the same lock the foreign
+# key check of a new reaction takes, which lets the job lock a post out of
+# counting while it recounts it.
+ADD_REACTION_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {post}_add_reaction_count(
+    target uuid, likes integer, dislikes integer
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    shards integer;
+BEGIN
+    IF likes = 0 AND dislikes = 0 THEN
+        RETURN;
+    END IF;
+    SELECT reaction_counter_shards INTO shards
+    FROM {post} WHERE id = target FOR KEY SHARE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+    IF shards > 0 THEN
+        INSERT INTO {counter} AS counter (post_id, shard, like_count, dislike_count)
+        VALUES (target, floor(random() * shards)::integer, likes, dislikes)
+        ON CONFLICT (post_id, shard) DO UPDATE SET
+            like_count = counter.like_count + excluded.like_count,
+            dislike_count = counter.dislike_count + excluded.dislike_count;
+    ELSE
+        UPDATE {post} SET
+            like_count = like_count + likes,
+            dislike_count = dislike_count + dislikes
+        WHERE id = target;
+    END IF;
+END
+$$
+"""
+
+REACTION_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {reaction}_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.post_id = NEW.post_id THEN
+        PERFORM {post}_add_reaction_count(
+            NEW.post_id,
+            (NEW.reaction = 'LIKE')::integer - (OLD.reaction = 'LIKE')::integer,
+            (NEW.reaction = 'DISLIKE')::integer - (OLD.reaction = 'DISLIKE')::integer
+        );
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM {post}_add_reaction_count(
+            OLD.post_id,
+            -(OLD.reaction = 'LIKE')::integer,
+            -(OLD.reaction = 'DISLIKE')::integer
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM {post}_add_reaction_count(
+            NEW.post_id,
+            (NEW.reaction = 'LIKE')::integer,
+            (NEW.reaction = 'DISLIKE')::integer
+        );
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+REACTION_COUNTER_TRIGGER = """
+CREATE TRIGGER {reaction}_count
+AFTER INSERT OR DELETE OR UPDATE OF post_id, reaction ON {reaction}
+FOR EACH ROW EXECUTE FUNCTION {reaction}_count()
+"""
+
+
+def count_reactions(post: Table, reaction: Table, counter: Table) -> None:
+    """
+    Installs the counting trigger whenever the reaction table is created from
+    the metadata. Migrations install it on their own.
+    """
+    names = dict(post=post.name, reaction=reaction.name, counter=counter.name)
+    for statement in (
+        ADD_REACTION_COUNT_FUNCTION,
+        REACTION_COUNT_FUNCTION,
+        REACTION_COUNTER_TRIGGER,
+    ):
+        event.listen(reaction, "after_create", DDL(statement.format(**names)))
+
+
+# Counts the comments of a post and stamps it with the time of the latest
+# one, which is looked up again when that comment is deleted.
+COMMENT_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION {comment}_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE {post} SET
+            comment_count = comment_count + 1,
+            last_commented_at = greatest(last_commented_at, NEW.created_at)
+        WHERE id = NEW.post_id;
+    ELSE
+        UPDATE {post} SET
+            comment_count = comment_count - 1,
+            last_commented_at = CASE
+                WHEN last_commented_at > OLD.created_at THEN last_commented_at
+                ELSE (
+                    SELECT max(created_at) FROM {comment}
+                    WHERE post_id = OLD.post_id
+                )
+            END
+        WHERE id = OLD.post_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+COMMENT_COUNT_TRIGGER = """
+CREATE TRIGGER {comment}_count
+AFTER INSERT OR DELETE ON {comment}
+FOR EACH ROW EXECUTE FUNCTION {comment}_count()
+"""
+
+
+def count_comments(post: Table, comment: Table) -> None:
+    names = dict(post=post.name, comment=comment.name)
+    for statement in (COMMENT_COUNT_FUNCTION, COMMENT_COUNT_TRIGGER):
+        event.listen(comment, "after_create", DDL(statement.format(**names)))
@@ -4,3 +4,8 @@ from enum import Enum
 class ReactionEnum(str, Enum):
     LIKE = "LIKE"
     DISLIKE = "DISLIKE"
+
+
+class PostOrder(str, Enum):
+    NEWEST = "newest"
+    ACTIVITY = "activity"
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.posts.models import (
+    GroupPost,
+    GroupPostReaction,
+    GroupPostReactionCounter,
+    UserPost,
+    UserPostReaction,
+    UserPostReactionCounter,
+)
+from src.apps.posts.services import ReactionCounterService
+from src.database.connection import async_session
+
+logger = logging.getLogger(__name__)
+
+REACTION_COUNTERS = (
+    (UserPost, UserPostReaction, UserPostReactionCounter),
+    (GroupPost, GroupPostReaction, GroupPostReactionCounter),
+)
+REPAIR_BATCH_SIZE = 500
+
+
+async def reconcile_reaction_counts(session: AsyncSession) -> int:
+    """
+    Shards the counters of popular posts, folds the shards back into their
+    posts and repairs counts that drifted from the reactions, committing after
+    each step so that posts stay locked for one batch at most. Returns the
+    number of repaired posts.
+    """
+    repaired = 0
+    for Post, Reaction, Counter in REACTION_COUNTERS:
+        await ReactionCounterService.shard_popular_posts(Post, session=session)
+        await ReactionCounterService.fold_counter_shards(Post, Counter, session=session)
+        await session.commit()
+        while True:
+            count = await ReactionCounterService.repair_drifted_counts(
+                Post, Reaction, Counter, limit=REPAIR_BATCH_SIZE, session=session
+            )
+            await session.commit()
+            repaired += count
+            if count < REPAIR_BATCH_SIZE:
+                break
+    return repaired
+
+
+async def main() -> None:
+    async with async_session() as session:
+        repaired = await reconcile_reaction_counts(session)
+    logger.info("Repaired the reaction counts of %d posts", repaired)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
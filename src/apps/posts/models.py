@@ -1,7 +1,10 @@
+from datetime import datetime
 from uuid import UUID
 from typing import Any, TYPE_CHECKING, Optional
-from sqlmodel import Relationship, Field, Column, Enum
+from sqlmodel import Relationship, Field, Column, DateTime, Enum, Index, SQLModel
+from sqlalchemy import ForeignKey
 from sqlalchemy.orm import relationship, backref
+from src.apps.posts.counters import count_comments, count_reactions
 from src.apps.posts.enums import ReactionEnum
 from src.core.models import TimeStampedUUIDModelBase
 
@@ -11,7 +14,26 @@ if TYPE_CHECKING:
 
 
 class UserPost(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index("ix_userpost_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     text: str
+    like_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    dislike_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    reaction_counter_shards: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    comment_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    last_commented_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
 
     user_id: UUID = Field(foreign_key="user.id")
 
@@ -23,7 +45,26 @@ class UserPost(TimeStampedUUIDModelBase, table=True):
 
 
 class GroupPost(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index("ix_grouppost_group_id_created_at_id", "group_id", "created_at", "id"),
+    )
+
     text: str
+    like_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    dislike_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    reaction_counter_shards: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    comment_count: int = Field(
+        default=0, nullable=False, sa_column_kwargs={"server_default": "0"}
+    )
+    last_commented_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
 
     group_id: UUID = Field(foreign_key="group.id")
     user_id: UUID = Field(foreign_key="user.id")
@@ -41,6 +82,12 @@ class GroupPost(TimeStampedUUIDModelBase, table=True):
 
 
 class UserPostComment(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index(
+            "ix_userpostcomment_post_id_created_at_id", "post_id", "created_at", "id"
+        ),
+    )
+
     text: str
 
     post_id: UUID = Field(foreign_key="userpost.id")
@@ -59,6 +106,12 @@ class UserPostComment(TimeStampedUUIDModelBase, table=True):
 
 
 class GroupPostComment(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index(
+            "ix_grouppostcomment_post_id_created_at_id", "post_id", "created_at", "id"
+        ),
+    )
+
     text: str
 
     post_id: UUID = Field(foreign_key="grouppost.id")
@@ -77,6 +130,12 @@ class GroupPostComment(TimeStampedUUIDModelBase, table=True):
 
 
 class UserPostReaction(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index(
+            "ix_userpostreaction_post_id_created_at_id", "post_id", "created_at", "id"
+        ),
+    )
+
     post_id: UUID = Field(foreign_key="userpost.id")
     user_id: UUID = Field(foreign_key="user.id")
     reaction: ReactionEnum = Field(sa_column=Column(Enum(ReactionEnum), index=False))
@@ -94,6 +153,12 @@ class UserPostReaction(TimeStampedUUIDModelBase, table=True):
 
 
 class GroupPostReaction(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index(
+            "ix_grouppostreaction_post_id_created_at_id", "post_id", "created_at", "id"
+        ),
+    )
+
     post_id: UUID = Field(foreign_key="grouppost.id")
     user_id: UUID = Field(foreign_key="user.id")
     reaction: ReactionEnum = Field(sa_column=Column(Enum(ReactionEnum), index=False))
@@ -108,3 +173,76 @@ class GroupPostReaction(TimeStampedUUIDModelBase, table=True):
             "User", backref=backref("group_post_reactions", cascade="all, delete")
         )
     )
+
+
+# One reaction per user and post; reacting again replaces it.
+user_post_reaction_per_user = Index(
+    "uq_userpostreaction_post_id_user_id",
+    UserPostReaction.post_id,
+    UserPostReaction.user_id,
+    unique=True,
+)
+group_post_reaction_per_user = Index(
+    "uq_grouppostreaction_post_id_user_id",
+    GroupPostReaction.post_id,
+    GroupPostReaction.user_id,
+    unique=True,
+)
+
+# Posts with comments, latest comment first, for the activity order.
+Index(
+    "ix_userpost_user_id_last_commented_at_id",
+    UserPost.user_id,
+    UserPost.last_commented_at,
+    UserPost.id,
+    postgresql_where=UserPost.last_commented_at.isnot(None),
+)
+Index(
+    "ix_grouppost_group_id_last_commented_at_id",
+    GroupPost.group_id,
+    GroupPost.last_commented_at,
+    GroupPost.id,
+    postgresql_where=GroupPost.last_commented_at.isnot(None),
+)
+
+
+class UserPostReactionCounter(SQLModel, table=True):
+    """
+    Counts added to a shard of a post with sharded reaction counters.
+    """
+
+    post_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("userpost.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    shard: int = Field(primary_key=True)
+    like_count: int = Field(default=0, nullable=False)
+    dislike_count: int = Field(default=0, nullable=False)
+
+
+class GroupPostReactionCounter(SQLModel, table=True):
+    """
+    Counts added to a shard of a post with sharded reaction counters.
+    """
+
+    post_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("grouppost.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    shard: int = Field(primary_key=True)
+    like_count: int = Field(default=0, nullable=False)
+    dislike_count: int = Field(default=0, nullable=False)
+
+
+count_reactions(
+    UserPost.__table__, UserPostReaction.__table__, UserPostReactionCounter.__table__
+)
+count_reactions(
+    GroupPost.__table__,
+    GroupPostReaction.__table__,
+    GroupPostReactionCounter.__table__,
+)
+count_comments(UserPost.__table__, UserPostComment.__table__)
+count_comments(GroupPost.__table__, GroupPostComment.__table__)
@@ -1,12 +1,17 @@
 from uuid import UUID
 from typing import Union
 
-from fastapi import Depends, status
+from fastapi import Depends, Query, status
 from fastapi.routing import APIRouter
 from sqlmodel.ext.asyncio.session import AsyncSession
+from src.apps.posts.enums import PostOrder
 from src.apps.posts.services import GroupPostService
 
-from src.database.connection import get_db
+from src.core.pagination import Page, PageParams, get_page_params
+from src.core.responses import page_response
+from src.core.streaming import NDJSON_RESPONSES, NDJSONResponse, accepts_ndjson
+from src.database.connection import get_db, get_read_db
+from src.database.routing import DatabaseRoute
 from src.apps.users.models import User
 from src.dependencies.users import authenticate_user, get_user_or_none
 from src.apps.posts.schemas import (
@@ -19,29 +24,43 @@ from src.apps.posts.schemas import (
 )
 
 
-group_post_router = APIRouter()
+group_post_router = APIRouter(route_class=DatabaseRoute)
 
 
 @group_post_router.get(
     "/{group_id}/posts/",
     tags=["group-posts"],
     status_code=status.HTTP_200_OK,
-    response_model=list[GroupPostOutputSchema],
+    response_model=Page[GroupPostOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_user_posts(
     group_id: UUID,
+    order: PostOrder = Query(PostOrder.NEWEST),
     request_user: Union[User, None] = Depends(get_user_or_none),
+    page_params: PageParams = Depends(get_page_params),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[GroupPostOutputSchema]:
-    return [
-        GroupPostOutputSchema.from_orm(user_post)
-        for user_post in (
-            await post_service.filter_get_group_post_list(
-                group_id=group_id, request_user=request_user, session=session
-            )
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[GroupPostOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_group_post_list(
+                group_id=group_id,
+                request_user=request_user,
+                session=session,
+                order=order,
+            ),
+            schema=GroupPostOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_group_post_list(
+        group_id=group_id,
+        request_user=request_user,
+        page_params=page_params,
+        session=session,
+        order=order,
+    )
+    return page_response(page, Schema=GroupPostOutputSchema)
 
 
 @group_post_router.post(
@@ -74,7 +93,7 @@ async def get_user_post_by_id(
     post_id: UUID,
     request_user: Union[User, None] = Depends(get_user_or_none),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> GroupPostOutputSchema:
     group_post = await post_service.filter_get_group_post_by_id(
         group_id=group_id, post_id=post_id, request_user=request_user, session=session
@@ -128,26 +147,36 @@ async def delete_group_post(
     "/{group_id}/posts/{post_id}/comments/",
     tags=["group-post-comments"],
     status_code=status.HTTP_200_OK,
-    response_model=list[CommentOutputSchema],
+    response_model=Page[CommentOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_group_post_comment_list(
     group_id: UUID,
     post_id: UUID,
+    page_params: PageParams = Depends(get_page_params),
     request_user: Union[User, None] = Depends(get_user_or_none),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[CommentOutputSchema]:
-    return [
-        CommentOutputSchema.from_orm(group_post_comment)
-        for group_post_comment in (
-            await post_service.filter_get_group_post_comment_list(
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[CommentOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_group_post_comment_list(
                 group_id=group_id,
                 post_id=post_id,
                 request_user=request_user,
                 session=session,
-            )
+            ),
+            schema=CommentOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_group_post_comment_list(
+        group_id=group_id,
+        post_id=post_id,
+        request_user=request_user,
+        page_params=page_params,
+        session=session,
+    )
+    return page_response(page, Schema=CommentOutputSchema)
 
 
 @group_post_router.post(
@@ -186,7 +215,7 @@ async def get_group_post_comment_by_id(
     comment_id: UUID,
     request_user: Union[User, None] = Depends(get_user_or_none),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> CommentOutputSchema:
     group_post_comment = await post_service.filter_get_group_post_comment_by_id(
         group_id=group_id,
@@ -251,26 +280,36 @@ async def delete_group_post_comment(
     "/{group_id}/posts/{post_id}/reactions/",
     tags=["group-post-reactions"],
     status_code=status.HTTP_200_OK,
-    response_model=list[ReactionOutputSchema],
+    response_model=Page[ReactionOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_group_post_reaction_list(
     group_id: UUID,
     post_id: UUID,
+    page_params: PageParams = Depends(get_page_params),
     request_user: Union[User, None] = Depends(get_user_or_none),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[ReactionOutputSchema]:
-    return [
-        ReactionOutputSchema.from_orm(group_post_reaction)
-        for group_post_reaction in (
-            await post_service.filter_get_group_post_reaction_list(
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[ReactionOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_group_post_reaction_list(
                 group_id=group_id,
                 post_id=post_id,
                 request_user=request_user,
                 session=session,
-            )
+            ),
+            schema=ReactionOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_group_post_reaction_list(
+        group_id=group_id,
+        post_id=post_id,
+        request_user=request_user,
+        page_params=page_params,
+        session=session,
+    )
+    return page_response(page, Schema=ReactionOutputSchema)
 
 
 @group_post_router.post(
@@ -297,6 +336,30 @@ async def create_group_post_reaction(
     return ReactionOutputSchema.from_orm(group_post_reaction)
 
 
+@group_post_router.put(
+    "/{group_id}/posts/{post_id}/reactions/",
+    tags=["group-post-reactions"],
+    status_code=status.HTTP_200_OK,
+    response_model=ReactionOutputSchema,
+)
+async def set_group_post_reaction(
+    schema: ReactionInputSchema,
+    group_id: UUID,
+    post_id: UUID,
+    request_user: User = Depends(authenticate_user),
+    post_service: GroupPostService = Depends(),
+    session: AsyncSession = Depends(get_db),
+) -> ReactionOutputSchema:
+    group_post_reaction = await post_service.set_group_post_reaction(
+        schema=schema,
+        group_id=group_id,
+        post_id=post_id,
+        request_user=request_user,
+        session=session,
+    )
+    return ReactionOutputSchema.from_orm(group_post_reaction)
+
+
 @group_post_router.get(
     "/{group_id}/posts/{post_id}/reactions/{reaction_id}/",
     tags=["group-post-reactions"],
@@ -309,7 +372,7 @@ async def get_group_post_reaction_by_id(
     reaction_id: UUID,
     request_user: Union[User, None] = Depends(get_user_or_none),
     post_service: GroupPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> ReactionOutputSchema:
     group_post_reaction = await post_service.filter_get_group_post_reaction_by_id(
         group_id=group_id,
@@ -1,11 +1,16 @@
 from uuid import UUID
 
-from fastapi import Depends, status
+from fastapi import Depends, Query, status
 from fastapi.routing import APIRouter
 from sqlmodel.ext.asyncio.session import AsyncSession
+from src.apps.posts.enums import PostOrder
 from src.apps.posts.services import UserPostService
 
-from src.database.connection import get_db
+from src.core.pagination import Page, PageParams, get_page_params
+from src.core.responses import page_response
+from src.core.streaming import NDJSON_RESPONSES, NDJSONResponse, accepts_ndjson
+from src.database.connection import get_db, get_read_db
+from src.database.routing import DatabaseRoute
 from src.apps.users.models import User
 from src.dependencies.users import authenticate_user
 from src.apps.posts.schemas import (
@@ -18,28 +23,35 @@ from src.apps.posts.schemas import (
 )
 
 
-user_post_router = APIRouter()
+user_post_router = APIRouter(route_class=DatabaseRoute)
 
 
 @user_post_router.get(
     "/{user_id}/posts/",
     tags=["user-posts"],
     status_code=status.HTTP_200_OK,
-    response_model=list[PostOutputSchema],
+    response_model=Page[PostOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_user_post_list(
     user_id: UUID,
+    order: PostOrder = Query(PostOrder.NEWEST),
+    page_params: PageParams = Depends(get_page_params),
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[PostOutputSchema]:
-    return [
-        PostOutputSchema.from_orm(user_post)
-        for user_post in (
-            await post_service.filter_get_user_post_list(
-                user_id=user_id, session=session
-            )
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[PostOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_user_post_list(
+                user_id=user_id, session=session, order=order
+            ),
+            schema=PostOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_user_post_list(
+        user_id=user_id, page_params=page_params, session=session, order=order
+    )
+    return page_response(page, Schema=PostOutputSchema)
 
 
 @user_post_router.post(
@@ -71,7 +83,7 @@ async def get_user_post_by_id(
     user_id: UUID,
     post_id: UUID,
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> PostOutputSchema:
     user_post = await post_service.filter_get_user_post_by_id(
         user_id=user_id, post_id=post_id, session=session
@@ -125,22 +137,28 @@ async def delete_user_post(
     "/{user_id}/posts/{post_id}/comments/",
     tags=["user-post-comments"],
     status_code=status.HTTP_200_OK,
-    response_model=list[CommentOutputSchema],
+    response_model=Page[CommentOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_user_post_comment_list(
     user_id: UUID,
     post_id: UUID,
+    page_params: PageParams = Depends(get_page_params),
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[CommentOutputSchema]:
-    return [
-        CommentOutputSchema.from_orm(user_post_comment)
-        for user_post_comment in (
-            await post_service.filter_get_user_post_comment_list(
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[CommentOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_user_post_comment_list(
                 user_id=user_id, post_id=post_id, session=session
-            )
+            ),
+            schema=CommentOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_user_post_comment_list(
+        user_id=user_id, post_id=post_id, page_params=page_params, session=session
+    )
+    return page_response(page, Schema=CommentOutputSchema)
 
 
 @user_post_router.post(
@@ -178,7 +196,7 @@ async def get_user_post_comment_by_id(
     post_id: UUID,
     comment_id: UUID,
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> CommentOutputSchema:
     user_post_comment = await post_service.filter_get_user_post_comment_by_id(
         user_id=user_id, post_id=post_id, comment_id=comment_id, session=session
@@ -239,22 +257,28 @@ async def delete_user_post_comment(
     "/{user_id}/posts/{post_id}/reactions/",
     tags=["user-post-reactions"],
     status_code=status.HTTP_200_OK,
-    response_model=list[ReactionOutputSchema],
+    response_model=Page[ReactionOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_user_post_reaction_list(
     user_id: UUID,
     post_id: UUID,
+    page_params: PageParams = Depends(get_page_params),
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[ReactionOutputSchema]:
-    return [
-        ReactionOutputSchema.from_orm(user_post_reaction)
-        for user_post_reaction in (
-            await post_service.filter_get_user_post_reaction_list(
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> Page[ReactionOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await post_service.stream_user_post_reaction_list(
                 user_id=user_id, post_id=post_id, session=session
-            )
+            ),
+            schema=ReactionOutputSchema,
         )
-    ]
+    page = await post_service.filter_get_user_post_reaction_list(
+        user_id=user_id, post_id=post_id, page_params=page_params, session=session
+    )
+    return page_response(page, Schema=ReactionOutputSchema)
 
 
 @user_post_router.post(
@@ -281,6 +305,30 @@ async def create_user_post_reaction(
     return ReactionOutputSchema.from_orm(user_post_comment)
 
 
+@user_post_router.put(
+    "/{user_id}/posts/{post_id}/reactions/",
+    tags=["user-post-reactions"],
+    status_code=status.HTTP_200_OK,
+    response_model=ReactionOutputSchema,
+)
+async def set_user_post_reaction(
+    schema: ReactionInputSchema,
+    user_id: UUID,
+    post_id: UUID,
+    request_user: User = Depends(authenticate_user),
+    post_service: UserPostService = Depends(),
+    session: AsyncSession = Depends(get_db),
+) -> ReactionOutputSchema:
+    user_post_reaction = await post_service.set_user_post_reaction(
+        schema=schema,
+        user_id=user_id,
+        post_id=post_id,
+        request_user=request_user,
+        session=session,
+    )
+    return ReactionOutputSchema.from_orm(user_post_reaction)
+
+
 @user_post_router.get(
     "/{user_id}/posts/{post_id}/reactions/{reaction_id}/",
     tags=["user-post-reactions"],
@@ -292,7 +340,7 @@ async def get_user_post_reaction_by_id(
     post_id: UUID,
     reaction_id: UUID,
     post_service: UserPostService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> ReactionOutputSchema:
     user_post_reaction = await post_service.filter_get_user_post_reaction_by_id(
         user_id=user_id, post_id=post_id, reaction_id=reaction_id, session=session
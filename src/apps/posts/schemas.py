@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel
 from src.core.models import TimeStampedUUIDModelBase
@@ -11,6 +13,10 @@ class PostInputSchema(BaseModel):
 class PostOutputSchema(TimeStampedUUIDModelBase):
     text: str
     user_id: UUID
+    like_count: int
+    dislike_count: int
+    comment_count: int
+    last_commented_at: Optional[datetime]
 
 
 class GroupPostOutputSchema(PostOutputSchema):
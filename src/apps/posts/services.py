@@ -1,6 +1,11 @@
 from typing import Union
 from uuid import UUID
-from sqlmodel import select, update
+from sqlalchemy import delete, exists, false, func, true, update
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from sqlmodel import select
+from sqlmodel.sql.expression import Select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.apps.groups.enums import GroupStatus
 from src.apps.groups.models import Group, GroupMembership
@@ -8,25 +13,112 @@ from src.apps.posts.models import (
     GroupPost,
     GroupPostComment,
     GroupPostReaction,
+    GroupPostReactionCounter,
     UserPost,
     UserPostComment,
     UserPostReaction,
+    UserPostReactionCounter,
+    group_post_reaction_per_user,
+    user_post_reaction_per_user,
 )
+from src.apps.posts.enums import PostOrder, ReactionEnum
 from src.apps.posts.schemas import (
     PostInputSchema,
+    PostOutputSchema,
+    GroupPostOutputSchema,
     CommentInputSchema,
+    CommentOutputSchema,
     ReactionInputSchema,
+    ReactionOutputSchema,
 )
 from src.core.exceptions import (
+    AlreadyExistsException,
     PermissionDeniedException,
     DoesNotExistException,
 )
 
 from src.apps.users.models import User
-from src.core.utils import get_object_by_id
+from src.settings import settings
+from src.core.pagination import Keyset, Page, PageParams
+from src.core.streaming import stream_scalars
+from src.core.utils import (
+    create_object,
+    create_object_or_none,
+    get_object_by_id,
+    OutputColumns,
+    OutputRow,
+    update_object_by_id,
+    upsert_object,
+)
+
+
+user_post_keyset = Keyset(UserPost.created_at, UserPost.id, descending=True)
+group_post_keyset = Keyset(GroupPost.created_at, GroupPost.id, descending=True)
+user_post_activity_keyset = Keyset(
+    UserPost.last_commented_at, UserPost.id, descending=True
+)
+group_post_activity_keyset = Keyset(
+    GroupPost.last_commented_at, GroupPost.id, descending=True
+)
+user_post_comment_keyset = Keyset(UserPostComment.created_at, UserPostComment.id)
+group_post_comment_keyset = Keyset(GroupPostComment.created_at, GroupPostComment.id)
+user_post_reaction_keyset = Keyset(UserPostReaction.created_at, UserPostReaction.id)
+group_post_reaction_keyset = Keyset(GroupPostReaction.created_at, GroupPostReaction.id)
+
+user_post_keysets = {
+    PostOrder.NEWEST: user_post_keyset,
+    PostOrder.ACTIVITY: user_post_activity_keyset,
+}
+group_post_keysets = {
+    PostOrder.NEWEST: group_post_keyset,
+    PostOrder.ACTIVITY: group_post_activity_keyset,
+}
+
+user_post_columns = OutputColumns(UserPost, PostOutputSchema)
+group_post_columns = OutputColumns(GroupPost, GroupPostOutputSchema)
+user_post_comment_columns = OutputColumns(UserPostComment, CommentOutputSchema)
+group_post_comment_columns = OutputColumns(GroupPostComment, CommentOutputSchema)
+user_post_reaction_columns = OutputColumns(UserPostReaction, ReactionOutputSchema)
+group_post_reaction_columns = OutputColumns(GroupPostReaction, ReactionOutputSchema)
 
 
 class UserPostService:
+    @classmethod
+    def _is_listed(cls, order: PostOrder) -> ColumnElement:
+        """
+        The activity order lists the posts that have comments only.
+        """
+        if order == PostOrder.ACTIVITY:
+            return UserPost.last_commented_at.isnot(None)
+        return true()
+
+    @classmethod
+    def _select_user_post(cls, user_id: UUID, post_id: UUID) -> Select:
+        """
+        Selects the ids of the user and of their post, left joined so that
+        either one is NULL when missing. Children of the post can be joined to
+        it, which lets a single statement tell which object does not exist.
+        """
+        return (
+            select(User.id, UserPost.id)
+            .outerjoin(
+                UserPost, (UserPost.user_id == User.id) & (UserPost.id == post_id)
+            )
+            .where(User.id == user_id)
+        )
+
+    @classmethod
+    async def _find_user_post_rows(
+        cls,
+        statement: Select,
+        session: AsyncSession,
+    ) -> list[Row]:
+        rows = (await session.exec(statement)).all()
+        if not rows:
+            raise DoesNotExistException("Object with given id does not exist")
+        if rows[0][1] is None:
+            raise DoesNotExistException("User post with given id does not exist.")
+        return rows
 
     # --- --- Posts --- ---
 
@@ -34,12 +126,46 @@ class UserPostService:
     async def filter_get_user_post_list(
         cls,
         user_id: UUID,
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[UserPost]:
-        user = await get_object_by_id(Table=User, id=user_id, session=session)
-        return (
-            await session.exec(select(UserPost).where(UserPost.user_id == user_id))
+        order: PostOrder = PostOrder.NEWEST,
+    ) -> Page[OutputRow]:
+        keyset = user_post_keysets[order]
+        rows = (
+            await session.exec(
+                select(User.id, user_post_columns)
+                .outerjoin(
+                    UserPost,
+                    (UserPost.user_id == User.id)
+                    & cls._is_listed(order)
+                    & keyset.after(page_params.cursor),
+                )
+                .where(User.id == user_id)
+                .order_by(*keyset.order_by())
+                .limit(page_params.limit + 1)
+            )
         ).all()
+        if not rows:
+            raise DoesNotExistException("Object with given id does not exist")
+        return keyset.page(
+            [user_post for _, user_post in rows if user_post.id is not None],
+            limit=page_params.limit,
+        )
+
+    @classmethod
+    async def stream_user_post_list(
+        cls,
+        user_id: UUID,
+        session: AsyncSession,
+        order: PostOrder = PostOrder.NEWEST,
+    ) -> AsyncScalarResult:
+        await get_object_by_id(Table=User, id=user_id, session=session)
+        return await stream_scalars(
+            select(user_post_columns)
+            .where((UserPost.user_id == user_id) & cls._is_listed(order))
+            .order_by(*user_post_keysets[order].order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_user_post_by_id(
@@ -48,17 +174,15 @@ class UserPostService:
         post_id: UUID,
         session: AsyncSession,
     ) -> UserPost:
-        user = await get_object_by_id(Table=User, id=user_id, session=session)
-        user_post = (
-            await session.exec(
-                select(UserPost).where(
-                    (UserPost.user_id == user_id) & (UserPost.id == post_id)
-                )
+        rows = await cls._find_user_post_rows(
+            select(User.id, UserPost)
+            .outerjoin(
+                UserPost, (UserPost.user_id == User.id) & (UserPost.id == post_id)
             )
-        ).first()
-        if user_post is None:
-            raise DoesNotExistException("User post with given id does not exist.")
-        return user_post
+            .where(User.id == user_id),
+            session=session,
+        )
+        return rows[0][1]
 
     @classmethod
     async def create_user_post(
@@ -75,10 +199,7 @@ class UserPostService:
         user_post_data = schema.dict()
         user_post = UserPost(**user_post_data, user_id=user_id)
 
-        session.add(user_post)
-
-        await session.commit()
-        await session.refresh(user_post)
+        user_post = await create_object(user_post, session=session)
         return user_post
 
     @classmethod
@@ -96,10 +217,9 @@ class UserPostService:
         if request_user.id != user_post.user_id:
             raise PermissionDeniedException("User unauthorized.")
         update_data = schema.dict()
-        await session.exec(
-            update(UserPost).where(UserPost.id == post_id).values(**update_data)
+        user_post = await update_object_by_id(
+            Table=UserPost, id=post_id, values=update_data, session=session
         )
-        await session.refresh(user_post)
         return user_post
 
     @classmethod
@@ -116,7 +236,7 @@ class UserPostService:
         if request_user.id != user_post.user_id:
             raise PermissionDeniedException("User unauthorized.")
         await session.delete(user_post)
-        await session.commit()
+        await session.flush()
         return
 
     # --- --- Comments --- ---
@@ -126,16 +246,42 @@ class UserPostService:
         cls,
         user_id: UUID,
         post_id: UUID,
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[UserPostComment]:
-        await cls.filter_get_user_post_by_id(
-            user_id=user_id, post_id=post_id, session=session
-        )
-        return (
-            await session.exec(
-                select(UserPostComment).where(UserPostComment.post_id == post_id)
+    ) -> Page[OutputRow]:
+        rows = await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id)
+            .add_columns(user_post_comment_columns)
+            .outerjoin(
+                UserPostComment,
+                (UserPostComment.post_id == UserPost.id)
+                & user_post_comment_keyset.after(page_params.cursor),
             )
-        ).all()
+            .order_by(*user_post_comment_keyset.order_by())
+            .limit(page_params.limit + 1),
+            session=session,
+        )
+        return user_post_comment_keyset.page(
+            [comment for *_, comment in rows if comment.id is not None],
+            limit=page_params.limit,
+        )
+
+    @classmethod
+    async def stream_user_post_comment_list(
+        cls,
+        user_id: UUID,
+        post_id: UUID,
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id), session=session
+        )
+        return await stream_scalars(
+            select(user_post_comment_columns)
+            .where(UserPostComment.post_id == post_id)
+            .order_by(*user_post_comment_keyset.order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_user_post_comment_by_id(
@@ -145,14 +291,17 @@ class UserPostService:
         comment_id: UUID,
         session: AsyncSession,
     ) -> UserPostComment:
-        await cls.filter_get_user_post_by_id(
-            user_id=user_id, post_id=post_id, session=session
+        rows = await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id)
+            .add_columns(UserPostComment)
+            .outerjoin(
+                UserPostComment,
+                (UserPostComment.post_id == UserPost.id)
+                & (UserPostComment.id == comment_id),
+            ),
+            session=session,
         )
-        user_post_comment = (
-            await session.exec(
-                select(UserPostComment).where(UserPostComment.id == comment_id)
-            )
-        ).first()
+        *_, user_post_comment = rows[0]
         if user_post_comment is None:
             raise DoesNotExistException("Comment with given id does not exist")
         return user_post_comment
@@ -174,9 +323,7 @@ class UserPostService:
         user_post_comment = UserPostComment(
             **user_post_comment_data, user_id=request_user.id, post_id=post_id
         )
-        session.add(user_post_comment)
-        await session.commit()
-        await session.refresh(user_post_comment)
+        user_post_comment = await create_object(user_post_comment, session=session)
         return user_post_comment
 
     @classmethod
@@ -196,12 +343,12 @@ class UserPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         user_post_comment_update_data = schema.dict()
-        await session.exec(
-            update(UserPostComment)
-            .where(UserPostComment.id == comment_id)
-            .values(**user_post_comment_update_data)
+        user_post_comment = await update_object_by_id(
+            Table=UserPostComment,
+            id=comment_id,
+            values=user_post_comment_update_data,
+            session=session,
         )
-        await session.refresh(user_post_comment)
         return user_post_comment
 
     @classmethod
@@ -219,7 +366,7 @@ class UserPostService:
         if request_user.id != user_post_comment.user_id:
             raise PermissionDeniedException("User unauthorized.")
         await session.delete(user_post_comment)
-        await session.commit()
+        await session.flush()
         return
 
     # --- --- Reactions --- ---
@@ -229,16 +376,42 @@ class UserPostService:
         cls,
         user_id: UUID,
         post_id: UUID,
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[UserPostReaction]:
-        await cls.filter_get_user_post_by_id(
-            user_id=user_id, post_id=post_id, session=session
-        )
-        return (
-            await session.exec(
-                select(UserPostReaction).where(UserPostReaction.post_id == post_id)
+    ) -> Page[OutputRow]:
+        rows = await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id)
+            .add_columns(user_post_reaction_columns)
+            .outerjoin(
+                UserPostReaction,
+                (UserPostReaction.post_id == UserPost.id)
+                & user_post_reaction_keyset.after(page_params.cursor),
             )
-        ).all()
+            .order_by(*user_post_reaction_keyset.order_by())
+            .limit(page_params.limit + 1),
+            session=session,
+        )
+        return user_post_reaction_keyset.page(
+            [reaction for *_, reaction in rows if reaction.id is not None],
+            limit=page_params.limit,
+        )
+
+    @classmethod
+    async def stream_user_post_reaction_list(
+        cls,
+        user_id: UUID,
+        post_id: UUID,
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id), session=session
+        )
+        return await stream_scalars(
+            select(user_post_reaction_columns)
+            .where(UserPostReaction.post_id == post_id)
+            .order_by(*user_post_reaction_keyset.order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_user_post_reaction_by_id(
@@ -248,14 +421,17 @@ class UserPostService:
         reaction_id: UUID,
         session: AsyncSession,
     ) -> UserPostReaction:
-        await cls.filter_get_user_post_by_id(
-            user_id=user_id, post_id=post_id, session=session
+        rows = await cls._find_user_post_rows(
+            cls._select_user_post(user_id=user_id, post_id=post_id)
+            .add_columns(UserPostReaction)
+            .outerjoin(
+                UserPostReaction,
+                (UserPostReaction.post_id == UserPost.id)
+                & (UserPostReaction.id == reaction_id),
+            ),
+            session=session,
         )
-        user_post_reaction = (
-            await session.exec(
-                select(UserPostReaction).where(UserPostReaction.id == reaction_id)
-            )
-        ).first()
+        *_, user_post_reaction = rows[0]
         if user_post_reaction is None:
             raise DoesNotExistException("Comment with given id does not exist")
         return user_post_reaction
@@ -277,9 +453,43 @@ class UserPostService:
         user_post_reaction = UserPostReaction(
             **user_post_reaction_data, user_id=request_user.id, post_id=post_id
         )
-        session.add(user_post_reaction)
-        await session.commit()
-        await session.refresh(user_post_reaction)
+        user_post_reaction = await create_object_or_none(
+            user_post_reaction,
+            session=session,
+            unique_index=user_post_reaction_per_user,
+        )
+        if user_post_reaction is None:
+            raise AlreadyExistsException("You already reacted to this post.")
+        return user_post_reaction
+
+    @classmethod
+    async def set_user_post_reaction(
+        cls,
+        schema: ReactionInputSchema,
+        user_id: UUID,
+        post_id: UUID,
+        request_user: User,
+        session: AsyncSession,
+    ) -> UserPostReaction:
+        """
+        Creates or replaces the reaction of the request user in a single
+        statement, which writes nothing unless the post belongs to `user_id`.
+        """
+        user_post_reaction = await upsert_object(
+            UserPostReaction(**schema.dict(), user_id=request_user.id, post_id=post_id),
+            unique_index=user_post_reaction_per_user,
+            update=["reaction"],
+            session=session,
+            where=exists().where(
+                (UserPost.id == post_id) & (UserPost.user_id == user_id)
+            ),
+        )
+        if user_post_reaction is None:
+            # Raises the error that tells which object does not exist.
+            await cls.filter_get_user_post_by_id(
+                user_id=user_id, post_id=post_id, session=session
+            )
+            raise DoesNotExistException("User post with given id does not exist.")
         return user_post_reaction
 
     @classmethod
@@ -299,12 +509,12 @@ class UserPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         user_post_comment_update_data = schema.dict()
-        await session.exec(
-            update(UserPostReaction)
-            .where(UserPostReaction.id == reaction_id)
-            .values(**user_post_comment_update_data)
+        user_post_reaction = await update_object_by_id(
+            Table=UserPostReaction,
+            id=reaction_id,
+            values=user_post_comment_update_data,
+            session=session,
         )
-        await session.refresh(user_post_reaction)
         return user_post_reaction
 
     @classmethod
@@ -322,7 +532,7 @@ class UserPostService:
         if request_user.id != user_post_reaction.user_id:
             raise PermissionDeniedException("User unauthorized.")
         await session.delete(user_post_reaction)
-        await session.commit()
+        await session.flush()
         return
 
 
@@ -330,6 +540,15 @@ class GroupPostService:
 
     # --- --- Utils --- ---
 
+    @classmethod
+    def _is_listed(cls, order: PostOrder) -> ColumnElement:
+        """
+        The activity order lists the posts that have comments only.
+        """
+        if order == PostOrder.ACTIVITY:
+            return GroupPost.last_commented_at.isnot(None)
+        return true()
+
     @classmethod
     async def _validate_user_access_on_get(
         cls,
@@ -450,18 +669,67 @@ class GroupPostService:
 
     @classmethod
     async def filter_get_group_post_list(
+        cls,
+        group_id: UUID,
+        request_user: Union[User, None],
+        page_params: PageParams,
+        session: AsyncSession,
+        order: PostOrder = PostOrder.NEWEST,
+    ) -> Page[OutputRow]:
+        """
+        Checks access to the group and fetches the page in one statement: the
+        group is left joined to the request user's membership and to its posts.
+        """
+        is_request_user_membership = (
+            (GroupMembership.group_id == Group.id)
+            & (GroupMembership.user_id == request_user.id)
+            if request_user
+            else false()
+        )
+        keyset = group_post_keysets[order]
+        rows = (
+            await session.exec(
+                select(Group.status, GroupMembership.id, group_post_columns)
+                .select_from(Group)
+                .outerjoin(GroupMembership, is_request_user_membership)
+                .outerjoin(
+                    GroupPost,
+                    (GroupPost.group_id == Group.id)
+                    & cls._is_listed(order)
+                    & keyset.after(page_params.cursor),
+                )
+                .where(Group.id == group_id)
+                .order_by(*keyset.order_by())
+                .limit(page_params.limit + 1)
+            )
+        ).all()
+        if not rows:
+            raise DoesNotExistException("Object with given id does not exist")
+        group_status, membership_id, _ = rows[0]
+        if membership_id is None and group_status != GroupStatus.PUBLIC:
+            raise PermissionDeniedException("User unauthorized.")
+        return keyset.page(
+            [group_post for *_, group_post in rows if group_post.id is not None],
+            limit=page_params.limit,
+        )
+
+    @classmethod
+    async def stream_group_post_list(
         cls,
         group_id: UUID,
         request_user: Union[User, None],
         session: AsyncSession,
-    ) -> list[GroupPost]:
+        order: PostOrder = PostOrder.NEWEST,
+    ) -> AsyncScalarResult:
         await cls._validate_user_access_on_get(
             group_id=group_id, request_user=request_user, session=session
         )
-
-        return (
-            await session.exec(select(GroupPost).where(GroupPost.group_id == group_id))
-        ).all()
+        return await stream_scalars(
+            select(group_post_columns)
+            .where((GroupPost.group_id == group_id) & cls._is_listed(order))
+            .order_by(*group_post_keysets[order].order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_group_post_by_id(
@@ -496,9 +764,7 @@ class GroupPostService:
         group_post = GroupPost(
             **group_post_data, user_id=request_user.id, group_id=group_id
         )
-        session.add(group_post)
-        await session.commit()
-        await session.refresh(group_post)
+        group_post = await create_object(group_post, session=session)
         return group_post
 
     @classmethod
@@ -522,12 +788,9 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         group_post_update_data = schema.dict()
-        await session.exec(
-            update(GroupPost)
-            .where(GroupPost.id == post_id)
-            .values(**group_post_update_data)
+        group_post = await update_object_by_id(
+            Table=GroupPost, id=post_id, values=group_post_update_data, session=session
         )
-        await session.refresh(group_post)
         return group_post
 
     @classmethod
@@ -550,7 +813,7 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         await session.delete(group_post)
-        await session.commit()
+        await session.flush()
         return
 
     # --- --- Comments --- ---
@@ -561,19 +824,48 @@ class GroupPostService:
         group_id: UUID,
         post_id: UUID,
         request_user: Union[User, None],
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[GroupPostComment]:
+    ) -> Page[OutputRow]:
         group_post = await cls.filter_get_group_post_by_id(
             group_id=group_id,
             post_id=post_id,
             request_user=request_user,
             session=session,
         )
-        return (
+        items = (
             await session.exec(
-                select(GroupPostComment).where(GroupPostComment.post_id == post_id)
+                select(group_post_comment_columns)
+                .where(
+                    (GroupPostComment.post_id == post_id)
+                    & group_post_comment_keyset.after(page_params.cursor)
+                )
+                .order_by(*group_post_comment_keyset.order_by())
+                .limit(page_params.limit + 1)
             )
         ).all()
+        return group_post_comment_keyset.page(items, limit=page_params.limit)
+
+    @classmethod
+    async def stream_group_post_comment_list(
+        cls,
+        group_id: UUID,
+        post_id: UUID,
+        request_user: Union[User, None],
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        await cls.filter_get_group_post_by_id(
+            group_id=group_id,
+            post_id=post_id,
+            request_user=request_user,
+            session=session,
+        )
+        return await stream_scalars(
+            select(group_post_comment_columns)
+            .where(GroupPostComment.post_id == post_id)
+            .order_by(*group_post_comment_keyset.order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_group_post_comment_by_id(
@@ -614,9 +906,7 @@ class GroupPostService:
         group_post_comment = GroupPostComment(
             **group_post_comment_data, user_id=request_user.id, post_id=post_id
         )
-        session.add(group_post_comment)
-        await session.commit()
-        await session.refresh(group_post_comment)
+        group_post_comment = await create_object(group_post_comment, session=session)
         return group_post_comment
 
     @classmethod
@@ -639,12 +929,12 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         group_post_comment_update_data = schema.dict()
-        await session.exec(
-            update(GroupPostComment)
-            .where(GroupPostComment.id == comment_id)
-            .values(**group_post_comment_update_data)
+        group_post_comment = await update_object_by_id(
+            Table=GroupPostComment,
+            id=comment_id,
+            values=group_post_comment_update_data,
+            session=session,
         )
-        await session.refresh(group_post_comment)
         return group_post_comment
 
     @classmethod
@@ -666,7 +956,7 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         await session.delete(group_post_comment)
-        await session.commit()
+        await session.flush()
         return
 
     # --- --- Reactions --- ---
@@ -677,19 +967,48 @@ class GroupPostService:
         group_id: UUID,
         post_id: UUID,
         request_user: Union[User, None],
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[GroupPostReaction]:
+    ) -> Page[OutputRow]:
         group_post = await cls.filter_get_group_post_by_id(
             group_id=group_id,
             post_id=post_id,
             request_user=request_user,
             session=session,
         )
-        return (
+        items = (
             await session.exec(
-                select(GroupPostReaction).where(GroupPostReaction.post_id == post_id)
+                select(group_post_reaction_columns)
+                .where(
+                    (GroupPostReaction.post_id == post_id)
+                    & group_post_reaction_keyset.after(page_params.cursor)
+                )
+                .order_by(*group_post_reaction_keyset.order_by())
+                .limit(page_params.limit + 1)
             )
         ).all()
+        return group_post_reaction_keyset.page(items, limit=page_params.limit)
+
+    @classmethod
+    async def stream_group_post_reaction_list(
+        cls,
+        group_id: UUID,
+        post_id: UUID,
+        request_user: Union[User, None],
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        await cls.filter_get_group_post_by_id(
+            group_id=group_id,
+            post_id=post_id,
+            request_user=request_user,
+            session=session,
+        )
+        return await stream_scalars(
+            select(group_post_reaction_columns)
+            .where(GroupPostReaction.post_id == post_id)
+            .order_by(*group_post_reaction_keyset.order_by()),
+            session=session,
+        )
 
     @classmethod
     async def filter_get_group_post_reaction_by_id(
@@ -730,9 +1049,53 @@ class GroupPostService:
         group_post_reaction = GroupPostReaction(
             **group_post_reaction_data, user_id=request_user.id, post_id=post_id
         )
-        session.add(group_post_reaction)
-        await session.commit()
-        await session.refresh(group_post_reaction)
+        group_post_reaction = await create_object_or_none(
+            group_post_reaction,
+            session=session,
+            unique_index=group_post_reaction_per_user,
+        )
+        if group_post_reaction is None:
+            raise AlreadyExistsException("You already reacted to this post.")
+        return group_post_reaction
+
+    @classmethod
+    async def set_group_post_reaction(
+        cls,
+        schema: ReactionInputSchema,
+        group_id: UUID,
+        post_id: UUID,
+        request_user: User,
+        session: AsyncSession,
+    ) -> GroupPostReaction:
+        """
+        Creates or replaces the reaction of the request user in a single
+        statement, which writes nothing unless the post is in the group and
+        the user is one of its members.
+        """
+        group_post_reaction = await upsert_object(
+            GroupPostReaction(
+                **schema.dict(), user_id=request_user.id, post_id=post_id
+            ),
+            unique_index=group_post_reaction_per_user,
+            update=["reaction"],
+            session=session,
+            where=exists().where(
+                (GroupPost.id == post_id) & (GroupPost.group_id == group_id)
+            )
+            & exists().where(
+                (GroupMembership.group_id == group_id)
+                & (GroupMembership.user_id == request_user.id)
+            ),
+        )
+        if group_post_reaction is None:
+            # Raises the error that tells why nothing was written.
+            await cls._validate_user_access_on_post_put_delete(
+                group_id=group_id, request_user=request_user, session=session
+            )
+            await cls._find_group_post(
+                group_id=group_id, post_id=post_id, session=session
+            )
+            raise DoesNotExistException("Group post with given id does not exist.")
         return group_post_reaction
 
     @classmethod
@@ -755,12 +1118,12 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         group_post_reaction_update_data = schema.dict()
-        await session.exec(
-            update(GroupPostReaction)
-            .where(GroupPostReaction.id == reaction_id)
-            .values(**group_post_reaction_update_data)
+        group_post_reaction = await update_object_by_id(
+            Table=GroupPostReaction,
+            id=reaction_id,
+            values=group_post_reaction_update_data,
+            session=session,
         )
-        await session.refresh(group_post_reaction)
         return group_post_reaction
 
     @classmethod
@@ -782,5 +1145,169 @@ class GroupPostService:
             raise PermissionDeniedException("User unauthorized.")
 
         await session.delete(group_post_reaction)
-        await session.commit()
+        await session.flush()
         return
+
+
+class ReactionCounterService:
+    """
+    Maintenance of the reaction counts that the database keeps on posts, see
+    `src.apps.posts.counters`. Run by `src.apps.posts.jobs`.
+    """
+
+    # Counts are not edits: `updated_at` is set to itself so that its
+    # `onupdate` default does not fire. The job's session holds no posts, so
+    # bulk statements skip synchronizing it.
+
+    @classmethod
+    async def shard_popular_posts(
+        cls,
+        Post: type[UserPost] | type[GroupPost],
+        session: AsyncSession,
+    ) -> int:
+        """
+        Gives posts that reached `REACTION_COUNTER_SHARD_THRESHOLD` reactions
+        `REACTION_COUNTER_SHARDS` counter shards. With sharding turned off
+        every post goes back to counting on its own row.
+        """
+        shards = settings.REACTION_COUNTER_SHARDS
+        popular = (
+            Post.like_count + Post.dislike_count
+            >= settings.REACTION_COUNTER_SHARD_THRESHOLD
+            if shards
+            else true()
+        )
+        result = await session.execute(
+            update(Post)
+            .where((Post.reaction_counter_shards != shards) & popular)
+            .values(reaction_counter_shards=shards, updated_at=Post.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @classmethod
+    async def fold_counter_shards(
+        cls,
+        Post: type[UserPost] | type[GroupPost],
+        Counter: type[UserPostReactionCounter] | type[GroupPostReactionCounter],
+        session: AsyncSession,
+    ) -> int:
+        """
+        Moves the counts of every shard into its post in a single statement.
+        Shards written to meanwhile wait for it and are created anew.
+        """
+        moved = (
+            delete(Counter)
+            .returning(Counter.post_id, Counter.like_count, Counter.dislike_count)
+            .cte("moved")
+        )
+        shard_counts = (
+            select(
+                moved.c.post_id,
+                func.sum(moved.c.like_count).label("like_count"),
+                func.sum(moved.c.dislike_count).label("dislike_count"),
+            )
+            .group_by(moved.c.post_id)
+            .subquery()
+        )
+        result = await session.execute(
+            update(Post)
+            .add_cte(moved)
+            .where(Post.id == shard_counts.c.post_id)
+            .values(
+                like_count=Post.like_count + shard_counts.c.like_count,
+                dislike_count=Post.dislike_count + shard_counts.c.dislike_count,
+                updated_at=Post.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @classmethod
+    async def repair_drifted_counts(
+        cls,
+        Post: type[UserPost] | type[GroupPost],
+        Reaction: type[UserPostReaction] | type[GroupPostReaction],
+        Counter: type[UserPostReactionCounter] | type[GroupPostReactionCounter],
+        limit: int,
+        session: AsyncSession,
+    ) -> int:
+        """
+        Recounts the reactions of up to `limit` posts whose counts, shards
+        included, drifted from them. The posts are locked first, which waits
+        for and then holds off every transaction changing their reactions.
+        """
+        reaction_counts = (
+            select(
+                Reaction.post_id,
+                func.count()
+                .filter(Reaction.reaction == ReactionEnum.LIKE)
+                .label("like_count"),
+                func.count()
+                .filter(Reaction.reaction == ReactionEnum.DISLIKE)
+                .label("dislike_count"),
+            )
+            .group_by(Reaction.post_id)
+            .subquery()
+        )
+        shard_counts = (
+            select(
+                Counter.post_id,
+                func.sum(Counter.like_count).label("like_count"),
+                func.sum(Counter.dislike_count).label("dislike_count"),
+            )
+            .group_by(Counter.post_id)
+            .subquery()
+        )
+        drifted = (
+            await session.exec(
+                select(Post.id)
+                .outerjoin(reaction_counts, reaction_counts.c.post_id == Post.id)
+                .outerjoin(shard_counts, shard_counts.c.post_id == Post.id)
+                .where(
+                    (
+                        Post.like_count + func.coalesce(shard_counts.c.like_count, 0)
+                        != func.coalesce(reaction_counts.c.like_count, 0)
+                    )
+                    | (
+                        Post.dislike_count
+                        + func.coalesce(shard_counts.c.dislike_count, 0)
+                        != func.coalesce(reaction_counts.c.dislike_count, 0)
+                    )
+                )
+                .limit(limit)
+            )
+        ).all()
+        if not drifted:
+            return 0
+
+        await session.exec(
+            select(Post.id)
+            .where(Post.id.in_(drifted))
+            .order_by(Post.id)
+            .with_for_update()
+        )
+
+        def count(reaction: ReactionEnum):
+            return (
+                select(func.count())
+                .where((Reaction.post_id == Post.id) & (Reaction.reaction == reaction))
+                .scalar_subquery()
+            )
+
+        await session.execute(
+            update(Post)
+            .where(Post.id.in_(drifted))
+            .values(
+                like_count=count(ReactionEnum.LIKE),
+                dislike_count=count(ReactionEnum.DISLIKE),
+                updated_at=Post.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(
+            delete(Counter)
+            .where(Counter.post_id.in_(drifted))
+            .execution_options(synchronize_session=False)
+        )
+        return len(drifted)
@@ -0,0 +1,56 @@
+from typing import Union
+from uuid import UUID
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.users.models import User
+from src.core.cache import LRUCache
+from src.settings import settings
+
+
+user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+def cache_user(user: User) -> None:
+    """
+    Stores a detached copy of the user, so the cached object is never bound
+    to (or mutated through) the session of the request that loaded it.
+    """
+    snapshot = User(
+        **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+    make_transient_to_detached(snapshot)
+    user_cache.set(user.id, snapshot)
+
+
+async def get_cached_user(user_id: UUID, session: AsyncSession) -> Union[User, None]:
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return await session.merge(snapshot, load=False)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    user_cache.delete(user_id)
+
+
+def invalidate_user_on_commit(user_id: UUID, session: AsyncSession) -> None:
+    """
+    For changes made with bulk statements, which skip the mapper events below.
+    The user is evicted again once the request's transaction commits, so a
+    copy loaded in the meantime is not kept.
+    """
+    invalidate_user(user_id)
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        lambda session: invalidate_user(user_id),
+        once=True,
+    )
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_changed_user(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
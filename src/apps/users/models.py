@@ -1,7 +1,8 @@
 import datetime as dt
 from uuid import UUID
 from typing import Any, TYPE_CHECKING, Optional
-from sqlmodel import Relationship, Field, Column, String, Enum
+from sqlmodel import Relationship, Field, Column, String, Enum, Index
+from sqlalchemy import func, literal_column
 from sqlalchemy.orm import relationship
 from src.apps.users.enums import FriendRequestStatus
 from src.core.models import TimeStampedUUIDModelBase
@@ -19,6 +20,15 @@ class UserBase(TimeStampedUUIDModelBase):
 
 
 class User(UserBase, table=True):
+    __table_args__ = (
+        # Serves `username LIKE 'prefix%'` regardless of the database collation.
+        Index(
+            "ix_user_username_pattern",
+            "username",
+            postgresql_ops={"username": "text_pattern_ops"},
+        ),
+    )
+
     hashed_password: str
     is_active: bool = False
 
@@ -65,6 +75,10 @@ class User(UserBase, table=True):
 
 
 class Friend(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index("ix_friend_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     user_id: UUID = Field(foreign_key="user.id")
     friend_user_id: UUID = Field(foreign_key="user.id")
 
@@ -78,6 +92,11 @@ class Friend(TimeStampedUUIDModelBase, table=True):
 
 
 class FriendRequest(TimeStampedUUIDModelBase, table=True):
+    __table_args__ = (
+        Index("ix_friendrequest_from_user_id", "from_user_id"),
+        Index("ix_friendrequest_to_user_id", "to_user_id"),
+    )
+
     from_user_id: UUID = Field(foreign_key="user.id")
     to_user_id: UUID = Field(foreign_key="user.id")
     status: FriendRequestStatus = Field(
@@ -100,3 +119,17 @@ class FriendRequest(TimeStampedUUIDModelBase, table=True):
             primaryjoin="FriendRequest.to_user_id == User.id",
         )
     )
+
+
+# Compared with a literal rather than a parameter: generic plans of prepared
+# statements can only use a partial index whose predicate the query repeats.
+is_pending_friend_request = FriendRequest.status == literal_column("'PENDING'")
+
+# At most one pending request between two users, whichever of them sent it.
+pending_friend_request_pair = Index(
+    "uq_friendrequest_pending_user_pair",
+    func.least(FriendRequest.from_user_id, FriendRequest.to_user_id),
+    func.greatest(FriendRequest.from_user_id, FriendRequest.to_user_id),
+    unique=True,
+    postgresql_where=is_pending_friend_request,
+)
@@ -1,13 +1,15 @@
+from typing import Optional
 from uuid import UUID
-from fastapi import BackgroundTasks, Depends, status
+from fastapi import BackgroundTasks, Depends, Query, status
 from fastapi.routing import APIRouter
 from fastapi_another_jwt_auth import AuthJWT
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.settings import settings
-from src.database.connection import get_db
-from src.dependencies.users import authenticate_user
+from src.database.connection import get_db, get_read_db
+from src.database.routing import DatabaseRoute
+from src.dependencies.users import authenticate_user, authenticate_user_claims
 from src.apps.users.models import User
 from src.apps.users.schemas import (
     LoginSchema,
@@ -23,9 +25,12 @@ from src.apps.emails.schemas import EmailToken
 from src.apps.emails.services import EmailService
 
 from src.apps.posts.routers import user_post_router
+from src.core.pagination import CountedPage, PageParams, get_page_params
+from src.core.responses import list_response, page_response
+from src.core.streaming import NDJSON_RESPONSES, NDJSONResponse, accepts_ndjson
 
 
-user_router = APIRouter(prefix="/users")
+user_router = APIRouter(prefix="/users", route_class=DatabaseRoute)
 user_router.include_router(user_post_router)
 
 
@@ -79,18 +84,33 @@ async def login_user(
 @user_router.get(
     "/",
     tags=["users"],
-    dependencies=[Depends(authenticate_user)],
+    dependencies=[Depends(authenticate_user_claims)],
     status_code=status.HTTP_200_OK,
-    response_model=list[UserOutputSchema],
+    response_model=CountedPage[UserOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_users(
+    is_active: Optional[bool] = Query(None),
+    username_prefix: Optional[str] = Query(None, min_length=1),
+    page_params: PageParams = Depends(get_page_params),
     user_service: UserService = Depends(),
-    session: AsyncSession = Depends(get_db),
-) -> list[UserOutputSchema]:
-    return [
-        UserOutputSchema.from_orm(user)
-        for user in (await user_service.get_user_list(session=session))
-    ]
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
+) -> CountedPage[UserOutputSchema]:
+    if stream:
+        return NDJSONResponse(
+            await user_service.stream_user_list(
+                session=session, is_active=is_active, username_prefix=username_prefix
+            ),
+            schema=UserOutputSchema,
+        )
+    page = await user_service.get_user_list(
+        page_params=page_params,
+        session=session,
+        is_active=is_active,
+        username_prefix=username_prefix,
+    )
+    return page_response(page, Schema=UserOutputSchema)
 
 
 @user_router.get(
@@ -100,7 +120,7 @@ async def get_users(
     response_model=UserOutputSchema,
 )
 async def get_logged_user(
-    request_user: User = Depends(authenticate_user),
+    request_user: User = Depends(authenticate_user_claims),
 ) -> UserOutputSchema:
     return UserOutputSchema.from_orm(request_user)
 
@@ -108,14 +128,14 @@ async def get_logged_user(
 @user_router.get(
     "/{user_id}/",
     tags=["users"],
-    dependencies=[Depends(authenticate_user)],
+    dependencies=[Depends(authenticate_user_claims)],
     status_code=status.HTTP_200_OK,
     response_model=UserOutputSchema,
 )
 async def get_user(
     user_id: UUID,
     user_service: UserService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> UserOutputSchema:
     user = await user_service.get_user_by_id(user_id=user_id, session=session)
     return UserOutputSchema.from_orm(user)
@@ -126,20 +146,25 @@ async def get_user(
     tags=["user-friends"],
     status_code=status.HTTP_200_OK,
     response_model=list[FriendOutputSchema],
+    responses=NDJSON_RESPONSES,
 )
 async def get_user(
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    stream: bool = Depends(accepts_ndjson),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[FriendOutputSchema]:
-    return [
-        FriendOutputSchema.from_orm(friend)
-        for friend in (
-            await friend_service.filter_friend_list(
+    if stream:
+        return NDJSONResponse(
+            await friend_service.stream_friend_list(
                 request_user=request_user, session=session
-            )
+            ),
+            schema=FriendOutputSchema,
         )
-    ]
+    rows = await friend_service.filter_friend_list(
+        request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=FriendOutputSchema)
 
 
 @user_router.get(
@@ -152,7 +177,7 @@ async def get_friend_by_id(
     friend_id: UUID,
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> FriendOutputSchema:
     friend = await friend_service.filter_friend_by_id(
         friend_id=friend_id, request_user=request_user, session=session
@@ -222,16 +247,12 @@ async def remove_friend(
 async def get_received_friend_requests(
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[FriendRequestOutputSchema]:
-    return [
-        FriendRequestOutputSchema.from_orm(friend)
-        for friend in (
-            await friend_service.filter_received_friend_requests(
-                request_user=request_user, session=session
-            )
-        )
-    ]
+    rows = await friend_service.filter_received_friend_requests(
+        request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=FriendRequestOutputSchema)
 
 
 @user_router.get(
@@ -243,16 +264,12 @@ async def get_received_friend_requests(
 async def get_sent_friend_requests(
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> list[FriendRequestOutputSchema]:
-    return [
-        FriendRequestOutputSchema.from_orm(friend)
-        for friend in (
-            await friend_service.filter_sent_friend_requests(
-                request_user=request_user, session=session
-            )
-        )
-    ]
+    rows = await friend_service.filter_sent_friend_requests(
+        request_user=request_user, session=session
+    )
+    return list_response(rows, Schema=FriendRequestOutputSchema)
 
 
 @user_router.get(
@@ -265,7 +282,7 @@ async def get_sent_friend_request_by_id(
     friend_request_id: UUID,
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> FriendRequestOutputSchema:
     request = await friend_service.filter_sent_friend_request_by_id(
         friend_request_id=friend_request_id, request_user=request_user, session=session
@@ -300,7 +317,7 @@ async def get_received_friend_request_by_id(
     friend_request_id: UUID,
     request_user: User = Depends(authenticate_user),
     friend_service: FriendService = Depends(),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> FriendRequestOutputSchema:
     request = await friend_service.filter_received_friend_request_by_id(
         friend_request_id=friend_request_id, request_user=request_user, session=session
@@ -1,23 +1,32 @@
 import json
-from typing import Union
+from typing import Optional, Union
 from uuid import UUID
-from sqlmodel import select, update
+from sqlalchemy import exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi_another_jwt_auth import AuthJWT
 from fastapi_another_jwt_auth.exceptions import AuthJWTException
 
 from src.apps.emails.services import EmailService
+from src.apps.users.cache import invalidate_user_on_commit
 from src.apps.users.enums import FriendRequestStatus
 from src.apps.users.models import (
     Friend,
     FriendRequest,
     User,
+    pending_friend_request_pair,
 )
 from src.apps.users.schemas import (
+    FriendOutputSchema,
+    FriendRequestOutputSchema,
     RegisterSchema,
     FriendRequestUpdateSchema,
+    UserOutputSchema,
 )
-from src.apps.users.utils import pwd_context
+from src.apps.users.utils import hash_password, password_executor, verify_password
 from src.core.exceptions import (
     AlreadyExistsException,
     DoesNotExistException,
@@ -27,7 +36,29 @@ from src.core.exceptions import (
     AlreadyActivatedAccountException,
     InvalidConfirmationTokenException,
 )
-from src.core.utils import get_object_by_id
+from src.core.utils import (
+    create_object,
+    create_object_or_none,
+    create_objects,
+    get_object_by_id,
+    OutputColumns,
+    OutputRow,
+    update_object_by_id,
+)
+from src.core.pagination import (
+    MAX_PAGE_SIZE,
+    CountedPage,
+    Keyset,
+    PageParams,
+    estimate_count,
+)
+from src.core.streaming import stream_scalars
+
+
+user_keyset = Keyset(User.username, User.id)
+user_columns = OutputColumns(User, UserOutputSchema)
+friend_columns = OutputColumns(Friend, FriendOutputSchema)
+friend_request_columns = OutputColumns(FriendRequest, FriendRequestOutputSchema)
 
 
 class UserService:
@@ -35,15 +66,16 @@ class UserService:
 
     @classmethod
     async def _hash_password(cls, password: str) -> str:
-        return pwd_context.hash(password)
+        return await password_executor.run(hash_password, password)
+
+    @classmethod
+    async def _verify_password(cls, password: str, hashed_password: str) -> bool:
+        return await password_executor.run(verify_password, password, hashed_password)
 
     @classmethod
     async def register_user(cls, schema: RegisterSchema, session: AsyncSession) -> User:
         user_data = schema.dict()
         user_data.pop("password2")
-        user_data["hashed_password"] = await cls._hash_password(
-            password=user_data.pop("password")
-        )
         email_result = await session.exec(
             select(User).where(User.username == user_data["username"])
         )
@@ -54,11 +86,18 @@ class UserService:
         )
         if username_result.first():
             raise AlreadyExistsException("Username already taken!")
+        user_data["hashed_password"] = await cls._hash_password(
+            password=user_data.pop("password")
+        )
         new_user = User(**user_data)
 
-        session.add(new_user)
-        await session.commit()
-        await session.refresh(new_user)
+        try:
+            # A concurrent registration may still win the race for the email or
+            # username; the savepoint keeps the request's transaction usable.
+            async with session.begin_nested():
+                new_user = await create_object(new_user, session=session)
+        except IntegrityError:
+            raise AlreadyExistsException("Email or username already in use!")
         return new_user
 
     @classmethod
@@ -67,7 +106,9 @@ class UserService:
     ) -> User:
         result = await session.exec(select(User).where(User.email == email))
         user: User = result.first()
-        if user is None or not pwd_context.verify(password, user.hashed_password):
+        if user is None or not await cls._verify_password(
+            password=password, hashed_password=user.hashed_password
+        ):
             raise InvalidCredentialsException("No matches with given token")
         return user
 
@@ -90,25 +131,84 @@ class UserService:
             raise DoesNotExistException("Invalid token")
         if user.is_active:
             raise AlreadyActivatedAccountException("User already activated his account")
-        await session.execute(
-            update(User).where(User.email == email).values(is_active=True)
+        await update_object_by_id(
+            Table=User, id=user.id, values={"is_active": True}, session=session
         )
-        await session.commit()
+        invalidate_user_on_commit(user_id=user.id, session=session)
+
+    @classmethod
+    def _user_list_conditions(
+        cls,
+        is_active: Optional[bool],
+        username_prefix: Optional[str],
+    ) -> list[ColumnElement]:
+        conditions = []
+        if is_active is not None:
+            conditions.append(User.is_active == is_active)
+        if username_prefix:
+            conditions.append(
+                User.username.startswith(username_prefix, autoescape=True)
+            )
+        return conditions
 
     @classmethod
     async def get_user_list(
         cls,
+        page_params: PageParams,
         session: AsyncSession,
-    ) -> list[User]:
-        return (await session.exec(select(User))).all()
+        is_active: Optional[bool] = None,
+        username_prefix: Optional[str] = None,
+    ) -> CountedPage[OutputRow]:
+        limit = min(page_params.limit, MAX_PAGE_SIZE)
+        conditions = cls._user_list_conditions(
+            is_active=is_active, username_prefix=username_prefix
+        )
+
+        users = (
+            await session.exec(
+                select(user_columns)
+                .where(*conditions, user_keyset.after(page_params.cursor))
+                .order_by(*user_keyset.order_by())
+                .limit(limit + 1)
+            )
+        ).all()
+        page = user_keyset.page(users, limit=limit)
+        total_estimate = await estimate_count(
+            select(User.id).where(*conditions), session=session
+        )
+        return CountedPage(
+            items=page.items,
+            next_cursor=page.next_cursor,
+            total_estimate=total_estimate,
+        )
+
+    @classmethod
+    async def stream_user_list(
+        cls,
+        session: AsyncSession,
+        is_active: Optional[bool] = None,
+        username_prefix: Optional[str] = None,
+    ) -> AsyncScalarResult:
+        conditions = cls._user_list_conditions(
+            is_active=is_active, username_prefix=username_prefix
+        )
+        return await stream_scalars(
+            select(user_columns).where(*conditions).order_by(*user_keyset.order_by()),
+            session=session,
+        )
 
     @classmethod
     async def get_user_by_id(
         cls,
         user_id: UUID,
         session: AsyncSession,
-    ):
-        return await get_object_by_id(Table=User, id=user_id, session=session)
+    ) -> OutputRow:
+        user = (
+            await session.exec(select(user_columns).where(User.id == user_id))
+        ).first()
+        if user is None:
+            raise DoesNotExistException("Object with given id does not exist")
+        return user
 
 
 class FriendService:
@@ -145,28 +245,6 @@ class FriendService:
         ).first()
         return friend
 
-    @classmethod
-    async def _find_friend_request(
-        cls, user_id: UUID, friend_user_id: UUID, session: AsyncSession
-    ):
-        friend_request = (
-            await session.exec(
-                select(FriendRequest).where(
-                    (
-                        (FriendRequest.from_user_id == user_id)
-                        & (FriendRequest.to_user_id == friend_user_id)
-                        & (FriendRequest.status == "PENDING")
-                    )
-                    | (
-                        (FriendRequest.from_user_id == friend_user_id)
-                        & (FriendRequest.to_user_id == user_id)
-                        & (FriendRequest.status == "PENDING")
-                    )
-                )
-            )
-        ).first()
-        return friend_request
-
     @classmethod
     async def create_friend(
         cls,
@@ -174,12 +252,13 @@ class FriendService:
         friend_id: UUID,
         session: AsyncSession,
     ) -> Friend:
-        friend1 = Friend(user_id=user_id, friend_user_id=friend_id)
-        friend2 = Friend(user_id=friend_id, friend_user_id=user_id)
-        session.add(friend1)
-        session.add(friend2)
-        await session.commit()
-        await session.refresh(friend1)
+        friend1, friend2 = await create_objects(
+            [
+                Friend(user_id=user_id, friend_user_id=friend_id),
+                Friend(user_id=friend_id, friend_user_id=user_id),
+            ],
+            session=session,
+        )
         return friend1
 
     @classmethod
@@ -190,7 +269,7 @@ class FriendService:
         session: AsyncSession,
     ):
         friend = await get_object_by_id(Table=Friend, id=friend_id, session=session)
-        if friend.user != request_user:
+        if friend.user_id != request_user.id:
             raise PermissionDeniedException("Not authorized.")
 
         friends = await cls._find_friends(
@@ -200,7 +279,7 @@ class FriendService:
         )
         for friend in friends:
             await session.delete(friend)
-        await session.commit()
+        await session.flush()
         return
 
     @classmethod
@@ -208,12 +287,27 @@ class FriendService:
         cls,
         request_user: User,
         session: AsyncSession,
-    ) -> list[Friend]:
+    ) -> list[OutputRow]:
         friends = (
-            await session.exec(select(Friend).where(Friend.user_id == request_user.id))
+            await session.exec(
+                select(friend_columns).where(Friend.user_id == request_user.id)
+            )
         ).all()
         return friends
 
+    @classmethod
+    async def stream_friend_list(
+        cls,
+        request_user: User,
+        session: AsyncSession,
+    ) -> AsyncScalarResult:
+        return await stream_scalars(
+            select(friend_columns)
+            .where(Friend.user_id == request_user.id)
+            .order_by(Friend.created_at, Friend.id),
+            session=session,
+        )
+
     @classmethod
     async def filter_friend_by_id(
         cls,
@@ -235,28 +329,31 @@ class FriendService:
         request_user: User,
         session: AsyncSession,
     ):
-        friends = await cls._find_friends(
-            user_id=request_user.id, friend_user_id=user_id, session=session
-        )
-        if friends != []:
-            raise AlreadyExistsException("You are already friends with this person.")
-
-        request = await cls._find_friend_request(
-            user_id=request_user.id, friend_user_id=user_id, session=session
+        """
+        A single INSERT that skips users who are already friends and, through
+        the unique pending pair index, users with a pending request between
+        them in either direction. The reason is only looked up on failure.
+        """
+        request = await create_object_or_none(
+            FriendRequest(
+                from_user_id=request_user.id,
+                to_user_id=user_id,
+                status=FriendRequestStatus.PENDING,
+            ),
+            session=session,
+            unless=exists().where(
+                (Friend.user_id == request_user.id) & (Friend.friend_user_id == user_id)
+            ),
+            unique_index=pending_friend_request_pair,
         )
         if request is not None:
-            raise AlreadyExistsException("Unhandled friend request exists.")
+            return request
 
-        request = FriendRequest(
-            from_user_id=request_user.id,
-            to_user_id=user_id,
-            status=FriendRequestStatus.PENDING,
-        )
-
-        session.add(request)
-        await session.commit()
-        await session.refresh(request)
-        return request
+        if await cls._find_friends(
+            user_id=request_user.id, friend_user_id=user_id, session=session
+        ):
+            raise AlreadyExistsException("You are already friends with this person.")
+        raise AlreadyExistsException("Unhandled friend request exists.")
 
     @classmethod
     async def update_friend_request(
@@ -274,12 +371,12 @@ class FriendService:
         if received_request.status != FriendRequestStatus.PENDING:
             raise FriendRequestAlreadyHandled("Friend request was already handled.")
         update_data = schema.dict()
-        await session.exec(
-            update(FriendRequest)
-            .where(FriendRequest.id == received_request.id)
-            .values(**update_data)
+        received_request = await update_object_by_id(
+            Table=FriendRequest,
+            id=received_request.id,
+            values=update_data,
+            session=session,
         )
-        await session.refresh(received_request)
         if received_request.status == FriendRequestStatus.ACCEPTED:
             await cls.create_friend(
                 user_id=request_user.id,
@@ -301,7 +398,7 @@ class FriendService:
             session=session,
         )
         await session.delete(sent_request)
-        await session.commit()
+        await session.flush()
         return
 
     @classmethod
@@ -309,10 +406,12 @@ class FriendService:
         cls,
         request_user: User,
         session: AsyncSession,
-    ) -> list[FriendRequest]:
+    ) -> list[OutputRow]:
         received_requests = (
             await session.exec(
-                select(FriendRequest).where(FriendRequest.to_user_id == request_user.id)
+                select(friend_request_columns).where(
+                    FriendRequest.to_user_id == request_user.id
+                )
             )
         ).all()
         return received_requests
@@ -341,10 +440,10 @@ class FriendService:
         cls,
         request_user: User,
         session: AsyncSession,
-    ) -> list[FriendRequest]:
+    ) -> list[OutputRow]:
         sent_requests = (
             await session.exec(
-                select(FriendRequest).where(
+                select(friend_request_columns).where(
                     FriendRequest.from_user_id == request_user.id
                 )
             )
@@ -1,3 +1,20 @@
 from passlib.context import CryptContext
 
+from src.core.executors import BoundedExecutor
+from src.settings import settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+password_executor = BoundedExecutor(
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue_size=settings.PASSWORD_HASHER_QUEUE_SIZE,
+    use_processes=settings.PASSWORD_HASHER_USE_PROCESSES,
+)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
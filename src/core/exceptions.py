@@ -44,3 +44,11 @@ class InvalidConfirmationTokenException(AuthException):
 
 class UserNotActiveException(AuthException):
     pass
+
+
+class ServiceUnavailableException(APIException):
+    pass
+
+
+class InvalidCursorException(APIException):
+    pass
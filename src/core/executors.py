@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Union
+
+from src.core.exceptions import ServiceUnavailableException
+
+
+class BoundedExecutor:
+    """
+    Runs blocking callables outside of the event loop.
+
+    At most `max_workers` calls run at once and at most `max_queue_size` more
+    wait for a free worker; anything above that is rejected straight away
+    instead of piling up behind a saturated pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        use_processes: bool = False,
+    ):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.use_processes = use_processes
+        self._executor: Union[Executor, None] = None
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    def _get_executor(self) -> Executor:
+        # Created lazily, so that process pools are started inside the server
+        # worker and not in the parent process before it forks.
+        if self._executor is None:
+            executor_class = (
+                ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            )
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            raise ServiceUnavailableException("Server is busy, please try again.")
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+        except BaseException:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": self.in_flight,
+            "queued": max(self.in_flight - self.max_workers, 0),
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
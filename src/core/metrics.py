@@ -0,0 +1,27 @@
+import bisect
+from typing import Union
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of observed values. Bucket counts are cumulative,
+    each one counting the observations less than or equal to its bound.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def stats(self) -> dict[str, Union[int, float, dict[str, int]]]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
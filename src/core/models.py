@@ -21,7 +21,6 @@ class UUIDModelBase(SQLModel):
     id: uuid_pkg.UUID = Field(
         default_factory=uuid_pkg.uuid4,
         primary_key=True,
-        index=True,
         nullable=False,
     )
 
@@ -0,0 +1,119 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar, Union
+from uuid import UUID
+from fastapi import Query
+from pydantic.generics import GenericModel
+from sqlalchemy import DateTime, true, tuple_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.sqltypes import GUID
+
+from src.core.exceptions import InvalidCursorException
+from src.database.explain import Explain
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+ItemT = TypeVar("ItemT")
+
+
+class Page(GenericModel, Generic[ItemT]):
+    items: list[ItemT]
+    next_cursor: Optional[str] = None
+
+
+class CountedPage(Page[ItemT], Generic[ItemT]):
+    total_estimate: int
+
+
+@dataclass
+class PageParams:
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+
+
+def get_page_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+class Keyset:
+    """
+    Orders a query by unique key columns and continues it after the last row
+    of the previous page. The cursor is an opaque encoding of that row's keys,
+    so pages stay stable while rows are inserted and an index on the key
+    columns serves every page without an OFFSET scan.
+    """
+
+    def __init__(self, *columns: ColumnElement, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def encode(self, item: Any) -> str:
+        values = [getattr(item, column.key) for column in self.columns]
+        data = json.dumps(
+            [
+                value.isoformat() if isinstance(value, datetime) else str(value)
+                for value in values
+            ]
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode(self, cursor: str) -> list[Union[str, datetime, UUID]]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self.columns):
+                raise ValueError
+            return [
+                self._load(column, value) for column, value in zip(self.columns, values)
+            ]
+        except (binascii.Error, TypeError, ValueError):
+            raise InvalidCursorException("Invalid pagination cursor.")
+
+    def after(self, cursor: Optional[str]) -> ColumnElement:
+        if cursor is None:
+            return true()
+        keys, values = tuple_(*self.columns), tuple_(*self.decode(cursor))
+        return keys < values if self.descending else keys > values
+
+    def order_by(self) -> list[ColumnElement]:
+        if self.descending:
+            return [column.desc() for column in self.columns]
+        return list(self.columns)
+
+    def page(self, items: list[ItemT], limit: int) -> Page[ItemT]:
+        """
+        Builds the page from rows fetched with `limit + 1`; the extra row only
+        tells whether there is a next page.
+        """
+        if len(items) <= limit:
+            return Page(items=items)
+        items = items[:limit]
+        return Page(items=items, next_cursor=self.encode(items[-1]))
+
+    @staticmethod
+    def _load(column: ColumnElement, value: str) -> Union[str, datetime, UUID]:
+        if isinstance(column.type, GUID):
+            return UUID(value)
+        if isinstance(column.type, DateTime):
+            return datetime.fromisoformat(value)
+        return value
+
+
+async def estimate_count(statement: Select, session: AsyncSession) -> int:
+    """
+    Row count the planner expects `statement` to return. Costs one EXPLAIN
+    instead of a COUNT(*) over every matching row, so it is only as accurate
+    as the table statistics.
+    """
+    plan = (await session.execute(Explain(statement))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
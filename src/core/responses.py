@@ -0,0 +1,44 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Type
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from src.core.pagination import Page
+
+RowEncoder = Callable[[Any], dict[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def get_row_encoder(Schema: Type[BaseModel]) -> RowEncoder:
+    """
+    Reads the fields of `Schema` from a row or entity into a dict that orjson
+    serializes as is: UUIDs, datetimes, dates and enums are encoded natively,
+    so the schema never validates the row.
+    """
+    fields = tuple(Schema.__fields__)
+    get_values = attrgetter(*fields)
+
+    def encode(row: Any) -> dict[str, Any]:
+        return dict(zip(fields, get_values(row)))
+
+    return encode
+
+
+def list_response(rows: Iterable[Any], Schema: Type[BaseModel]) -> ORJSONResponse:
+    """
+    Serializes rows once, without building `Schema` instances or validating
+    them against the `response_model`, which still documents the route.
+    """
+    encode = get_row_encoder(Schema)
+    return ORJSONResponse([encode(row) for row in rows])
+
+
+def page_response(page: Page, Schema: Type[BaseModel]) -> ORJSONResponse:
+    encode = get_row_encoder(Schema)
+    return ORJSONResponse(
+        {
+            "items": [encode(row) for row in page.items],
+            **page.dict(exclude={"items"}),
+        }
+    )
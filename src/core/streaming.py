@@ -0,0 +1,51 @@
+from typing import Any, AsyncIterator, Optional, Type
+import orjson
+from fastapi import Header
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from sqlalchemy.sql import Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.responses import StreamingResponse
+
+from src.core.responses import RowEncoder, get_row_encoder
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_RESPONSES = {200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+STREAM_BATCH_SIZE = 500
+
+
+def accepts_ndjson(accept: Optional[str] = Header(None)) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+async def stream_scalars(statement: Select, session: AsyncSession) -> AsyncScalarResult:
+    """
+    Runs the statement on a server-side cursor, which is read in batches of
+    `STREAM_BATCH_SIZE` rows while the result is iterated.
+    """
+    return await session.stream_scalars(
+        statement.execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Sends one JSON line per row as the rows are read, so the memory used does
+    not grow with the size of the result. The session stays open until the
+    body has been sent; `DatabaseRoute` leaves it to the dependency to close.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(self, rows: AsyncScalarResult, schema: Type[BaseModel], **kwargs: Any):
+        super().__init__(self._lines(rows, get_row_encoder(schema)), **kwargs)
+
+    @staticmethod
+    async def _lines(
+        rows: AsyncScalarResult, encode: RowEncoder
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for row in rows:
+                yield orjson.dumps(encode(row)) + b"\n"
+        finally:
+            await rows.close()
@@ -1,8 +1,45 @@
+from collections import namedtuple
+from typing import Any, Optional, Type, TypeVar, Union
 from uuid import UUID
+from pydantic import BaseModel
+from sqlalchemy import Index, inspect, insert, literal, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Bundle
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.core.exceptions import DoesNotExistException, InvalidTableException
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+# Named tuple built by `OutputColumns`.
+OutputRow = tuple
+
+
+class OutputColumns(Bundle):
+    """
+    The columns of `Table` that `Schema` outputs. Selecting them instead of
+    the whole entity skips every other column and the identity map: each row
+    is a named tuple with one attribute per schema field, which
+    `Schema.from_orm` reads as is.
+    """
+
+    def __init__(self, Table: SQLModel, Schema: Type[BaseModel]):
+        self.row_class = namedtuple(f"{Table.__name__}Row", Schema.__fields__)
+        super().__init__(
+            Table.__tablename__,
+            *[getattr(Table, field) for field in Schema.__fields__],
+        )
+
+    def create_row_processor(self, query, procs, labels):
+        row_class = self.row_class
+
+        def proc(row) -> OutputRow:
+            return row_class(*[column_proc(row) for column_proc in procs])
+
+        return proc
+
 
 async def get_object_by_id(Table: SQLModel, id: UUID | int, session: AsyncSession):
     try:
@@ -12,3 +49,127 @@ async def get_object_by_id(Table: SQLModel, id: UUID | int, session: AsyncSessio
         return object
     except TypeError as exc:
         raise InvalidTableException("Invalid table name")
+
+
+async def create_objects(objects: list[ModelT], session: AsyncSession) -> list[ModelT]:
+    """
+    Inserts objects of a single table with one INSERT ... RETURNING statement
+    and returns the persisted rows, attached to the session, in input order.
+    """
+    Table = type(objects[0])
+    columns = [attr.key for attr in inspect(Table).column_attrs]
+    values = [
+        {
+            column: getattr(object, column)
+            for column in columns
+            if getattr(object, column) is not None
+        }
+        for object in objects
+    ]
+    statement = select(Table).from_statement(
+        insert(Table).values(values).returning(*Table.__table__.columns)
+    )
+    return (await session.execute(statement)).scalars().all()
+
+
+async def create_object(object: ModelT, session: AsyncSession) -> ModelT:
+    (object,) = await create_objects([object], session=session)
+    return object
+
+
+def _insert_object_where(object: ModelT, whereclause: Optional[ColumnElement]):
+    """
+    INSERT ... SELECT of the object's values, which inserts nothing unless
+    `whereclause` holds.
+    """
+    Table = type(object)
+    columns = [
+        column
+        for column in Table.__table__.columns
+        if getattr(object, column.key) is not None
+    ]
+    values = select(
+        *[literal(getattr(object, column.key), type_=column.type) for column in columns]
+    )
+    if whereclause is not None:
+        values = values.where(whereclause)
+    return pg_insert(Table).from_select([column.key for column in columns], values)
+
+
+async def create_object_or_none(
+    object: ModelT,
+    session: AsyncSession,
+    unless: Optional[ColumnElement] = None,
+    unique_index: Optional[Index] = None,
+) -> Union[ModelT, None]:
+    """
+    Inserts the object with a single INSERT ... SELECT ... ON CONFLICT DO
+    NOTHING statement. Nothing is inserted, and None returned, when `unless`
+    (an EXISTS clause) holds or when the row conflicts with `unique_index`.
+    """
+    Table = type(object)
+    statement = _insert_object_where(object, ~unless if unless is not None else None)
+    if unique_index is not None:
+        statement = statement.on_conflict_do_nothing(
+            index_elements=unique_index.expressions,
+            index_where=unique_index.dialect_options["postgresql"]["where"],
+        )
+    statement = select(Table).from_statement(
+        statement.returning(*Table.__table__.columns)
+    )
+    return (await session.execute(statement)).scalars().first()
+
+
+async def upsert_object(
+    object: ModelT,
+    unique_index: Index,
+    update: list[str],
+    session: AsyncSession,
+    where: Optional[ColumnElement] = None,
+) -> Union[ModelT, None]:
+    """
+    Inserts the object or, when it conflicts with `unique_index`, updates the
+    `update` columns of the existing row, in one INSERT ... ON CONFLICT DO
+    UPDATE ... RETURNING statement. Nothing is written, and None returned,
+    unless `where` holds.
+    """
+    Table = type(object)
+    statement = _insert_object_where(object, where)
+    # ON CONFLICT DO UPDATE does not apply `onupdate` defaults by itself.
+    update = update + [
+        column.key for column in Table.__table__.columns if column.onupdate is not None
+    ]
+    statement = statement.on_conflict_do_update(
+        index_elements=unique_index.expressions,
+        index_where=unique_index.dialect_options["postgresql"]["where"],
+        set_={column: statement.excluded[column] for column in update},
+    )
+    statement = (
+        select(Table)
+        .from_statement(statement.returning(*Table.__table__.columns))
+        .execution_options(populate_existing=True)
+    )
+    return (await session.execute(statement)).scalars().first()
+
+
+async def update_object_by_id(
+    Table: type[ModelT], id: UUID | int, values: dict[str, Any], session: AsyncSession
+) -> ModelT:
+    """
+    Updates the row with a single UPDATE ... RETURNING statement. The object
+    already loaded in the session, if any, is refreshed with the returned row.
+    """
+    statement = (
+        select(Table)
+        .from_statement(
+            update(Table)
+            .where(Table.id == id)
+            .values(**values)
+            .returning(*Table.__table__.columns)
+        )
+        .execution_options(populate_existing=True)
+    )
+    object = (await session.execute(statement)).scalars().first()
+    if object is None:
+        raise DoesNotExistException("Object with given id does not exist")
+    return object
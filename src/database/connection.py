@@ -1,19 +1,41 @@
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+from sqlalchemy.orm.query import FromStatement
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.database.pool import InstrumentedQueuePool
+from src.database.routing import WRITE_PIN_COOKIE, ReplicaRouter
 from src.settings import settings
 
 
-DB_POOL_SIZE = 83
-WEB_CONCURRENCY = 9
-POOL_SIZE = max(DB_POOL_SIZE // WEB_CONCURRENCY, 5)
+def create_pooled_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
 
-connect_args = {"check_same_thread": False}
 
+engine = create_pooled_engine(settings.postgres_url)
+read_engine = engine.execution_options(postgresql_readonly=True)
 
-engine = create_async_engine(
-    settings.postgres_url, echo=False, future=True, pool_size=POOL_SIZE, max_overflow=64
+replica_engines = [
+    create_pooled_engine(url).execution_options(postgresql_readonly=True)
+    for url in settings.POSTGRES_REPLICA_URLS
+]
+replica_router = ReplicaRouter(
+    primary=read_engine,
+    replicas=replica_engines,
+    window=settings.READ_YOUR_WRITES_WINDOW,
+    secret_key=settings.authjwt_secret_key,
 )
 
 async_session = sessionmaker(
@@ -24,8 +46,76 @@ async_session = sessionmaker(
     expire_on_commit=False,
 )
 
+async_read_session = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    info={"read_only": True},
+)
+
+
+def _mark_write(session: Session) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def mark_flush_write(session: Session, flush_context) -> None:
+    _mark_write(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def mark_statement_write(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Writes executed as statements (bulk updates and deletes, INSERT ...
+    RETURNING) never go through a flush.
+    """
+    statement = orm_execute_state.statement
+    if isinstance(statement, FromStatement):
+        # `select(Table).from_statement(...)` of a write with RETURNING.
+        statement = statement.element
+    if statement.is_dml:
+        _mark_write(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def pin_writer_to_primary(session: Session) -> None:
+    """
+    Leaves the pin of the committed writes in the session's info, where
+    `complete_sessions` picks it up for the client.
+    """
+    if session.info.pop("wrote", False) and replica_router.replicas:
+        session.info["write_pin"] = replica_router.record_write()
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_rolled_back_write(session: Session) -> None:
+    session.info.pop("wrote", None)
+
 
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         yield session
         await session.commit()
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """
+    Session for handlers that only read. Queries run in a READ ONLY
+    transaction which is rolled back instead of committed; `DatabaseRoute`
+    releases its connection as soon as the handler returns.
+
+    With replicas configured the session is bound to one of them, unless the
+    client sends the pin of a recent write.
+    """
+    bind = replica_router.get_read_engine(request.cookies.get(WRITE_PIN_COOKIE))
+    async with async_read_session(bind=bind) as session:
+        yield session
+
+
+def get_pool_stats() -> dict[str, dict]:
+    stats = {"primary": engine.pool.stats()}
+    for index, replica_engine in enumerate(replica_engines):
+        stats[f"replica_{index}"] = replica_engine.pool.stats()
+    return stats
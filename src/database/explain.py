@@ -0,0 +1,29 @@
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` of a statement. Its parameters stay bound, so
+    user input never has to be rendered into the SQL text.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def compile_explain(element: Explain, compiler, **kw) -> str:
+    # Compiled as a nested statement, so its columns do not become the result
+    # columns; the only one returned is the JSON plan.
+    compiler.stack.append(
+        {"correlate_froms": set(), "asfrom_froms": set(), "selectable": element}
+    )
+    try:
+        return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+    finally:
+        compiler.stack.pop()
@@ -0,0 +1,101 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """
+    Statements executed while handling a single request. Statements are
+    compared by their SQL text, which holds placeholders instead of values,
+    so the same query issued for different rows counts as one shape.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if query_stats.get() is not None:
+        context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    if stats is not None and hasattr(context, "_query_start"):
+        stats.record(statement, time.perf_counter() - context._query_start)
+
+
+def report_query_stats(method: str, path: str, stats: QueryStats) -> None:
+    repeated = stats.repeated_shapes(settings.SQL_N_PLUS_ONE_THRESHOLD)
+    for statement, count in repeated:
+        logger.warning(
+            "Possible N+1 in %s %s: statement executed %d times: %s",
+            method,
+            path,
+            count,
+            statement,
+        )
+    if (
+        stats.count >= settings.SQL_LOG_QUERY_COUNT
+        or stats.duration >= settings.SQL_LOG_DB_TIME
+    ):
+        logger.warning(
+            "%s %s executed %d statements in %.1f ms of database time.",
+            method,
+            path,
+            stats.count,
+            stats.duration * 1000,
+        )
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts the statements and database time of each request while
+    `SQL_INSTRUMENTATION` is enabled. When it is disabled the request passes
+    straight through and the engine event hooks return immediately.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.SQL_INSTRUMENTATION:
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            query_stats.reset(token)
+            report_query_stats(scope["method"], scope["path"], stats)
@@ -0,0 +1,37 @@
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.metrics import Histogram
+
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waited for a connection,
+    including the time spent opening new ones.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - start)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkout_wait_seconds": self.checkout_wait.stats(),
+        }
@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import hmac
+import itertools
+import math
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.responses import StreamingResponse
+
+from src.settings import settings
+
+WRITE_PIN_COOKIE = "last_write"
+
+# Pin of the write session committed by `complete_sessions` in this request.
+write_pin: ContextVar[Optional[str]] = ContextVar("write_pin", default=None)
+
+
+def complete_sessions(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if not asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        response = await endpoint(*args, **kwargs)
+        if isinstance(response, StreamingResponse):
+            # The body is read from the session while it is sent.
+            return response
+        for value in kwargs.values():
+            if not isinstance(value, AsyncSession):
+                continue
+            if value.info.get("read_only"):
+                await value.close()
+            else:
+                await value.commit()
+                pin = value.info.pop("write_pin", None)
+                if pin is not None:
+                    write_pin.set(pin)
+        return response
+
+    return wrapper
+
+
+async def release_read_session(session: AsyncSession) -> None:
+    """
+    Returns the connection of a read-only session to the pool before the
+    request is over. The session stays usable: its next query checks out a
+    connection again.
+    """
+    if session.info.get("read_only"):
+        await session.close()
+
+
+class DatabaseRoute(APIRoute):
+    """
+    Makes each request a single unit of work. Services only flush their
+    changes; the write session is committed once, after the endpoint returns
+    and before the response is sent, so a failed commit still fails the
+    request. Read-only sessions are closed at the same point, so their
+    connections are not held while the response is validated and serialized.
+    Streamed responses are left alone: their sessions are closed by the
+    dependencies once the body has been sent.
+
+    A request that committed writes hands the client the pin of its write in
+    a cookie, which keeps the client's reads on the primary whichever worker
+    serves them.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, complete_sessions(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            token = write_pin.set(None)
+            try:
+                response = await handler(request)
+                pin = write_pin.get()
+            finally:
+                write_pin.reset(token)
+            if pin is not None:
+                response.set_cookie(
+                    WRITE_PIN_COOKIE,
+                    pin,
+                    max_age=math.ceil(settings.READ_YOUR_WRITES_WINDOW),
+                    httponly=True,
+                )
+            return response
+
+        return route_handler
+
+
+class ReplicaRouter:
+    """
+    Picks the engine of read-only sessions. Reads are spread round-robin over
+    the replicas, except for clients that wrote within the last `window`
+    seconds: they keep reading from the primary, so replication lag never
+    hides their own changes from them.
+
+    Writes are not remembered by the worker that made them. `record_write`
+    returns a signed pin which the client sends back with its next requests,
+    so any worker holding the same secret key can honour it.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        window: float,
+        secret_key: str,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.window = window
+        self._secret_key = secret_key.encode()
+        self._next_replica = itertools.cycle(replicas)
+
+    def _sign(self, written_at: str) -> str:
+        return hmac.new(
+            self._secret_key, written_at.encode(), hashlib.sha256
+        ).hexdigest()
+
+    def record_write(self) -> str:
+        written_at = str(time.time_ns() // 1_000_000)
+        return f"{written_at}.{self._sign(written_at)}"
+
+    def is_pinned(self, pin: Optional[str]) -> bool:
+        if not pin:
+            return False
+        written_at, _, signature = pin.rpartition(".")
+        if not hmac.compare_digest(signature, self._sign(written_at)):
+            return False
+        return time.time() - int(written_at) / 1000 < self.window
+
+    def get_read_engine(self, pin: Optional[str] = None) -> AsyncEngine:
+        if not self.replicas:
+            return self.primary
+        if self.is_pinned(pin):
+            return self.primary
+        return next(self._next_replica)
@@ -1,41 +1,83 @@
 import json
 from typing import Union
-from fastapi import Depends
+from uuid import UUID
+from fastapi import Depends, Request
 from fastapi_another_jwt_auth import AuthJWT
 from fastapi_another_jwt_auth.exceptions import MissingTokenError, InvalidHeaderError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.core.exceptions import InvalidCredentialsException, UserNotActiveException
+from src.apps.jwt.services import get_verified_subject
+from src.apps.users.cache import cache_user, get_cached_user
 from src.apps.users.models import User
+from src.apps.users.schemas import UserOutputSchema
 from src.core.utils import get_object_by_id
-from src.database.connection import get_db
+from src.database.connection import get_read_db
+from src.database.routing import release_read_session
+from src.settings import settings
 
 
-async def authenticate_user(
-    auth_jwt: AuthJWT = Depends(), session: AsyncSession = Depends(get_db)
+async def _get_token_user(
+    request: Request, auth_jwt: AuthJWT, session: AsyncSession
 ) -> User:
-    auth_jwt.jwt_required()
-    user = json.loads(auth_jwt.get_jwt_subject())
-    user = await get_object_by_id(Table=User, id=user["id"], session=session)
+    user_id = UUID(get_verified_subject(request=request, auth_jwt=auth_jwt)["id"])
 
+    user = await get_cached_user(user_id=user_id, session=session)
     if user is None:
-        raise InvalidCredentialsException("Invalid credentials provided.")
+        user = await get_object_by_id(Table=User, id=user_id, session=session)
+        cache_user(user)
+    # Write routes do not take this session as an argument, so it would hold
+    # a second connection until the response is sent.
+    await release_read_session(session)
+    return user
+
+
+async def authenticate_user(
+    request: Request,
+    auth_jwt: AuthJWT = Depends(),
+    session: AsyncSession = Depends(get_read_db),
+) -> User:
+    user = await _get_token_user(request=request, auth_jwt=auth_jwt, session=session)
+
     if not user.is_active:
         raise UserNotActiveException("Account not activated. Please check your email.")
     return user
 
 
+async def authenticate_user_claims(
+    request: Request,
+    auth_jwt: AuthJWT = Depends(),
+    session: AsyncSession = Depends(get_read_db),
+) -> Union[User, UserOutputSchema]:
+    """
+    For routes that only need the identity of the user. With
+    `authjwt_trust_claims` enabled the signed token subject is trusted instead
+    of reading the user from the database; revoked tokens are still rejected.
+    """
+    if not settings.authjwt_trust_claims:
+        return await authenticate_user(
+            request=request, auth_jwt=auth_jwt, session=session
+        )
+
+    user = UserOutputSchema.parse_obj(
+        get_verified_subject(request=request, auth_jwt=auth_jwt)
+    )
+    if not user.is_active:
+        # Tokens issued before activation still carry is_active=False.
+        return await authenticate_user(
+            request=request, auth_jwt=auth_jwt, session=session
+        )
+    return user
+
+
 async def get_user_or_none(
-    auth_jwt: AuthJWT = Depends(), session: AsyncSession = Depends(get_db)
+    request: Request,
+    auth_jwt: AuthJWT = Depends(),
+    session: AsyncSession = Depends(get_read_db),
 ) -> Union[User, None]:
     try:
-        auth_jwt.jwt_required()
-        user = json.loads(auth_jwt.get_jwt_subject())
-        user = await get_object_by_id(Table=User, id=user["id"], session=session)
-
-        if user is None:
-            raise InvalidCredentialsException("Invalid credentials provided.")
-
-        return user
+        return await _get_token_user(
+            request=request, auth_jwt=auth_jwt, session=session
+        )
     except MissingTokenError as exc:
         return None
@@ -1,11 +1,22 @@
 from fastapi_another_jwt_auth import AuthJWT
+from src.settings.cache import CacheSettings
+from src.settings.counters import CounterSettings
 from src.settings.database import DatabaseSettings
 from src.settings.jwt import AuthJWTSettings
 from src.settings.email import EmailSettings
 from src.settings.general import GeneralSettings
+from src.settings.passwords import PasswordHasherSettings
 
 
-class Settings(AuthJWTSettings, DatabaseSettings, EmailSettings, GeneralSettings):
+class Settings(
+    AuthJWTSettings,
+    CacheSettings,
+    CounterSettings,
+    DatabaseSettings,
+    EmailSettings,
+    GeneralSettings,
+    PasswordHasherSettings,
+):
     class Config:
         env_file = ".env"
 
@@ -2,3 +2,4 @@
 from src.apps.users import models
 from src.apps.groups import models
 from src.apps.posts import models
+from src.apps.jwt import models
@@ -0,0 +1,7 @@
+from pydantic import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    USER_CACHE_SIZE: int = 10_000
+    USER_CACHE_TTL: int = 60
+    TOKEN_CACHE_SIZE: int = 10_000
@@ -0,0 +1,8 @@
+from pydantic import BaseSettings
+
+
+class CounterSettings(BaseSettings):
+    # Posts with at least this many reactions get this many counter shards
+    # from the reconciliation job; 0 shards keeps every count on its post.
+    REACTION_COUNTER_SHARDS: int = 0
+    REACTION_COUNTER_SHARD_THRESHOLD: int = 10_000
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseSettings
 
 
@@ -9,6 +10,22 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PORT: int
     TEST_MODE: bool = False
     ASYNC_MODE: bool = True
+    POSTGRES_REPLICA_URLS: list[str] = []
+    READ_YOUR_WRITES_WINDOW: float = 5
+
+    # Uvicorn reads the same variable as its default number of workers.
+    WEB_CONCURRENCY: int = 1
+    DB_MAX_CONNECTIONS: int = 80
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    SQL_INSTRUMENTATION: bool = False
+    SQL_LOG_QUERY_COUNT: int = 20
+    SQL_LOG_DB_TIME: float = 0.5
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
 
     @property
     def postgres_url(self) -> str:
@@ -18,3 +35,26 @@ class DatabaseSettings(BaseSettings):
             f"{driver}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
             f"{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{database_name}"
         )
+
+    @property
+    def worker_connections(self) -> int:
+        """
+        Share of `DB_MAX_CONNECTIONS` that a single worker process may open,
+        which is also the number of requests it can serve without waiting for
+        a connection: a request holds at most one at a time, since the
+        authentication dependencies release their read session before the
+        endpoint's session connects.
+        """
+        return max(self.DB_MAX_CONNECTIONS // max(self.WEB_CONCURRENCY, 1), 1)
+
+    @property
+    def db_pool_size(self) -> int:
+        if self.DB_POOL_SIZE is not None:
+            return self.DB_POOL_SIZE
+        return max(self.worker_connections // 2, 1)
+
+    @property
+    def db_max_overflow(self) -> int:
+        if self.DB_MAX_OVERFLOW is not None:
+            return self.DB_MAX_OVERFLOW
+        return max(self.worker_connections - self.db_pool_size, 0)
@@ -4,3 +4,8 @@ from pydantic import BaseSettings
 class AuthJWTSettings(BaseSettings):
     authjwt_secret_key: str
     authjwt_access_token_expires: int = 24 * 3600
+    authjwt_header_name: str = "Authorization"
+    authjwt_denylist_enabled: bool = True
+    authjwt_denylist_token_checks: set[str] = {"access"}
+    authjwt_revocation_refresh_interval: int = 5
+    authjwt_trust_claims: bool = False
@@ -0,0 +1,7 @@
+from pydantic import BaseSettings
+
+
+class PasswordHasherSettings(BaseSettings):
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_QUEUE_SIZE: int = 64
+    PASSWORD_HASHER_USE_PROCESSES: bool = False
@@ -11,7 +11,7 @@ from sqlmodel import SQLModel
 from main import app
 from src.settings import Settings
 from src.settings.alembic import *
-from src.database.connection import get_db
+from src.database.connection import get_db, get_read_db
 
 
 @pytest.fixture(scope="session")
@@ -69,5 +69,7 @@ def client(session) -> AsyncClient:
         yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     yield AsyncClient(app=app, base_url="http://test:8000/api/v1")
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_read_db]
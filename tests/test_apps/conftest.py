@@ -2,6 +2,7 @@ import pytest
 import pytest_asyncio
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi_another_jwt_auth import AuthJWT
+from starlette.requests import Request
 from src.apps.groups.models import (
     Group,
     GroupMembership,
@@ -55,6 +56,19 @@ def user_bearer_token_header(user_in_db: UserOutputSchema) -> dict[str, str]:
     return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest.fixture
+def user_bearer_token_request(user_bearer_token_header: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in user_bearer_token_header.items()
+            ],
+        }
+    )
+
+
 @pytest.fixture
 def other_user_register_data() -> dict[str, str]:
     return {
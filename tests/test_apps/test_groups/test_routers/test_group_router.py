@@ -41,6 +41,20 @@ async def test_anonymous_user_can_get_groups_list(
     assert response_body[0]["status"] == public_group_in_db.status
 
 
+@pytest.mark.asyncio
+async def test_groups_list_returns_member_counts(
+    client: AsyncClient,
+    public_group_in_db: Group,
+    group_membership_in_db: GroupMembership,
+):
+    response: Response = await client.get("/groups/")
+    assert response.status_code == status.HTTP_200_OK
+    response_body = response.json()
+    assert response_body[0]["member_count"] == 2
+    assert response_body[0]["admin_count"] == 1
+    assert response_body[0]["moderator_count"] == 0
+
+
 @pytest.mark.asyncio
 async def test_authenticated_user_can_get_group_by_id(
     client: AsyncClient,
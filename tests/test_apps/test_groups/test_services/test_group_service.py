@@ -4,6 +4,7 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select, update, and_
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.apps.groups.enums import GroupMemberStatus
 from src.apps.groups.models import (
     Group,
     GroupMembership,
@@ -17,6 +18,7 @@ from src.apps.groups.schemas import (
 from src.apps.groups.services import GroupService
 from src.apps.users.models import User
 from src.core.exceptions import (
+    AlreadyExistsException,
     DoesNotExistException,
     GroupRequestAlreadyHandled,
     PermissionDeniedException,
@@ -46,6 +48,81 @@ async def test_group_service_correctly_creates_group(
     assert group_in_db.members[0].user == user_in_db
 
 
+@pytest.mark.asyncio
+async def test_create_group_with_taken_name_keeps_transaction_usable(
+    user_in_db: User,
+    group_create_data: dict[str, str],
+    session: AsyncSession,
+):
+    schema = GroupInputSchema(**group_create_data)
+    await GroupService.create_group(user=user_in_db, schema=schema, session=session)
+
+    with pytest.raises(AlreadyExistsException):
+        await GroupService.create_group(user=user_in_db, schema=schema, session=session)
+
+    groups = (await session.exec(select(Group))).all()
+    assert len(groups) == 1
+
+
+@pytest.mark.asyncio
+async def test_group_members_are_counted_by_role(
+    user_in_db: User,
+    other_user_in_db: User,
+    public_group_in_db: Group,
+    session: AsyncSession,
+):
+    async def get_counts() -> tuple[int, int, int]:
+        return (
+            await session.exec(
+                select(
+                    Group.member_count, Group.admin_count, Group.moderator_count
+                ).where(Group.id == public_group_in_db.id)
+            )
+        ).one()
+
+    assert (
+        public_group_in_db.member_count,
+        public_group_in_db.admin_count,
+        public_group_in_db.moderator_count,
+    ) == (1, 1, 0)
+
+    membership = await GroupService.create_membership(
+        group_id=public_group_in_db.id,
+        user=other_user_in_db,
+        membership_status=GroupMemberStatus.REGULAR,
+        session=session,
+    )
+    assert await get_counts() == (2, 1, 0)
+
+    await GroupService.update_membership(
+        schema=GroupMembershipUpdateSchema(membership_status="MODERATOR"),
+        group_id=public_group_in_db.id,
+        membership_id=membership.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (2, 1, 1)
+
+    await GroupService.delete_membership_by_id(
+        group_id=public_group_in_db.id,
+        membership_id=membership.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (1, 1, 0)
+
+    await GroupService.create_membership(
+        group_id=public_group_in_db.id,
+        user=other_user_in_db,
+        membership_status=GroupMemberStatus.REGULAR,
+        session=session,
+    )
+    await GroupService.delete_membership_by_user_id(
+        group_id=public_group_in_db.id, user=other_user_in_db, session=session
+    )
+    assert await get_counts() == (1, 1, 0)
+
+
 @pytest.mark.asyncio
 async def test_group_service_correctly_updates_group(
     user_in_db: User,
@@ -101,12 +178,13 @@ async def test_group_service_correctly_filters_groups_without_user(
     groups = await GroupService.filter_get_group_list(
         request_user=None, session=session
     )
+    group_ids = [group.id for group in groups]
     assert len(groups) == 2
-    assert public_group_in_db in groups
-    assert private_group_in_db in groups
-    assert closed_group_in_db not in groups
+    assert public_group_in_db.id in group_ids
+    assert private_group_in_db.id in group_ids
+    assert closed_group_in_db.id not in group_ids
 
-    assert closed_group_in_db not in groups
+    assert closed_group_in_db.id not in group_ids
 
 
 @pytest.mark.asyncio
@@ -120,10 +198,11 @@ async def test_group_service_correctly_filters_groups_with_user_in_all_groups(
     groups = await GroupService.filter_get_group_list(
         request_user=user_in_db, session=session
     )
+    group_ids = [group.id for group in groups]
     assert len(groups) == 3
-    assert public_group_in_db in groups
-    assert private_group_in_db in groups
-    assert closed_group_in_db in groups
+    assert public_group_in_db.id in group_ids
+    assert private_group_in_db.id in group_ids
+    assert closed_group_in_db.id in group_ids
 
 
 @pytest.mark.asyncio
@@ -137,10 +216,11 @@ async def test_group_service_correctly_filters_groups_with_user_not_in_any_group
     groups = await GroupService.filter_get_group_list(
         request_user=other_user_in_db, session=session
     )
+    group_ids = [group.id for group in groups]
     assert len(groups) == 2
-    assert public_group_in_db in groups
-    assert private_group_in_db in groups
-    assert closed_group_in_db not in groups
+    assert public_group_in_db.id in group_ids
+    assert private_group_in_db.id in group_ids
+    assert closed_group_in_db.id not in group_ids
 
 
 @pytest.mark.asyncio
@@ -160,10 +240,11 @@ async def test_group_service_correctly_filters_groups_with_user_in_closed_group(
     groups = await GroupService.filter_get_group_list(
         request_user=other_user_in_db, session=session
     )
+    group_ids = [group.id for group in groups]
     assert len(groups) == 3
-    assert public_group_in_db in groups
-    assert private_group_in_db in groups
-    assert closed_group_in_db in groups
+    assert public_group_in_db.id in group_ids
+    assert private_group_in_db.id in group_ids
+    assert closed_group_in_db.id in group_ids
 
 
 @pytest.mark.asyncio
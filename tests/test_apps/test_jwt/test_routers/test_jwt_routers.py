@@ -0,0 +1,127 @@
+from fastapi import status
+from httpx import AsyncClient, Response
+import pytest
+from fastapi_another_jwt_auth import AuthJWT
+
+from src.apps.users.models import User
+from src.settings import settings
+
+
+@pytest.fixture
+def trust_claims():
+    settings.authjwt_trust_claims = True
+    yield
+    settings.authjwt_trust_claims = False
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_can_verify_token(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.post(
+        "/token/verify/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_anonymous_user_cannot_verify_token(
+    client: AsyncClient,
+):
+    response: Response = await client.post("/token/verify/")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_can_verify_token_from_claims(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    trust_claims: None,
+):
+    response: Response = await client.post(
+        "/token/verify/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_can_get_his_profile_from_claims(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    trust_claims: None,
+):
+    response: Response = await client.get(
+        "/users/profile/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == str(user_in_db.id)
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.post(
+        "/token/verify/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response: Response = await client.post(
+        "/token/revoke/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response: Response = await client.post(
+        "/token/verify/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected_when_trusting_claims(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    trust_claims: None,
+):
+    response: Response = await client.post(
+        "/token/revoke/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response: Response = await client.get(
+        "/users/profile/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_rejects_every_user_token(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    other_user_bearer_token_header: dict[str, str],
+):
+    second_token_header = {
+        "Authorization": f"Bearer {AuthJWT().create_access_token(subject=user_in_db.json())}"
+    }
+
+    response: Response = await client.post(
+        "/token/revoke-all/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    for headers in (user_bearer_token_header, second_token_header):
+        response: Response = await client.post("/token/verify/", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response: Response = await client.post(
+        "/token/verify/", headers=other_user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -0,0 +1,135 @@
+import json
+import math
+import time
+import pytest
+from fastapi_another_jwt_auth import AuthJWT
+from fastapi_another_jwt_auth.exceptions import RevokedTokenError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.requests import Request
+
+from src.apps.jwt.services import (
+    TokenService,
+    get_verified_subject,
+    revocation_list,
+    token_cache,
+)
+from src.apps.users.models import User
+
+
+@pytest.mark.asyncio
+async def test_token_service_revokes_all_user_tokens(
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    token = user_bearer_token_header["Authorization"].split()[1]
+    raw_token = AuthJWT().get_raw_jwt(token)
+    assert not revocation_list.is_revoked(raw_token)
+
+    await TokenService.revoke_user_tokens(user_id=user_in_db.id, session=session)
+    assert not revocation_list.is_revoked(raw_token)
+
+    await session.commit()
+    assert revocation_list.is_revoked(raw_token)
+
+
+@pytest.mark.asyncio
+async def test_token_service_forgets_rolled_back_revocations(
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    token = user_bearer_token_header["Authorization"].split()[1]
+    raw_token = AuthJWT().get_raw_jwt(token)
+
+    await TokenService.revoke_token(raw_token=raw_token, session=session)
+    await session.rollback()
+    await session.commit()
+
+    assert not revocation_list.is_revoked(raw_token)
+
+
+@pytest.mark.asyncio
+async def test_user_revocation_covers_the_second_it_was_made_in(
+    user_in_db: User,
+    session: AsyncSession,
+):
+    revoked_token = await TokenService.revoke_user_tokens(
+        user_id=user_in_db.id, session=session
+    )
+    await session.commit()
+    revoked_at = math.floor(revoked_token.created_at.timestamp())
+    sub = json.dumps({"id": str(user_in_db.id)})
+
+    assert revocation_list.is_revoked({"sub": sub, "iat": revoked_at - 1})
+    assert revocation_list.is_revoked({"sub": sub, "iat": revoked_at})
+    assert not revocation_list.is_revoked({"sub": sub, "iat": revoked_at + 1})
+
+
+@pytest.mark.asyncio
+async def test_token_service_refresh_loads_revocations_from_database(
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    token = user_bearer_token_header["Authorization"].split()[1]
+    raw_token = AuthJWT().get_raw_jwt(token)
+    await TokenService.revoke_token(raw_token=raw_token, session=session)
+    await session.commit()
+
+    revocation_list.load([])
+    assert not revocation_list.is_revoked(raw_token)
+
+    await TokenService.refresh_revocation_list(session=session)
+    assert revocation_list.is_revoked(raw_token)
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_revocations_committed_after_the_read(
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    token = user_bearer_token_header["Authorization"].split()[1]
+    raw_token = AuthJWT().get_raw_jwt(token)
+    read_at = time.monotonic()
+
+    await TokenService.revoke_token(raw_token=raw_token, session=session)
+    await session.commit()
+    revocation_list.load([], read_at=read_at)
+
+    assert revocation_list.is_revoked(raw_token)
+
+
+def test_get_verified_subject_caches_verified_tokens(
+    user_in_db: User,
+    user_bearer_token_request: Request,
+):
+    auth_jwt = AuthJWT(req=user_bearer_token_request)
+    hits = token_cache.hits
+
+    subject = get_verified_subject(request=user_bearer_token_request, auth_jwt=auth_jwt)
+    assert subject["id"] == str(user_in_db.id)
+    assert token_cache.hits == hits
+
+    assert (
+        get_verified_subject(request=user_bearer_token_request, auth_jwt=auth_jwt)
+        == subject
+    )
+    assert token_cache.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_get_verified_subject_rejects_cached_revoked_tokens(
+    user_in_db: User,
+    user_bearer_token_request: Request,
+    session: AsyncSession,
+):
+    auth_jwt = AuthJWT(req=user_bearer_token_request)
+    get_verified_subject(request=user_bearer_token_request, auth_jwt=auth_jwt)
+
+    await TokenService.revoke_token(raw_token=auth_jwt.get_raw_jwt(), session=session)
+    await session.commit()
+
+    with pytest.raises(RevokedTokenError):
+        get_verified_subject(request=user_bearer_token_request, auth_jwt=auth_jwt)
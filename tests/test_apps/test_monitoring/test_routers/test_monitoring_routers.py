@@ -0,0 +1,27 @@
+from fastapi import status
+from httpx import AsyncClient, Response
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_database_stats_report_primary_pool(client: AsyncClient):
+    response: Response = await client.get("/monitoring/database/")
+    assert response.status_code == status.HTTP_200_OK
+    pool = response.json()["pools"]["primary"]
+    assert {"size", "checked_out", "overflow", "checkout_wait_seconds"} <= set(pool)
+
+
+@pytest.mark.asyncio
+async def test_executor_stats_report_password_executor(client: AsyncClient):
+    response: Response = await client.get("/monitoring/executors/")
+    assert response.status_code == status.HTTP_200_OK
+    executor = response.json()["password"]
+    assert {"in_flight", "completed", "failed", "rejected"} <= set(executor)
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_report_token_cache(client: AsyncClient):
+    response: Response = await client.get("/monitoring/caches/")
+    assert response.status_code == status.HTTP_200_OK
+    tokens = response.json()["tokens"]
+    assert {"hits", "misses", "hit_rate"} <= set(tokens)
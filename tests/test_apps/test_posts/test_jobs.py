@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.posts.jobs import reconcile_reaction_counts
+from src.apps.posts.models import UserPost, UserPostReaction, UserPostReactionCounter
+from src.apps.users.models import User
+from src.settings import settings
+
+
+async def get_counts(post: UserPost, session: AsyncSession) -> tuple[int, int]:
+    return (
+        await session.exec(
+            select(UserPost.like_count, UserPost.dislike_count).where(
+                UserPost.id == post.id
+            )
+        )
+    ).one()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reaction_counts_repairs_drifted_counts(
+    user_post_in_db: UserPost,
+    user_post_reaction_in_db: UserPostReaction,
+    session: AsyncSession,
+):
+    await session.execute(
+        update(UserPost)
+        .where(UserPost.id == user_post_in_db.id)
+        .values(like_count=5, dislike_count=2)
+    )
+
+    assert await reconcile_reaction_counts(session) == 1
+    assert await get_counts(user_post_in_db, session) == (1, 0)
+    assert await reconcile_reaction_counts(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reaction_counts_shards_and_folds_popular_posts(
+    monkeypatch: pytest.MonkeyPatch,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_post_in_db: UserPost,
+    session: AsyncSession,
+):
+    monkeypatch.setattr(settings, "REACTION_COUNTER_SHARDS", 4)
+    monkeypatch.setattr(settings, "REACTION_COUNTER_SHARD_THRESHOLD", 0)
+    await reconcile_reaction_counts(session)
+
+    for user, reaction in ((user_in_db, "LIKE"), (other_user_in_db, "DISLIKE")):
+        session.add(
+            UserPostReaction(
+                reaction=reaction, user_id=user.id, post_id=user_post_in_db.id
+            )
+        )
+    await session.commit()
+
+    shards = (await session.exec(select(UserPostReactionCounter))).all()
+    assert {shard.post_id for shard in shards} == {user_post_in_db.id}
+    assert sum(shard.like_count for shard in shards) == 1
+    assert sum(shard.dislike_count for shard in shards) == 1
+    assert await get_counts(user_post_in_db, session) == (0, 0)
+
+    assert await reconcile_reaction_counts(session) == 0
+    assert await get_counts(user_post_in_db, session) == (1, 1)
+    assert (await session.exec(select(UserPostReactionCounter))).all() == []
@@ -1,6 +1,8 @@
+import json
 from fastapi import status
 from httpx import AsyncClient
 import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.apps.groups.models import Group
 from src.apps.posts.models import GroupPost, GroupPostComment, GroupPostReaction
@@ -20,9 +22,9 @@ async def test_user_can_get_group_post_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["group_id"] == str(group_post_in_db.group_id)
-    assert response_body[0]["user_id"] == str(group_post_in_db.user_id)
-    assert response_body[0]["text"] == group_post_in_db.text
+    assert response_body["items"][0]["group_id"] == str(group_post_in_db.group_id)
+    assert response_body["items"][0]["user_id"] == str(group_post_in_db.user_id)
+    assert response_body["items"][0]["text"] == group_post_in_db.text
 
 
 @pytest.mark.asyncio
@@ -37,9 +39,49 @@ async def test_anonymous_user_can_get_group_post_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["group_id"] == str(group_post_in_db.group_id)
-    assert response_body[0]["user_id"] == str(group_post_in_db.user_id)
-    assert response_body[0]["text"] == group_post_in_db.text
+    assert response_body["items"][0]["group_id"] == str(group_post_in_db.group_id)
+    assert response_body["items"][0]["user_id"] == str(group_post_in_db.user_id)
+    assert response_body["items"][0]["text"] == group_post_in_db.text
+
+
+@pytest.mark.asyncio
+async def test_anonymous_user_cannot_get_private_group_post_list(
+    client: AsyncClient,
+    private_group_in_db: Group,
+):
+    response = await client.get(f"/groups/{private_group_in_db.id}/posts/")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_group_post_list_follows_next_cursor(
+    client: AsyncClient,
+    post_data: dict[str, str],
+    user_in_db: User,
+    public_group_in_db: Group,
+    user_bearer_token_header: dict[str, str],
+):
+    for _ in range(3):
+        await client.post(
+            f"/groups/{public_group_in_db.id}/posts/",
+            json=post_data,
+            headers=user_bearer_token_header,
+        )
+
+    response = await client.get(
+        f"/groups/{public_group_in_db.id}/posts/", params={"limit": 2}
+    )
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+    assert first_page["items"][0]["created_at"] >= first_page["items"][1]["created_at"]
+
+    response = await client.get(
+        f"/groups/{public_group_in_db.id}/posts/",
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    )
+    second_page = response.json()
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
 
 
 @pytest.mark.asyncio
@@ -231,9 +273,9 @@ async def test_user_can_get_group_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["post_id"] == str(group_post_comment_in_db.post_id)
-    assert response_body[0]["user_id"] == str(group_post_comment_in_db.user_id)
-    assert response_body[0]["text"] == group_post_comment_in_db.text
+    assert response_body["items"][0]["post_id"] == str(group_post_comment_in_db.post_id)
+    assert response_body["items"][0]["user_id"] == str(group_post_comment_in_db.user_id)
+    assert response_body["items"][0]["text"] == group_post_comment_in_db.text
 
 
 @pytest.mark.asyncio
@@ -249,9 +291,9 @@ async def test_anonymous_user_can_get_group_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["post_id"] == str(group_post_comment_in_db.post_id)
-    assert response_body[0]["user_id"] == str(group_post_comment_in_db.user_id)
-    assert response_body[0]["text"] == group_post_comment_in_db.text
+    assert response_body["items"][0]["post_id"] == str(group_post_comment_in_db.post_id)
+    assert response_body["items"][0]["user_id"] == str(group_post_comment_in_db.user_id)
+    assert response_body["items"][0]["text"] == group_post_comment_in_db.text
 
 
 @pytest.mark.asyncio
@@ -424,9 +466,13 @@ async def test_user_can_get_group_post_reaction_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["post_id"] == str(group_post_reaction_in_db.post_id)
-    assert response_body[0]["user_id"] == str(group_post_reaction_in_db.user_id)
-    assert response_body[0]["reaction"] == group_post_reaction_in_db.reaction
+    assert response_body["items"][0]["post_id"] == str(
+        group_post_reaction_in_db.post_id
+    )
+    assert response_body["items"][0]["user_id"] == str(
+        group_post_reaction_in_db.user_id
+    )
+    assert response_body["items"][0]["reaction"] == group_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -442,9 +488,13 @@ async def test_anonymous_user_can_get_group_post_reaction_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["post_id"] == str(group_post_reaction_in_db.post_id)
-    assert response_body[0]["user_id"] == str(group_post_reaction_in_db.user_id)
-    assert response_body[0]["reaction"] == group_post_reaction_in_db.reaction
+    assert response_body["items"][0]["post_id"] == str(
+        group_post_reaction_in_db.post_id
+    )
+    assert response_body["items"][0]["user_id"] == str(
+        group_post_reaction_in_db.user_id
+    )
+    assert response_body["items"][0]["reaction"] == group_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -600,3 +650,64 @@ async def test_anonymous_user_cannot_delete_group_post_reaction(
         f"/groups/{public_group_in_db.id}/posts/{group_post_in_db.id}/reactions/{group_post_reaction_in_db.id}/",
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_group_post_reaction_list_follows_next_cursor(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    reaction_data: dict[str, str],
+    session: AsyncSession,
+):
+    for user in (user_in_db, other_user_in_db):
+        session.add(
+            GroupPostReaction(
+                **reaction_data, user_id=user.id, post_id=group_post_in_db.id
+            )
+        )
+        await session.commit()
+
+    url = f"/groups/{public_group_in_db.id}/posts/{group_post_in_db.id}/reactions/"
+    response = await client.get(url, params={"limit": 1})
+    assert response.status_code == status.HTTP_200_OK
+    first_page = response.json()
+    assert first_page["items"][0]["user_id"] == str(user_in_db.id)
+
+    response = await client.get(
+        url, params={"limit": 1, "cursor": first_page["next_cursor"]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    second_page = response.json()
+    assert second_page["items"][0]["user_id"] == str(other_user_in_db.id)
+    assert second_page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_group_post_comment_list_streams_ndjson(
+    client: AsyncClient,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    group_post_comment_in_db: GroupPostComment,
+):
+    response = await client.get(
+        f"/groups/{public_group_in_db.id}/posts/{group_post_in_db.id}/comments/",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    comments = [json.loads(line) for line in response.text.splitlines()]
+    assert [comment["id"] for comment in comments] == [str(group_post_comment_in_db.id)]
+
+
+@pytest.mark.asyncio
+async def test_anonymous_user_cannot_stream_closed_group_posts(
+    client: AsyncClient,
+    closed_group_in_db: Group,
+):
+    response = await client.get(
+        f"/groups/{closed_group_in_db.id}/posts/",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
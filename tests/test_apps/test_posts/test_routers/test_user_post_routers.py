@@ -18,8 +18,9 @@ async def test_user_can_get_user_post_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_in_db.user_id)
-    assert response_body[0]["text"] == user_post_in_db.text
+    assert response_body["items"][0]["user_id"] == str(user_post_in_db.user_id)
+    assert response_body["items"][0]["text"] == user_post_in_db.text
+    assert response_body["next_cursor"] is None
 
 
 @pytest.mark.asyncio
@@ -34,8 +35,76 @@ async def test_anonymous_user_can_get_user_post_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_in_db.user_id)
-    assert response_body[0]["text"] == user_post_in_db.text
+    assert response_body["items"][0]["user_id"] == str(user_post_in_db.user_id)
+    assert response_body["items"][0]["text"] == user_post_in_db.text
+    assert response_body["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_user_post_list_orders_commented_posts_by_activity(
+    client: AsyncClient,
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    user_post_comment_in_db: UserPostComment,
+):
+    response: Response = await client.get(
+        f"/users/{user_in_db.id}/posts/", params={"order": "activity"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [str(user_post_in_db.id)]
+    assert items[0]["comment_count"] == 1
+    assert items[0]["last_commented_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_user_post_list_follows_next_cursor(
+    client: AsyncClient,
+    post_data: dict[str, str],
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    for _ in range(3):
+        await client.post(
+            f"/users/{user_in_db.id}/posts/",
+            json=post_data,
+            headers=user_bearer_token_header,
+        )
+
+    response: Response = await client.get(
+        f"/users/{user_in_db.id}/posts/", params={"limit": 2}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+
+    response: Response = await client.get(
+        f"/users/{user_in_db.id}/posts/",
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    second_page = response.json()
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
+    assert second_page["items"][0]["id"] not in {
+        post["id"] for post in first_page["items"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_post_list_rejects_invalid_page_params(
+    client: AsyncClient,
+    user_in_db: User,
+):
+    response: Response = await client.get(
+        f"/users/{user_in_db.id}/posts/", params={"cursor": "invalid"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response: Response = await client.get(
+        f"/users/{user_in_db.id}/posts/", params={"limit": 1000}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
 @pytest.mark.asyncio
@@ -192,9 +261,9 @@ async def test_user_can_get_user_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_comment_in_db.user_id)
-    assert response_body[0]["post_id"] == str(user_post_comment_in_db.post_id)
-    assert response_body[0]["text"] == user_post_comment_in_db.text
+    assert response_body["items"][0]["user_id"] == str(user_post_comment_in_db.user_id)
+    assert response_body["items"][0]["post_id"] == str(user_post_comment_in_db.post_id)
+    assert response_body["items"][0]["text"] == user_post_comment_in_db.text
 
 
 @pytest.mark.asyncio
@@ -209,9 +278,9 @@ async def test_anonymous_user_can_get_user_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_comment_in_db.user_id)
-    assert response_body[0]["post_id"] == str(user_post_comment_in_db.post_id)
-    assert response_body[0]["text"] == user_post_comment_in_db.text
+    assert response_body["items"][0]["user_id"] == str(user_post_comment_in_db.user_id)
+    assert response_body["items"][0]["post_id"] == str(user_post_comment_in_db.post_id)
+    assert response_body["items"][0]["text"] == user_post_comment_in_db.text
 
 
 @pytest.mark.asyncio
@@ -377,9 +446,9 @@ async def test_user_can_get_user_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_reaction_in_db.user_id)
-    assert response_body[0]["post_id"] == str(user_post_reaction_in_db.post_id)
-    assert response_body[0]["reaction"] == user_post_reaction_in_db.reaction
+    assert response_body["items"][0]["user_id"] == str(user_post_reaction_in_db.user_id)
+    assert response_body["items"][0]["post_id"] == str(user_post_reaction_in_db.post_id)
+    assert response_body["items"][0]["reaction"] == user_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -394,9 +463,9 @@ async def test_anonymous_user_can_get_user_post_comment_list(
     )
     assert response.status_code == status.HTTP_200_OK
     response_body = response.json()
-    assert response_body[0]["user_id"] == str(user_post_reaction_in_db.user_id)
-    assert response_body[0]["post_id"] == str(user_post_reaction_in_db.post_id)
-    assert response_body[0]["reaction"] == user_post_reaction_in_db.reaction
+    assert response_body["items"][0]["user_id"] == str(user_post_reaction_in_db.user_id)
+    assert response_body["items"][0]["post_id"] == str(user_post_reaction_in_db.post_id)
+    assert response_body["items"][0]["reaction"] == user_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -457,6 +526,32 @@ async def test_user_can_create_user_post_reaction(
     assert response_body["reaction"] == reaction_data["reaction"]
 
 
+@pytest.mark.asyncio
+async def test_user_can_set_user_post_reaction(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_post_in_db: UserPost,
+    reaction_data: dict[str, str],
+    reaction_update_data: dict[str, str],
+    other_user_bearer_token_header: dict[str, str],
+):
+    url = f"/users/{user_in_db.id}/posts/{user_post_in_db.id}/reactions/"
+    responses = [
+        await client.put(url, json=data, headers=other_user_bearer_token_header)
+        for data in (reaction_data, reaction_update_data)
+    ]
+    assert [response.status_code for response in responses] == [
+        status.HTTP_200_OK,
+        status.HTTP_200_OK,
+    ]
+
+    created, replaced = [response.json() for response in responses]
+    assert replaced["id"] == created["id"]
+    assert replaced["user_id"] == str(other_user_in_db.id)
+    assert replaced["reaction"] == reaction_update_data["reaction"]
+
+
 @pytest.mark.asyncio
 async def test_anonymous_user_cannot_create_user_post_reaction(
     client: AsyncClient,
@@ -16,7 +16,13 @@ from src.apps.posts.schemas import (
 )
 from src.apps.posts.services import GroupPostService
 from src.apps.users.models import User
-from src.core.exceptions import DoesNotExistException, PermissionDeniedException
+from src.core.exceptions import (
+    AlreadyExistsException,
+    DoesNotExistException,
+    PermissionDeniedException,
+)
+from src.core.pagination import PageParams
+from src.database.instrumentation import QueryStats, query_stats
 
 
 @pytest.mark.asyncio
@@ -116,11 +122,13 @@ async def test_group_post_service_correctly_filters_post_list(
     group_post_in_db: GroupPost,
     session: AsyncSession,
 ):
-    posts = await GroupPostService.filter_get_group_post_list(
+    page = await GroupPostService.filter_get_group_post_list(
         group_id=public_group_in_db.id,
         request_user=user_in_db,
+        page_params=PageParams(limit=10),
         session=session,
     )
+    posts = page.items
     assert len(posts) == 1
     assert posts[0].group_id == public_group_in_db.id
     assert posts[0].user_id == user_in_db.id
@@ -153,10 +161,35 @@ async def test_filter_group_post_list_raises_exception_with_wrong_ids(
 ):
     with pytest.raises(DoesNotExistException):
         post = await GroupPostService.filter_get_group_post_list(
-            group_id=uuid4(), request_user=user_in_db, session=session
+            group_id=uuid4(),
+            request_user=user_in_db,
+            page_params=PageParams(limit=10),
+            session=session,
         )
 
 
+@pytest.mark.asyncio
+async def test_filter_group_post_list_checks_access_in_single_statement(
+    other_user_in_db: User,
+    private_group_in_db: Group,
+    closed_group_in_db: Group,
+    session: AsyncSession,
+):
+    for group in (private_group_in_db, closed_group_in_db):
+        for request_user in (other_user_in_db, None):
+            stats = QueryStats()
+            token = query_stats.set(stats)
+            with pytest.raises(PermissionDeniedException):
+                await GroupPostService.filter_get_group_post_list(
+                    group_id=group.id,
+                    request_user=request_user,
+                    page_params=PageParams(limit=10),
+                    session=session,
+                )
+            query_stats.reset(token)
+            assert stats.count == 1
+
+
 @pytest.mark.asyncio
 async def test_filter_group_post_by_id_raises_exception_with_wrong_ids(
     user_in_db: User,
@@ -299,12 +332,13 @@ async def test_group_post_service_correctly_filters_post_comment_list(
         group_id=public_group_in_db.id,
         post_id=group_post_in_db.id,
         request_user=user_in_db,
+        page_params=PageParams(limit=10),
         session=session,
     )
-    assert len(comments) == 1
-    assert comments[0].post_id == group_post_in_db.id
-    assert comments[0].user_id == user_in_db.id
-    assert comments[0].text == group_post_comment_in_db.text
+    assert len(comments.items) == 1
+    assert comments.items[0].post_id == group_post_in_db.id
+    assert comments.items[0].user_id == user_in_db.id
+    assert comments.items[0].text == group_post_comment_in_db.text
 
 
 @pytest.mark.asyncio
@@ -541,12 +575,13 @@ async def test_group_post_service_correctly_filters_post_reaction_list(
         group_id=public_group_in_db.id,
         post_id=group_post_in_db.id,
         request_user=user_in_db,
+        page_params=PageParams(limit=10),
         session=session,
     )
-    assert len(reactions) == 1
-    assert reactions[0].post_id == group_post_in_db.id
-    assert reactions[0].user_id == user_in_db.id
-    assert reactions[0].reaction == group_post_reaction_in_db.reaction
+    assert len(reactions.items) == 1
+    assert reactions.items[0].post_id == group_post_in_db.id
+    assert reactions.items[0].user_id == user_in_db.id
+    assert reactions.items[0].reaction == group_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -649,6 +684,77 @@ async def test_create_post_reaction_raises_exception_with_invalid_post_id(
         )
 
 
+@pytest.mark.asyncio
+async def test_create_post_reaction_raises_exception_with_existing_reaction(
+    reaction_data: dict[str, str],
+    user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    group_post_reaction_in_db: GroupPostReaction,
+    session: AsyncSession,
+):
+    with pytest.raises(AlreadyExistsException):
+        await GroupPostService.create_group_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            group_id=public_group_in_db.id,
+            post_id=group_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_post_reaction_creates_then_replaces_reaction(
+    reaction_data: dict[str, str],
+    reaction_update_data: dict[str, str],
+    user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    session: AsyncSession,
+):
+    created, replaced = [
+        await GroupPostService.set_group_post_reaction(
+            schema=ReactionInputSchema(**data),
+            group_id=public_group_in_db.id,
+            post_id=group_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        for data in (reaction_data, reaction_update_data)
+    ]
+    assert replaced.id == created.id
+    assert replaced.reaction == reaction_update_data["reaction"]
+    result = (await session.exec(select(GroupPostReaction))).all()
+    assert len(result) == 1
+
+
+@pytest.mark.asyncio
+async def test_set_post_reaction_raises_exception_for_non_member_or_invalid_post(
+    reaction_data: dict[str, str],
+    user_in_db: User,
+    other_user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    session: AsyncSession,
+):
+    with pytest.raises(PermissionDeniedException):
+        await GroupPostService.set_group_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            group_id=public_group_in_db.id,
+            post_id=group_post_in_db.id,
+            request_user=other_user_in_db,
+            session=session,
+        )
+    with pytest.raises(DoesNotExistException):
+        await GroupPostService.set_group_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            group_id=public_group_in_db.id,
+            post_id=uuid4(),
+            request_user=user_in_db,
+            session=session,
+        )
+
+
 @pytest.mark.asyncio
 async def test_group_post_service_correctly_updates_post_reaction(
     reaction_update_data: dict[str, str],
@@ -769,3 +875,93 @@ async def test_delete_post_reaction_raises_exceptions_with_invalid_ids(
             request_user=user_in_db,
             session=session,
         )
+
+
+@pytest.mark.asyncio
+async def test_reactions_are_counted_on_their_post(
+    reaction_data: dict[str, str],
+    reaction_update_data: dict[str, str],
+    user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    session: AsyncSession,
+):
+    async def get_counts() -> tuple[int, int]:
+        group_post = await GroupPostService.filter_get_group_post_by_id(
+            group_id=public_group_in_db.id,
+            post_id=group_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        await session.refresh(group_post)
+        return group_post.like_count, group_post.dislike_count
+
+    reaction = await GroupPostService.create_group_post_reaction(
+        schema=ReactionInputSchema(**reaction_data),
+        group_id=public_group_in_db.id,
+        post_id=group_post_in_db.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (1, 0)
+
+    await GroupPostService.update_group_post_reaction(
+        schema=ReactionInputSchema(**reaction_update_data),
+        group_id=public_group_in_db.id,
+        post_id=group_post_in_db.id,
+        reaction_id=reaction.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (0, 1)
+
+    await GroupPostService.delete_group_post_reaction(
+        group_id=public_group_in_db.id,
+        post_id=group_post_in_db.id,
+        reaction_id=reaction.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_comments_are_counted_on_their_post(
+    comment_data: dict[str, str],
+    user_in_db: User,
+    public_group_in_db: Group,
+    group_post_in_db: GroupPost,
+    session: AsyncSession,
+):
+    async def get_group_post() -> GroupPost:
+        group_post = await GroupPostService.filter_get_group_post_by_id(
+            group_id=public_group_in_db.id,
+            post_id=group_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        await session.refresh(group_post)
+        return group_post
+
+    comment = await GroupPostService.create_group_post_comment(
+        schema=CommentInputSchema(**comment_data),
+        group_id=public_group_in_db.id,
+        post_id=group_post_in_db.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    await session.refresh(comment)
+    group_post = await get_group_post()
+    assert group_post.comment_count == 1
+    assert group_post.last_commented_at == comment.created_at
+
+    await GroupPostService.delete_group_post_comment(
+        group_id=public_group_in_db.id,
+        post_id=group_post_in_db.id,
+        comment_id=comment.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    group_post = await get_group_post()
+    assert group_post.comment_count == 0
+    assert group_post.last_commented_at is None
@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 import pytest
 from sqlmodel import select
@@ -8,14 +10,22 @@ from src.apps.posts.models import (
     UserPostComment,
     UserPostReaction,
 )
+from src.apps.posts.enums import PostOrder
 from src.apps.posts.schemas import (
     CommentInputSchema,
     PostInputSchema,
     ReactionInputSchema,
 )
-from src.apps.posts.services import UserPostService
+from src.apps.posts.services import UserPostService, user_post_keyset
 from src.apps.users.models import User
-from src.core.exceptions import DoesNotExistException, PermissionDeniedException
+from src.core.exceptions import (
+    AlreadyExistsException,
+    DoesNotExistException,
+    InvalidCursorException,
+    PermissionDeniedException,
+)
+from src.core.pagination import PageParams
+from src.database.instrumentation import QueryStats, query_stats
 
 
 @pytest.mark.asyncio
@@ -24,12 +34,136 @@ async def test_user_post_service_correctly_filters_post_list(
     user_post_in_db: UserPost,
     session: AsyncSession,
 ):
-    posts = await UserPostService.filter_get_user_post_list(
-        user_id=user_in_db.id, session=session
+    page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id, page_params=PageParams(limit=10), session=session
     )
+    posts = page.items
     assert len(posts) == 1
     assert posts[0].user_id == user_in_db.id
     assert posts[0].text == user_post_in_db.text
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_user_post_service_paginates_post_list_newest_first(
+    user_in_db: User,
+    post_data: dict[str, str],
+    session: AsyncSession,
+):
+    for _ in range(3):
+        await UserPostService.create_user_post(
+            schema=PostInputSchema(**post_data),
+            user_id=user_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+    posts = (
+        await session.exec(
+            select(UserPost).order_by(UserPost.created_at.desc(), UserPost.id.desc())
+        )
+    ).all()
+
+    first_page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id, page_params=PageParams(limit=2), session=session
+    )
+    assert [post.id for post in first_page.items] == [post.id for post in posts[:2]]
+    assert first_page.next_cursor is not None
+
+    second_page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id,
+        page_params=PageParams(limit=2, cursor=first_page.next_cursor),
+        session=session,
+    )
+    assert [post.id for post in second_page.items] == [post.id for post in posts[2:]]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_user_post_service_paginates_commented_posts_by_activity(
+    user_in_db: User,
+    post_data: dict[str, str],
+    comment_data: dict[str, str],
+    session: AsyncSession,
+):
+    posts = [
+        await UserPostService.create_user_post(
+            schema=PostInputSchema(**post_data),
+            user_id=user_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        for _ in range(3)
+    ]
+    for post in (posts[1], posts[0], posts[2], posts[0]):
+        await UserPostService.create_user_post_comment(
+            schema=CommentInputSchema(**comment_data),
+            user_id=user_in_db.id,
+            post_id=post.id,
+            request_user=user_in_db,
+            session=session,
+        )
+
+    first_page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id,
+        page_params=PageParams(limit=2),
+        session=session,
+        order=PostOrder.ACTIVITY,
+    )
+    assert [post.id for post in first_page.items] == [posts[0].id, posts[2].id]
+    assert [post.comment_count for post in first_page.items] == [2, 1]
+
+    second_page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id,
+        page_params=PageParams(limit=2, cursor=first_page.next_cursor),
+        session=session,
+        order=PostOrder.ACTIVITY,
+    )
+    assert [post.id for post in second_page.items] == [posts[1].id]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_user_post_service_lists_only_commented_posts_by_activity(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    session: AsyncSession,
+):
+    page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id,
+        page_params=PageParams(limit=10),
+        session=session,
+        order=PostOrder.ACTIVITY,
+    )
+    assert page.items == []
+
+
+@pytest.mark.asyncio
+async def test_filter_user_post_list_returns_empty_page_after_last_post(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    session: AsyncSession,
+):
+    cursor = user_post_keyset.encode(user_post_in_db)
+    page = await UserPostService.filter_get_user_post_list(
+        user_id=user_in_db.id,
+        page_params=PageParams(limit=10, cursor=cursor),
+        session=session,
+    )
+    assert page.items == []
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_filter_user_post_list_raises_exception_with_invalid_cursor(
+    user_in_db: User,
+    session: AsyncSession,
+):
+    with pytest.raises(InvalidCursorException):
+        await UserPostService.filter_get_user_post_list(
+            user_id=user_in_db.id,
+            page_params=PageParams(limit=10, cursor="invalid"),
+            session=session,
+        )
 
 
 @pytest.mark.asyncio
@@ -108,7 +242,7 @@ async def test_filter_user_post_list_raises_exception_with_wrong_user_id(
 ):
     with pytest.raises(DoesNotExistException):
         post = await UserPostService.filter_get_user_post_list(
-            user_id=uuid4(), session=session
+            user_id=uuid4(), page_params=PageParams(limit=10), session=session
         )
 
 
@@ -221,12 +355,61 @@ async def test_user_post_service_correctly_filters_post_comment_list(
     session: AsyncSession,
 ):
     comments = await UserPostService.filter_get_user_post_comment_list(
-        user_id=user_in_db.id, post_id=user_post_in_db.id, session=session
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        page_params=PageParams(limit=10),
+        session=session,
+    )
+    assert len(comments.items) == 1
+    assert comments.items[0].user_id == user_post_comment_in_db.user_id
+    assert comments.items[0].post_id == user_post_comment_in_db.post_id
+    assert comments.items[0].text == user_post_comment_in_db.text
+
+
+@pytest.mark.asyncio
+async def test_user_post_service_paginates_post_comment_list_oldest_first(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    comment_data: dict[str, str],
+    session: AsyncSession,
+):
+    for _ in range(3):
+        await UserPostService.create_user_post_comment(
+            schema=CommentInputSchema(**comment_data),
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+    comments = (
+        await session.exec(
+            select(UserPostComment).order_by(
+                UserPostComment.created_at, UserPostComment.id
+            )
+        )
+    ).all()
+
+    first_page = await UserPostService.filter_get_user_post_comment_list(
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        page_params=PageParams(limit=2),
+        session=session,
+    )
+    assert [comment.id for comment in first_page.items] == [
+        comment.id for comment in comments[:2]
+    ]
+    assert first_page.next_cursor is not None
+
+    second_page = await UserPostService.filter_get_user_post_comment_list(
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        page_params=PageParams(limit=2, cursor=first_page.next_cursor),
+        session=session,
     )
-    assert len(comments) == 1
-    assert comments[0].user_id == user_post_comment_in_db.user_id
-    assert comments[0].post_id == user_post_comment_in_db.post_id
-    assert comments[0].text == user_post_comment_in_db.text
+    assert [comment.id for comment in second_page.items] == [
+        comment.id for comment in comments[2:]
+    ]
+    assert second_page.next_cursor is None
 
 
 @pytest.mark.asyncio
@@ -238,11 +421,17 @@ async def test_filter_post_comment_list_raises_exeption_with_wrong_ids(
 ):
     with pytest.raises(DoesNotExistException):
         comments = await UserPostService.filter_get_user_post_comment_list(
-            user_id=uuid4(), post_id=user_post_in_db.id, session=session
+            user_id=uuid4(),
+            post_id=user_post_in_db.id,
+            page_params=PageParams(limit=10),
+            session=session,
         )
     with pytest.raises(DoesNotExistException):
         comments = await UserPostService.filter_get_user_post_comment_list(
-            user_id=user_in_db.id, post_id=uuid4(), session=session
+            user_id=user_in_db.id,
+            post_id=uuid4(),
+            page_params=PageParams(limit=10),
+            session=session,
         )
 
 
@@ -294,6 +483,55 @@ async def test_filter_post_comment_by_id_raises_exeption_with_wrong_ids(
         )
 
 
+@pytest.mark.asyncio
+async def test_filter_post_comment_by_id_runs_single_statement(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    user_post_comment_in_db: UserPostComment,
+    session: AsyncSession,
+):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    await UserPostService.filter_get_user_post_comment_by_id(
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        comment_id=user_post_comment_in_db.id,
+        session=session,
+    )
+    query_stats.reset(token)
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_filter_post_comment_by_id_reports_missing_object(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    user_post_comment_in_db: UserPostComment,
+    session: AsyncSession,
+):
+    with pytest.raises(DoesNotExistException, match="Object"):
+        await UserPostService.filter_get_user_post_comment_by_id(
+            user_id=uuid4(),
+            post_id=user_post_in_db.id,
+            comment_id=user_post_comment_in_db.id,
+            session=session,
+        )
+    with pytest.raises(DoesNotExistException, match="User post"):
+        await UserPostService.filter_get_user_post_comment_by_id(
+            user_id=user_in_db.id,
+            post_id=uuid4(),
+            comment_id=user_post_comment_in_db.id,
+            session=session,
+        )
+    with pytest.raises(DoesNotExistException, match="Comment"):
+        await UserPostService.filter_get_user_post_comment_by_id(
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            comment_id=uuid4(),
+            session=session,
+        )
+
+
 @pytest.mark.asyncio
 async def test_user_post_service_correctly_creates_post_comment(
     user_in_db: User,
@@ -448,12 +686,15 @@ async def test_user_post_service_correctly_filters_post_reaction_list(
     session: AsyncSession,
 ):
     reactions = await UserPostService.filter_get_user_post_reaction_list(
-        user_id=user_in_db.id, post_id=user_post_in_db.id, session=session
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        page_params=PageParams(limit=10),
+        session=session,
     )
-    assert len(reactions) == 1
-    assert reactions[0].user_id == user_post_reaction_in_db.user_id
-    assert reactions[0].post_id == user_post_reaction_in_db.post_id
-    assert reactions[0].reaction == user_post_reaction_in_db.reaction
+    assert len(reactions.items) == 1
+    assert reactions.items[0].user_id == user_post_reaction_in_db.user_id
+    assert reactions.items[0].post_id == user_post_reaction_in_db.post_id
+    assert reactions.items[0].reaction == user_post_reaction_in_db.reaction
 
 
 @pytest.mark.asyncio
@@ -465,11 +706,17 @@ async def test_filter_post_reaction_list_raises_exeption_with_wrong_ids(
 ):
     with pytest.raises(DoesNotExistException):
         reactions = await UserPostService.filter_get_user_post_reaction_list(
-            user_id=uuid4(), post_id=user_post_in_db.id, session=session
+            user_id=uuid4(),
+            post_id=user_post_in_db.id,
+            page_params=PageParams(limit=10),
+            session=session,
         )
     with pytest.raises(DoesNotExistException):
         reactions = await UserPostService.filter_get_user_post_reaction_list(
-            user_id=user_in_db.id, post_id=uuid4(), session=session
+            user_id=user_in_db.id,
+            post_id=uuid4(),
+            page_params=PageParams(limit=10),
+            session=session,
         )
 
 
@@ -547,6 +794,72 @@ async def test_user_post_service_correctly_creates_post_reaction(
     assert result[0].reaction == reaction_data["reaction"]
 
 
+@pytest.mark.asyncio
+async def test_create_post_reaction_raises_exception_with_existing_reaction(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    reaction_data: dict[str, str],
+    user_post_reaction_in_db: UserPostReaction,
+    session: AsyncSession,
+):
+    with pytest.raises(AlreadyExistsException):
+        await UserPostService.create_user_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_post_reaction_creates_then_replaces_reaction_in_single_statement(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    reaction_data: dict[str, str],
+    reaction_update_data: dict[str, str],
+    session: AsyncSession,
+):
+    reactions = []
+    for data in (reaction_data, reaction_update_data):
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        reactions.append(
+            await UserPostService.set_user_post_reaction(
+                schema=ReactionInputSchema(**data),
+                user_id=user_in_db.id,
+                post_id=user_post_in_db.id,
+                request_user=user_in_db,
+                session=session,
+            )
+        )
+        query_stats.reset(token)
+        assert stats.count == 1
+
+    created, replaced = reactions
+    assert replaced.id == created.id
+    assert replaced.reaction == reaction_update_data["reaction"]
+    result = (await session.exec(select(UserPostReaction))).all()
+    assert len(result) == 1
+
+
+@pytest.mark.asyncio
+async def test_set_post_reaction_raises_exception_with_invalid_post_id(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    reaction_data: dict[str, str],
+    session: AsyncSession,
+):
+    with pytest.raises(DoesNotExistException):
+        await UserPostService.set_user_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            user_id=user_in_db.id,
+            post_id=uuid4(),
+            request_user=user_in_db,
+            session=session,
+        )
+
+
 @pytest.mark.asyncio
 async def test_user_post_service_correctly_updates_post_reaction(
     user_in_db: User,
@@ -665,3 +978,88 @@ async def test_delete_post_reaction_raises_exceptions_with_wrong_request_user(
             request_user=other_user_in_db,
             session=session,
         )
+
+
+@pytest.mark.asyncio
+async def test_reactions_are_counted_on_their_post(
+    user_in_db: User,
+    other_user_in_db: User,
+    user_post_in_db: UserPost,
+    reaction_data: dict[str, str],
+    reaction_update_data: dict[str, str],
+    session: AsyncSession,
+):
+    async def get_counts() -> tuple[int, int]:
+        page = await UserPostService.filter_get_user_post_list(
+            user_id=user_in_db.id, page_params=PageParams(limit=10), session=session
+        )
+        return page.items[0].like_count, page.items[0].dislike_count
+
+    reactions = [
+        await UserPostService.set_user_post_reaction(
+            schema=ReactionInputSchema(**reaction_data),
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            request_user=request_user,
+            session=session,
+        )
+        for request_user in (user_in_db, other_user_in_db)
+    ]
+    assert await get_counts() == (2, 0)
+
+    await UserPostService.set_user_post_reaction(
+        schema=ReactionInputSchema(**reaction_update_data),
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (1, 1)
+
+    await UserPostService.delete_user_post_reaction(
+        user_id=user_in_db.id,
+        post_id=user_post_in_db.id,
+        reaction_id=reactions[0].id,
+        request_user=user_in_db,
+        session=session,
+    )
+    assert await get_counts() == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_comments_are_counted_on_their_post(
+    user_in_db: User,
+    user_post_in_db: UserPost,
+    comment_data: dict[str, str],
+    session: AsyncSession,
+):
+    async def get_comment_activity() -> tuple[int, Optional[datetime]]:
+        page = await UserPostService.filter_get_user_post_list(
+            user_id=user_in_db.id, page_params=PageParams(limit=10), session=session
+        )
+        return page.items[0].comment_count, page.items[0].last_commented_at
+
+    comments = []
+    for _ in range(2):
+        comment = await UserPostService.create_user_post_comment(
+            schema=CommentInputSchema(**comment_data),
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        await session.refresh(comment)
+        comments.append(comment)
+    assert await get_comment_activity() == (2, comments[1].created_at)
+
+    for comment, activity in zip(
+        reversed(comments), [(1, comments[0].created_at), (0, None)]
+    ):
+        await UserPostService.delete_user_post_comment(
+            user_id=user_in_db.id,
+            post_id=user_post_in_db.id,
+            comment_id=comment.id,
+            request_user=user_in_db,
+            session=session,
+        )
+        assert await get_comment_activity() == activity
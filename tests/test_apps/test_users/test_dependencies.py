@@ -0,0 +1,39 @@
+import pytest
+from fastapi_another_jwt_auth import AuthJWT
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.requests import Request
+
+from src.apps.users.cache import invalidate_user
+from src.apps.users.models import User
+from src.dependencies import users
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cached", [False, True])
+async def test_authenticate_user_releases_read_session(
+    cached: bool,
+    monkeypatch: pytest.MonkeyPatch,
+    user_in_db: User,
+    user_bearer_token_request: Request,
+    session: AsyncSession,
+):
+    released = []
+
+    async def release_read_session(session: AsyncSession) -> None:
+        released.append(session)
+
+    monkeypatch.setattr(users, "release_read_session", release_read_session)
+    request = user_bearer_token_request
+    invalidate_user(user_in_db.id)
+    if cached:
+        await users.authenticate_user(
+            request=request, auth_jwt=AuthJWT(req=request), session=session
+        )
+        released.clear()
+
+    user = await users.authenticate_user(
+        request=request, auth_jwt=AuthJWT(req=request), session=session
+    )
+
+    assert user.id == user_in_db.id
+    assert released == [session]
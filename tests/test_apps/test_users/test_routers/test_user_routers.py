@@ -1,8 +1,13 @@
+import json
 from fastapi import status
 from httpx import AsyncClient, Response
 import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.apps.users.cache import cache_user, invalidate_user_on_commit, user_cache
 from src.apps.users.models import User
+from src.database.connection import replica_router
+from src.database.routing import WRITE_PIN_COOKIE
 
 
 @pytest.fixture
@@ -39,6 +44,27 @@ async def test_user_can_register(
     assert response_body["username"] == user_register_data["username"]
 
 
+@pytest.mark.asyncio
+async def test_writes_pin_client_to_primary_with_a_cookie(
+    monkeypatch: pytest.MonkeyPatch,
+    client: AsyncClient,
+    user_in_db: User,
+    user_login_data: dict[str, str],
+    other_user_register_data: dict[str, str],
+):
+    monkeypatch.setattr(replica_router, "replicas", [object()])
+
+    response: Response = await client.post("/users/login/", json=user_login_data)
+    assert response.status_code == status.HTTP_200_OK
+    assert WRITE_PIN_COOKIE not in response.cookies
+
+    response: Response = await client.post(
+        "/users/register/", json=other_user_register_data
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert replica_router.is_pinned(response.cookies[WRITE_PIN_COOKIE])
+
+
 @pytest.mark.asyncio
 async def test_authenticated_user_can_get_users_list(
     client: AsyncClient,
@@ -49,7 +75,113 @@ async def test_authenticated_user_can_get_users_list(
     assert response.status_code == status.HTTP_200_OK
 
     response_body = response.json()
-    assert len(response_body) == 1
+    assert len(response_body["items"]) == 1
+    assert response_body["next_cursor"] is None
+    assert response_body["total_estimate"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_users_list_follows_next_cursor(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/users/", params={"limit": 1}, headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_200_OK
+    first_page = response.json()
+    assert first_page["items"][0]["username"] == user_in_db.username
+
+    response: Response = await client.get(
+        "/users/",
+        params={"limit": 1, "cursor": first_page["next_cursor"]},
+        headers=user_bearer_token_header,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    second_page = response.json()
+    assert second_page["items"][0]["username"] == other_user_in_db.username
+    assert second_page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_users_list_rejects_page_size_above_max(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/users/", params={"limit": 1000}, headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_users_list_filters_by_username_prefix(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/users/",
+        params={"username_prefix": other_user_in_db.username},
+        headers=user_bearer_token_header,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_body = response.json()
+    assert [user["id"] for user in response_body["items"]] == [str(other_user_in_db.id)]
+
+    response: Response = await client.get(
+        "/users/",
+        params={"username_prefix": "user%"},
+        headers=user_bearer_token_header,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_users_list_filters_by_is_active(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    other_user_in_db.is_active = False
+    session.add(other_user_in_db)
+    await session.commit()
+
+    response: Response = await client.get(
+        "/users/", params={"is_active": True}, headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_body = response.json()
+    assert [user["id"] for user in response_body["items"]] == [str(user_in_db.id)]
+
+
+@pytest.mark.asyncio
+async def test_users_list_streams_ndjson(
+    client: AsyncClient,
+    user_in_db: User,
+    other_user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+):
+    response: Response = await client.get(
+        "/users/",
+        params={"username_prefix": "username"},
+        headers={**user_bearer_token_header, "Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    users = [json.loads(line) for line in response.text.splitlines()]
+    assert [user["id"] for user in users] == [
+        str(user_in_db.id),
+        str(other_user_in_db.id),
+    ]
 
 
 @pytest.mark.asyncio
@@ -119,3 +251,39 @@ async def test_anonymous_user_cannot_get_users_profile_by_id(
     response_body = response.json()
     assert len(response_body) == 1
     assert response_body["detail"] == "Missing Authorization Header"
+
+
+@pytest.mark.asyncio
+async def test_authenticated_user_is_cached_and_invalidated_on_update(
+    client: AsyncClient,
+    user_in_db: User,
+    user_bearer_token_header: dict[str, str],
+    session: AsyncSession,
+):
+    response: Response = await client.get(
+        "/users/profile/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert user_cache.get(user_in_db.id) is not None
+
+    user_in_db.is_active = False
+    await session.commit()
+    assert user_cache.get(user_in_db.id) is None
+
+    response: Response = await client.get(
+        "/users/profile/", headers=user_bearer_token_header
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_user_is_evicted_from_cache_again_on_commit(
+    user_in_db: User,
+    session: AsyncSession,
+):
+    invalidate_user_on_commit(user_id=user_in_db.id, session=session)
+    cache_user(user_in_db)
+    assert user_cache.get(user_in_db.id) is not None
+
+    await session.commit()
+    assert user_cache.get(user_in_db.id) is None
@@ -17,6 +17,7 @@ from src.core.exceptions import (
     FriendRequestAlreadyHandled,
     PermissionDeniedException,
 )
+from src.database.instrumentation import QueryStats, query_stats
 
 
 @pytest.mark.asyncio
@@ -56,6 +57,37 @@ async def test_create_friend_request_raises_exception_with_pending_request(
         )
 
 
+@pytest.mark.asyncio
+async def test_create_friend_request_raises_exception_with_pending_reverse_request(
+    user_in_db: User,
+    other_user_in_db: User,
+    session: AsyncSession,
+):
+    await FriendService.create_friend_request(
+        user_id=user_in_db.id, request_user=other_user_in_db, session=session
+    )
+    with pytest.raises(AlreadyExistsException, match="Unhandled friend request"):
+        await FriendService.create_friend_request(
+            user_id=other_user_in_db.id, request_user=user_in_db, session=session
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_friend_request_issues_single_statement(
+    user_in_db: User,
+    other_user_in_db: User,
+    session: AsyncSession,
+):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    await FriendService.create_friend_request(
+        user_id=other_user_in_db.id, request_user=user_in_db, session=session
+    )
+    query_stats.reset(token)
+
+    assert stats.count == 1
+
+
 @pytest.mark.asyncio
 async def test_create_friend_request_does_not_raise_exception_with_denied_request(
     user_in_db: User,
@@ -107,7 +139,7 @@ async def test_create_friend_request_raises_exception_with_existing_friend(
     friend = await FriendService.create_friend(
         user_id=user_in_db.id, friend_id=other_user_in_db.id, session=session
     )
-    with pytest.raises(AlreadyExistsException):
+    with pytest.raises(AlreadyExistsException, match="already friends"):
         friend_request = await FriendService.create_friend_request(
             user_id=other_user_in_db.id,
             request_user=user_in_db,
@@ -126,7 +158,7 @@ async def test_friend_service_correctly_filters_friend_list(
         request_user=user_in_db,
         session=session,
     )
-    assert friends[0] == friends_in_db[0]
+    assert friends[0].id == friends_in_db[0].id
     assert friends[0].friend_user_id == other_user_in_db.id
 
 
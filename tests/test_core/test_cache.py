@@ -0,0 +1,64 @@
+import time
+
+from src.core.cache import LRUCache
+
+
+def test_lru_cache_returns_stored_value():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    cache = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("key", "value")
+    time.sleep(0.02)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_removes_entry():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+    cache.delete("key")
+    cache.delete("missing")
+
+    assert cache.get("key") is None
+
+
+def test_lru_cache_entry_ttl_cannot_exceed_cache_ttl():
+    cache = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("key", "value", ttl=60)
+    cache.set("expired", "value", ttl=-1)
+    time.sleep(0.02)
+
+    assert cache.get("key") is None
+    assert cache.get("expired") is None
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.exceptions import ServiceUnavailableException
+from src.core.executors import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_runs_function_in_worker():
+    executor = BoundedExecutor(max_workers=1, max_queue_size=0)
+
+    result = await executor.run(threading.get_ident)
+
+    assert result != threading.get_ident()
+    assert executor.stats()["completed"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_counts_failures_separately():
+    executor = BoundedExecutor(max_workers=1, max_queue_size=0)
+
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+
+    stats = executor.stats()
+    assert stats["completed"] == 0
+    assert stats["failed"] == 1
+    assert stats["in_flight"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_rejects_calls_when_saturated():
+    executor = BoundedExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+
+    running = [
+        asyncio.create_task(executor.run(release.wait)),
+        asyncio.create_task(executor.run(release.wait)),
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableException):
+        await executor.run(release.wait)
+
+    stats = executor.stats()
+    assert stats["in_flight"] == 2
+    assert stats["queued"] == 1
+    assert stats["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
@@ -0,0 +1,22 @@
+from src.core.metrics import Histogram
+
+
+def test_histogram_counts_observations_cumulatively():
+    histogram = Histogram(buckets=(0.1, 1))
+
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+
+    assert histogram.stats() == {
+        "count": 4,
+        "sum": 5.65,
+        "buckets": {"0.1": 2, "1": 3, "+Inf": 4},
+    }
+
+
+def test_empty_histogram_stats():
+    assert Histogram(buckets=(1,)).stats() == {
+        "count": 0,
+        "sum": 0.0,
+        "buckets": {"1": 0, "+Inf": 0},
+    }
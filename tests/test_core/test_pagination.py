@@ -0,0 +1,51 @@
+import datetime as dt
+from uuid import uuid4
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.posts.models import UserPost
+from src.core.exceptions import InvalidCursorException
+from src.core.pagination import Keyset, estimate_count
+
+keyset = Keyset(UserPost.created_at, UserPost.id, descending=True)
+
+
+def test_keyset_cursor_round_trip():
+    post = UserPost(
+        id=uuid4(),
+        created_at=dt.datetime(2022, 5, 1, 12, 30, tzinfo=dt.timezone.utc),
+        text="text",
+    )
+
+    assert keyset.decode(keyset.encode(post)) == [post.created_at, post.id]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "W10=", "WyJhIiwgImIiXQ=="])
+def test_keyset_rejects_invalid_cursor(cursor: str):
+    with pytest.raises(InvalidCursorException):
+        keyset.decode(cursor)
+
+
+def test_keyset_page_trims_extra_row():
+    posts = [
+        UserPost(id=uuid4(), created_at=dt.datetime.now(dt.timezone.utc), text="")
+        for _ in range(3)
+    ]
+
+    page = keyset.page(posts, limit=2)
+    assert page.items == posts[:2]
+    assert page.next_cursor == keyset.encode(posts[1])
+
+    page = keyset.page(posts, limit=3)
+    assert page.items == posts
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_estimate_count_uses_planner_estimate(session: AsyncSession):
+    estimate = await estimate_count(
+        select(UserPost.id).where(UserPost.text == "it's"), session=session
+    )
+    assert isinstance(estimate, int)
+    assert estimate >= 0
@@ -0,0 +1,38 @@
+import datetime as dt
+import json
+from uuid import uuid4
+
+from src.apps.groups.enums import GroupStatus
+from src.apps.groups.models import Group
+from src.apps.groups.schemas import GroupOutputSchema
+from src.core.pagination import CountedPage
+from src.core.responses import list_response, page_response
+
+group = Group(
+    id=uuid4(),
+    created_at=dt.datetime(2022, 5, 1, 12, 30, 15, 250, tzinfo=dt.timezone.utc),
+    updated_at=dt.datetime(2022, 5, 2, tzinfo=dt.timezone.utc),
+    name="group",
+    description="description",
+    status=GroupStatus.PUBLIC,
+)
+
+
+def test_list_response_matches_schema_json():
+    response = list_response([group], Schema=GroupOutputSchema)
+
+    assert json.loads(response.body) == [
+        json.loads(GroupOutputSchema.from_orm(group).json())
+    ]
+
+
+def test_page_response_keeps_page_fields():
+    page = CountedPage(items=[group], next_cursor="cursor", total_estimate=10)
+
+    response = page_response(page, Schema=GroupOutputSchema)
+
+    assert json.loads(response.body) == {
+        "items": [json.loads(GroupOutputSchema.from_orm(group).json())],
+        "next_cursor": "cursor",
+        "total_estimate": 10,
+    }
@@ -1,12 +1,22 @@
 import pytest
 from uuid import uuid4
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.core.utils import get_object_by_id
+from src.core.utils import (
+    OutputColumns,
+    create_object,
+    create_objects,
+    get_object_by_id,
+    update_object_by_id,
+)
 from src.core.exceptions import DoesNotExistException, InvalidTableException
+from src.apps.groups.enums import GroupStatus
 from src.apps.groups.models import Group
 from src.apps.users.models import User
+from src.apps.users.schemas import UserOutputSchema
+from src.database.connection import replica_router
+from src.database.instrumentation import QueryStats, query_stats
 
 
 class InvalidTable(SQLModel):
@@ -46,3 +56,105 @@ async def test_get_object_by_id_correctly_raises_invalid_table_exception(
 ):
     with pytest.raises(InvalidTableException):
         smth = await get_object_by_id(Table=InvalidTable, id=uuid4(), session=session)
+
+
+@pytest.mark.asyncio
+async def test_create_object_returns_persisted_row_in_single_statement(
+    user_in_db: User,
+    session: AsyncSession,
+):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    group = await create_object(
+        Group(name="group", description="group", status=GroupStatus.PUBLIC),
+        session=session,
+    )
+    query_stats.reset(token)
+
+    assert stats.count == 1
+    assert group.created_at is not None
+    assert group in session
+    assert await get_object_by_id(Table=Group, id=group.id, session=session) is group
+
+
+@pytest.mark.asyncio
+async def test_create_objects_returns_rows_in_input_order(
+    user_in_db: User,
+    session: AsyncSession,
+):
+    groups = await create_objects(
+        [
+            Group(name=name, description=name, status=GroupStatus.PUBLIC)
+            for name in ("first", "second", "third")
+        ],
+        session=session,
+    )
+    assert [group.name for group in groups] == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_update_object_by_id_refreshes_loaded_object(
+    group_in_db: Group,
+    session: AsyncSession,
+):
+    group = await get_object_by_id(Table=Group, id=group_in_db.id, session=session)
+
+    updated_group = await update_object_by_id(
+        Table=Group, id=group.id, values={"name": "updated"}, session=session
+    )
+
+    assert updated_group is group
+    assert group.name == "updated"
+    assert group.updated_at >= group.created_at
+
+
+@pytest.mark.asyncio
+async def test_update_object_by_id_raises_does_not_exist_exception(
+    session: AsyncSession,
+):
+    with pytest.raises(DoesNotExistException):
+        await update_object_by_id(
+            Table=Group, id=uuid4(), values={"name": "updated"}, session=session
+        )
+
+
+@pytest.mark.asyncio
+async def test_returning_writes_pin_client_to_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    session: AsyncSession,
+):
+    monkeypatch.setattr(replica_router, "replicas", [object()])
+
+    group = await create_object(
+        Group(name="group", description="group", status=GroupStatus.PUBLIC),
+        session=session,
+    )
+    await session.commit()
+    assert replica_router.is_pinned(session.info.pop("write_pin"))
+
+    await update_object_by_id(
+        Table=Group, id=group.id, values={"name": "updated"}, session=session
+    )
+    await session.commit()
+    assert replica_router.is_pinned(session.info.pop("write_pin"))
+
+
+@pytest.mark.asyncio
+async def test_output_columns_select_only_schema_fields(
+    user_in_db: User, session: AsyncSession
+):
+    stats = QueryStats()
+    query_stats.set(stats)
+
+    row = (
+        await session.exec(
+            select(OutputColumns(User, UserOutputSchema)).where(
+                User.id == user_in_db.id
+            )
+        )
+    ).one()
+
+    [statement] = stats.shapes
+    assert "hashed_password" not in statement
+    assert not hasattr(row, "hashed_password")
+    assert UserOutputSchema.from_orm(row) == UserOutputSchema.from_orm(user_in_db)
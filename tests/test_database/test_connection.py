@@ -0,0 +1,156 @@
+import datetime as dt
+from uuid import uuid4
+import pytest
+from asyncpg.exceptions import ReadOnlySQLTransactionError
+from fastapi import Request, status
+from fastapi_another_jwt_auth import AuthJWT
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from main import app
+from src.apps.users.cache import cache_user, invalidate_user
+from src.apps.users.models import User
+from src.apps.users.schemas import UserOutputSchema
+from src.database import routing
+from src.database.connection import get_read_db, replica_router
+from src.dependencies import users
+
+
+@pytest.fixture
+def replicas(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(replica_router, "replicas", [object()])
+
+
+def assert_pinned(session: AsyncSession) -> None:
+    pin = session.info.pop("write_pin")
+    assert replica_router.get_read_engine(pin) is replica_router.primary
+
+
+@pytest.mark.asyncio
+async def test_committed_flush_pins_client_to_primary(
+    replicas: None, session: AsyncSession
+):
+    session.add(
+        User(
+            first_name="Writer",
+            last_name="Writer",
+            username="writer",
+            email="writer@writer.com",
+            hashed_password="hashed",
+            birthday=dt.date(2000, 1, 1),
+        )
+    )
+    await session.flush()
+    assert "write_pin" not in session.info
+
+    await session.commit()
+
+    assert_pinned(session)
+
+
+@pytest.mark.asyncio
+async def test_committed_write_statement_pins_client_to_primary(
+    replicas: None, session: AsyncSession
+):
+    await session.execute(
+        update(User)
+        .where(User.username == "writer")
+        .values(first_name="Written")
+        .returning(User.id)
+    )
+    await session.commit()
+
+    assert_pinned(session)
+
+
+@pytest.mark.asyncio
+async def test_read_statement_does_not_pin_client(
+    replicas: None, session: AsyncSession
+):
+    await session.exec(select(User).where(User.username == "writer"))
+    await session.commit()
+
+    assert "write_pin" not in session.info
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_write_does_not_pin_client(
+    replicas: None, session: AsyncSession
+):
+    await session.execute(
+        update(User).where(User.username == "writer").values(first_name="Written")
+    )
+    await session.rollback()
+    await session.commit()
+
+    assert "write_pin" not in session.info
+
+
+@pytest.fixture
+def read_primary(
+    monkeypatch: pytest.MonkeyPatch, async_engine: AsyncEngine
+) -> AsyncEngine:
+    """
+    Points the real read sessions at the test database. Reads then run on
+    their own connections, outside of the test's transaction.
+    """
+    read_engine = async_engine.execution_options(postgresql_readonly=True)
+    monkeypatch.setattr(replica_router, "primary", read_engine)
+    return read_engine
+
+
+@pytest.mark.asyncio
+async def test_read_session_runs_in_read_only_transaction(read_primary: AsyncEngine):
+    sessions = get_read_db(Request({"type": "http", "headers": []}))
+    session = await sessions.__anext__()
+
+    with pytest.raises(DBAPIError) as exc_info:
+        await session.execute(
+            update(User).where(User.username == "reader").values(first_name="Read")
+        )
+
+    assert isinstance(exc_info.value.orig.__cause__, ReadOnlySQLTransactionError)
+    await sessions.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_route_reads_after_auth_released_its_session(
+    monkeypatch: pytest.MonkeyPatch, read_primary: AsyncEngine
+):
+    released = []
+
+    async def release_read_session(session: AsyncSession) -> None:
+        released.append(session.info.get("read_only"))
+        await routing.release_read_session(session)
+
+    monkeypatch.setattr(users, "release_read_session", release_read_session)
+    user = User(
+        id=uuid4(),
+        first_name="Reader",
+        last_name="Reader",
+        username="reader",
+        email="reader@reader.com",
+        hashed_password="hashed",
+        birthday=dt.date(2000, 1, 1),
+        is_active=True,
+        created_at=dt.datetime.now(tz=dt.timezone.utc),
+        updated_at=dt.datetime.now(tz=dt.timezone.utc),
+    )
+    cache_user(user)
+    token = AuthJWT().create_access_token(
+        subject=UserOutputSchema.from_orm(user).json()
+    )
+
+    async with AsyncClient(app=app, base_url="http://test:8000/api/v1") as client:
+        response: Response = await client.get(
+            "/users/", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+    assert released == [True]
+    invalidate_user(user.id)
@@ -0,0 +1,72 @@
+import logging
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.database.instrumentation import QueryStats, query_stats
+from src.settings import settings
+
+
+@pytest.fixture
+def sql_instrumentation():
+    settings.SQL_INSTRUMENTATION = True
+    yield
+    settings.SQL_INSTRUMENTATION = False
+
+
+def test_query_stats_groups_statements_by_shape():
+    stats = QueryStats()
+    stats.record("SELECT * FROM post WHERE id = $1", 0.1)
+    stats.record("SELECT * FROM post WHERE id = $1", 0.2)
+    stats.record("SELECT * FROM user WHERE id = $1", 0.3)
+
+    assert stats.count == 3
+    assert stats.duration == pytest.approx(0.6)
+    assert stats.repeated_shapes(threshold=2) == [
+        ("SELECT * FROM post WHERE id = $1", 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_statements_are_recorded_only_inside_instrumented_context(
+    session: AsyncSession,
+):
+    await session.execute(text("SELECT 1"))
+
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    await session.execute(text("SELECT 1"))
+    await session.execute(text("SELECT 1"))
+    query_stats.reset(token)
+
+    assert stats.shapes["SELECT 1"] == 2
+
+
+@pytest.mark.asyncio
+async def test_instrumented_request_logs_repeated_statements(
+    client: AsyncClient,
+    sql_instrumentation,
+    monkeypatch,
+    caplog,
+):
+    monkeypatch.setattr(settings, "SQL_N_PLUS_ONE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "SQL_LOG_QUERY_COUNT", 1)
+
+    with caplog.at_level(logging.WARNING, logger="src.database.instrumentation"):
+        response: Response = await client.get("/groups/")
+
+    assert response.status_code == 200
+    assert "Possible N+1 in GET /api/v1/groups/" in caplog.text
+    assert "GET /api/v1/groups/ executed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_instrumented_by_default(
+    client: AsyncClient,
+    caplog,
+):
+    with caplog.at_level(logging.WARNING, logger="src.database.instrumentation"):
+        await client.get("/groups/")
+
+    assert caplog.text == ""
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database.pool import InstrumentedQueuePool
+from src.settings import Settings
+
+
+def test_pool_size_is_derived_from_worker_count():
+    settings = Settings(WEB_CONCURRENCY=4, DB_MAX_CONNECTIONS=80)
+
+    assert settings.db_pool_size == 10
+    assert settings.db_max_overflow == 10
+    assert settings.db_pool_size + settings.db_max_overflow <= 80 // 4
+
+
+def test_explicit_pool_size_overrides_derived_one():
+    settings = Settings(DB_POOL_SIZE=3, DB_MAX_OVERFLOW=0)
+
+    assert settings.db_pool_size == 3
+    assert settings.db_max_overflow == 0
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_reports_checkouts():
+    settings = Settings(TEST_MODE=True)
+    engine = create_async_engine(
+        settings.postgres_url, poolclass=InstrumentedQueuePool, pool_size=2
+    )
+
+    async with engine.connect():
+        stats = engine.pool.stats()
+        assert stats["checked_out"] == 1
+        assert stats["checkout_wait_seconds"]["count"] == 1
+
+    stats = engine.pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["checked_in"] == 1
+    await engine.dispose()
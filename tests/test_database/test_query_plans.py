@@ -0,0 +1,573 @@
+"""
+Query plan regression checks for the read paths of the services.
+
+A dataset of a few hundred thousand rows is seeded inside a transaction that
+is rolled back afterwards, so the planner sees realistic table sizes. Every
+statement a scenario issues is captured and explained; the check fails when a
+plan reads a large table with a sequential scan, or when its estimated cost
+grows past the stored baseline.
+
+After an intended plan change, rewrite the baseline with:
+
+    UPDATE_QUERY_PLAN_BASELINE=1 pytest tests/test_database/test_query_plans.py
+"""
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Iterator
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.apps.groups.services import GroupService
+from src.apps.posts.enums import PostOrder
+from src.apps.posts.services import GroupPostService, UserPostService
+from src.apps.users.models import User
+from src.apps.users.services import FriendService, UserService
+from src.core.pagination import PageParams
+
+BASELINE_PATH = Path(__file__).with_name("query_plan_baseline.json")
+UPDATE_BASELINE = os.environ.get("UPDATE_QUERY_PLAN_BASELINE") == "1"
+
+# Estimated costs may drift this much before the check fails; the statistics
+# of randomly ordered UUID columns vary a little between runs.
+COST_TOLERANCE = 1.5
+# Tables with at least this many rows must not be read with a sequential scan.
+SEQ_SCAN_MIN_ROWS = 1000
+# Scenarios that read a whole table on purpose.
+FULL_SCANS = {"stream_user_list": {"user"}}
+
+USERS = 20_000
+GROUPS = 500
+ROWS = 30_000
+
+# Counted by triggers, which the seed disables: each counted row would update
+# its parent row again and leave thousands of dead row versions behind that a
+# vacuumed table would not have. The seed inserts the counts itself instead.
+COUNTED_TABLES = [
+    "groupmembership",
+    "userpostcomment",
+    "grouppostcomment",
+    "userpostreaction",
+    "grouppostreaction",
+]
+
+# Every post gets one comment, at its own creation time, and one reaction.
+POST_COUNTS = "comment_count, last_commented_at, like_count, dislike_count"
+SEED_POST_COUNTS = (
+    "1, now() - p.n * interval '1 second', (p.n % 2 = 0)::integer, "
+    "(p.n % 2 = 1)::integer"
+)
+
+SEED_STATEMENTS = [
+    *[f"ALTER TABLE {table} DISABLE TRIGGER USER" for table in COUNTED_TABLES],
+    f"""
+    CREATE TEMP TABLE seed_user ON COMMIT DROP AS
+    SELECT n, gen_random_uuid() AS id FROM generate_series(0, {USERS - 1}) n
+    """,
+    f"""
+    CREATE TEMP TABLE seed_group ON COMMIT DROP AS
+    SELECT n, gen_random_uuid() AS id FROM generate_series(0, {GROUPS - 1}) n
+    """,
+    f"""
+    CREATE TEMP TABLE seed_post ON COMMIT DROP AS
+    SELECT n, gen_random_uuid() AS user_post_id, gen_random_uuid() AS group_post_id
+    FROM generate_series(0, {ROWS - 1}) n
+    """,
+    """
+    INSERT INTO "user" (id, created_at, updated_at, username, email, first_name,
+                        last_name, birthday, hashed_password, is_active)
+    SELECT id, now() - n * interval '1 minute', now(), 'user' || n,
+           'user' || n || '@example.com', 'first', 'last', date '2000-01-01',
+           'hash', n % 10 <> 9
+    FROM seed_user
+    """,
+    f"""
+    INSERT INTO "group" (id, created_at, updated_at, name, description, status,
+                         member_count, admin_count, moderator_count)
+    SELECT id, now() - n * interval '1 minute', now(), 'group' || n, 'description',
+           (ARRAY['PUBLIC', 'PRIVATE', 'CLOSED'])[n % 3 + 1]::groupstatus,
+           {USERS // GROUPS}, 1, 0
+    FROM seed_group
+    """,
+    f"""
+    INSERT INTO groupmembership (id, created_at, updated_at, group_id, user_id,
+                                 membership_status)
+    SELECT gen_random_uuid(), now(), now(), g.id, u.id,
+           (CASE WHEN s.n < {GROUPS} THEN 'ADMIN' ELSE 'REGULAR' END)::groupmemberstatus
+    FROM generate_series(0, {USERS - 1}) s(n)
+    JOIN seed_user u ON u.n = s.n
+    JOIN seed_group g ON g.n = s.n % {GROUPS}
+    """,
+    f"""
+    INSERT INTO grouprequest (id, created_at, updated_at, group_id, user_id, status)
+    SELECT gen_random_uuid(), now(), now(), g.id, u.id,
+           (ARRAY['PENDING', 'ACCEPTED', 'DENIED'])[s.n % 3 + 1]::grouprequeststatus
+    FROM generate_series(0, {USERS // 2 - 1}) s(n)
+    JOIN seed_user u ON u.n = (s.n * 3) % {USERS}
+    JOIN seed_group g ON g.n = s.n % {GROUPS}
+    """,
+    f"""
+    INSERT INTO friend (id, created_at, updated_at, user_id, friend_user_id)
+    SELECT gen_random_uuid(), now() - s.n * interval '1 second', now(), u.id, f.id
+    FROM generate_series(0, {2 * USERS - 1}) s(n)
+    JOIN seed_user u ON u.n = s.n % {USERS}
+    JOIN seed_user f ON f.n = (s.n * 7 + 1) % {USERS}
+    """,
+    f"""
+    INSERT INTO friendrequest (id, created_at, updated_at, from_user_id, to_user_id,
+                               status)
+    SELECT gen_random_uuid(), now(), now(), u.id, t.id,
+           (ARRAY['PENDING', 'ACCEPTED', 'DENIED'])[s.n % 3 + 1]::friendrequeststatus
+    FROM generate_series(0, {USERS - 1}) s(n)
+    JOIN seed_user u ON u.n = s.n
+    JOIN seed_user t ON t.n = (s.n * 13 + 5) % {USERS}
+    """,
+    f"""
+    INSERT INTO userpost (id, created_at, updated_at, text, user_id, {POST_COUNTS})
+    SELECT p.user_post_id, now() - p.n * interval '1 second', now(), 'text', u.id,
+           {SEED_POST_COUNTS}
+    FROM seed_post p JOIN seed_user u ON u.n = p.n % {USERS}
+    """,
+    f"""
+    INSERT INTO grouppost (id, created_at, updated_at, text, group_id, user_id,
+                           {POST_COUNTS})
+    SELECT p.group_post_id, now() - p.n * interval '1 second', now(), 'text', g.id,
+           u.id, {SEED_POST_COUNTS}
+    FROM seed_post p
+    JOIN seed_group g ON g.n = p.n % {GROUPS}
+    JOIN seed_user u ON u.n = p.n % {USERS}
+    """,
+    *[
+        f"""
+        INSERT INTO {table} (id, created_at, updated_at, {column}, post_id, user_id)
+        SELECT gen_random_uuid(), now() - p.n * interval '1 second', now(), {value},
+               p.{post_id}, u.id
+        FROM seed_post p JOIN seed_user u ON u.n = p.n % {USERS}
+        """
+        for table, column, value, post_id in [
+            ("userpostcomment", "text", "'text'", "user_post_id"),
+            ("grouppostcomment", "text", "'text'", "group_post_id"),
+            (
+                "userpostreaction",
+                "reaction",
+                "(ARRAY['LIKE', 'DISLIKE'])[p.n % 2 + 1]::reactionenum",
+                "user_post_id",
+            ),
+            (
+                "grouppostreaction",
+                "reaction",
+                "(ARRAY['LIKE', 'DISLIKE'])[p.n % 2 + 1]::reactionenum",
+                "group_post_id",
+            ),
+        ]
+    ],
+    *[f"ALTER TABLE {table} ENABLE TRIGGER USER" for table in COUNTED_TABLES],
+]
+
+SEEDED_TABLES = [
+    "user",
+    "group",
+    "groupmembership",
+    "grouprequest",
+    "friend",
+    "friendrequest",
+    "userpost",
+    "grouppost",
+    "userpostcomment",
+    "grouppostcomment",
+    "userpostreaction",
+    "grouppostreaction",
+]
+
+# n = 0 is user 0, the admin of public group 0, with post 0 of either kind.
+SEED_IDS = """
+SELECT
+    (SELECT id FROM seed_user WHERE n = 0) AS user_id,
+    (SELECT id FROM seed_group WHERE n = 0) AS group_id,
+    (SELECT user_post_id FROM seed_post WHERE n = 0) AS user_post_id,
+    (SELECT group_post_id FROM seed_post WHERE n = 0) AS group_post_id,
+    (SELECT id FROM userpostcomment WHERE post_id = seed_post.user_post_id)
+        AS user_post_comment_id,
+    (SELECT id FROM userpostreaction WHERE post_id = seed_post.user_post_id)
+        AS user_post_reaction_id,
+    (SELECT id FROM grouppostcomment WHERE post_id = seed_post.group_post_id)
+        AS group_post_comment_id,
+    (SELECT id FROM grouppostreaction WHERE post_id = seed_post.group_post_id)
+        AS group_post_reaction_id,
+    (SELECT id FROM groupmembership WHERE group_id = seed_group.id LIMIT 1)
+        AS membership_id,
+    (SELECT id FROM grouprequest WHERE group_id = seed_group.id LIMIT 1)
+        AS group_request_id,
+    (SELECT id FROM grouprequest WHERE user_id = seed_user.id LIMIT 1)
+        AS user_group_request_id,
+    (SELECT id FROM friend WHERE user_id = seed_user.id LIMIT 1) AS friend_id,
+    (SELECT id FROM friendrequest WHERE from_user_id = seed_user.id LIMIT 1)
+        AS sent_friend_request_id,
+    (SELECT id FROM friendrequest WHERE to_user_id = seed_user.id LIMIT 1)
+        AS received_friend_request_id
+FROM seed_user, seed_group, seed_post
+WHERE seed_user.n = 0 AND seed_group.n = 0 AND seed_post.n = 0
+"""
+
+Scenario = Callable[[AsyncSession, SimpleNamespace], Awaitable[Any]]
+
+page_params = PageParams(limit=20)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "user_list": lambda session, ids: UserService.get_user_list(
+        page_params=page_params, session=session
+    ),
+    "user_list_active": lambda session, ids: UserService.get_user_list(
+        page_params=page_params, session=session, is_active=True
+    ),
+    "user_list_username_prefix": lambda session, ids: UserService.get_user_list(
+        page_params=page_params, session=session, username_prefix="user12"
+    ),
+    "user_by_id": lambda session, ids: UserService.get_user_by_id(
+        user_id=ids.user_id, session=session
+    ),
+    "friend_list": lambda session, ids: FriendService.filter_friend_list(
+        request_user=ids.user, session=session
+    ),
+    "friend_by_id": lambda session, ids: FriendService.filter_friend_by_id(
+        friend_id=ids.friend_id, request_user=ids.user, session=session
+    ),
+    "received_friend_requests": lambda session, ids: (
+        FriendService.filter_received_friend_requests(
+            request_user=ids.user, session=session
+        )
+    ),
+    "received_friend_request_by_id": lambda session, ids: (
+        FriendService.filter_received_friend_request_by_id(
+            friend_request_id=ids.received_friend_request_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "sent_friend_requests": lambda session, ids: (
+        FriendService.filter_sent_friend_requests(
+            request_user=ids.user, session=session
+        )
+    ),
+    "sent_friend_request_by_id": lambda session, ids: (
+        FriendService.filter_sent_friend_request_by_id(
+            friend_request_id=ids.sent_friend_request_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "group_list_anonymous": lambda session, ids: GroupService.filter_get_group_list(
+        request_user=None, session=session
+    ),
+    "group_list": lambda session, ids: GroupService.filter_get_group_list(
+        request_user=ids.user, session=session
+    ),
+    "group_by_id": lambda session, ids: GroupService.filter_get_group_by_id(
+        group_id=ids.group_id, request_user=ids.user, session=session
+    ),
+    "group_members": lambda session, ids: GroupService.filter_get_group_members_list(
+        group_id=ids.group_id, request_user=ids.user, session=session
+    ),
+    "group_member_by_id": lambda session, ids: (
+        GroupService.filter_get_group_member_by_id(
+            group_id=ids.group_id,
+            membership_id=ids.membership_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "group_requests": lambda session, ids: GroupService.filter_get_group_request_list(
+        group_id=ids.group_id, request_user=ids.user, session=session
+    ),
+    "group_request_by_id": lambda session, ids: (
+        GroupService.filter_get_group_request_by_id(
+            group_id=ids.group_id,
+            request_id=ids.group_request_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "user_group_requests": lambda session, ids: (
+        GroupService.filter_get_user_group_request_list(
+            request_user=ids.user, session=session
+        )
+    ),
+    "user_group_request_by_id": lambda session, ids: (
+        GroupService.filter_get_user_group_request_by_id(
+            request_id=ids.user_group_request_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "user_post_list": lambda session, ids: UserPostService.filter_get_user_post_list(
+        user_id=ids.user_id, page_params=page_params, session=session
+    ),
+    "user_post_list_by_activity": lambda session, ids: (
+        UserPostService.filter_get_user_post_list(
+            user_id=ids.user_id,
+            page_params=page_params,
+            session=session,
+            order=PostOrder.ACTIVITY,
+        )
+    ),
+    "user_post_by_id": lambda session, ids: (
+        UserPostService.filter_get_user_post_by_id(
+            user_id=ids.user_id, post_id=ids.user_post_id, session=session
+        )
+    ),
+    "user_post_comments": lambda session, ids: (
+        UserPostService.filter_get_user_post_comment_list(
+            user_id=ids.user_id,
+            post_id=ids.user_post_id,
+            page_params=page_params,
+            session=session,
+        )
+    ),
+    "user_post_comment_by_id": lambda session, ids: (
+        UserPostService.filter_get_user_post_comment_by_id(
+            user_id=ids.user_id,
+            post_id=ids.user_post_id,
+            comment_id=ids.user_post_comment_id,
+            session=session,
+        )
+    ),
+    "user_post_reactions": lambda session, ids: (
+        UserPostService.filter_get_user_post_reaction_list(
+            user_id=ids.user_id,
+            post_id=ids.user_post_id,
+            page_params=page_params,
+            session=session,
+        )
+    ),
+    "user_post_reaction_by_id": lambda session, ids: (
+        UserPostService.filter_get_user_post_reaction_by_id(
+            user_id=ids.user_id,
+            post_id=ids.user_post_id,
+            reaction_id=ids.user_post_reaction_id,
+            session=session,
+        )
+    ),
+    "group_post_list": lambda session, ids: (
+        GroupPostService.filter_get_group_post_list(
+            group_id=ids.group_id,
+            request_user=ids.user,
+            page_params=page_params,
+            session=session,
+        )
+    ),
+    "group_post_list_by_activity": lambda session, ids: (
+        GroupPostService.filter_get_group_post_list(
+            group_id=ids.group_id,
+            request_user=ids.user,
+            page_params=page_params,
+            session=session,
+            order=PostOrder.ACTIVITY,
+        )
+    ),
+    "group_post_by_id": lambda session, ids: (
+        GroupPostService.filter_get_group_post_by_id(
+            group_id=ids.group_id,
+            post_id=ids.group_post_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "group_post_comments": lambda session, ids: (
+        GroupPostService.filter_get_group_post_comment_list(
+            group_id=ids.group_id,
+            post_id=ids.group_post_id,
+            request_user=ids.user,
+            page_params=page_params,
+            session=session,
+        )
+    ),
+    "group_post_comment_by_id": lambda session, ids: (
+        GroupPostService.filter_get_group_post_comment_by_id(
+            group_id=ids.group_id,
+            post_id=ids.group_post_id,
+            comment_id=ids.group_post_comment_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+    "group_post_reactions": lambda session, ids: (
+        GroupPostService.filter_get_group_post_reaction_list(
+            group_id=ids.group_id,
+            post_id=ids.group_post_id,
+            request_user=ids.user,
+            page_params=page_params,
+            session=session,
+        )
+    ),
+    "group_post_reaction_by_id": lambda session, ids: (
+        GroupPostService.filter_get_group_post_reaction_by_id(
+            group_id=ids.group_id,
+            post_id=ids.group_post_id,
+            reaction_id=ids.group_post_reaction_id,
+            request_user=ids.user,
+            session=session,
+        )
+    ),
+}
+
+
+async def _stream(stream: Awaitable[Any]) -> None:
+    await (await stream).close()
+
+
+SCENARIOS.update(
+    {
+        "stream_user_list": lambda session, ids: _stream(
+            UserService.stream_user_list(session=session)
+        ),
+        "stream_friend_list": lambda session, ids: _stream(
+            FriendService.stream_friend_list(request_user=ids.user, session=session),
+        ),
+        "stream_group_list": lambda session, ids: _stream(
+            GroupService.stream_group_list(request_user=ids.user, session=session),
+        ),
+        "stream_user_post_list": lambda session, ids: _stream(
+            UserPostService.stream_user_post_list(user_id=ids.user_id, session=session),
+        ),
+        "stream_group_post_comments": lambda session, ids: _stream(
+            GroupPostService.stream_group_post_comment_list(
+                group_id=ids.group_id,
+                post_id=ids.group_post_id,
+                request_user=ids.user,
+                session=session,
+            ),
+        ),
+    }
+)
+
+
+def _load_baseline() -> dict[str, list[float]]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+baseline = _load_baseline()
+
+
+def plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+class StatementCapture:
+    """
+    Collects the statements sent to the database, with their parameters, so
+    they can be explained with the same values.
+    """
+
+    explained_prefixes = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine.sync_engine
+        self.statements: list[tuple[str, Any]] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(self.explained_prefixes):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "StatementCapture":
+        event.listen(self.engine, "before_cursor_execute", self.record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self.record)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_connection(async_engine: AsyncEngine) -> AsyncConnection:
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        for statement in SEED_STATEMENTS:
+            await conn.execute(text(statement))
+        for table in SEEDED_TABLES:
+            await conn.execute(text(f'ANALYZE "{table}"'))
+
+        yield conn
+
+        await transaction.rollback()
+    # ANALYZE updates the table sizes in place, so they survive the rollback;
+    # refresh them for the tests that run afterwards.
+    async with async_engine.connect() as conn:
+        for table in SEEDED_TABLES:
+            await conn.execute(text(f'ANALYZE "{table}"'))
+        await conn.commit()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def large_tables(seeded_connection: AsyncConnection) -> set[str]:
+    rows = await seeded_connection.execute(
+        text("SELECT relname FROM pg_class WHERE relkind = 'r' AND reltuples >= :rows"),
+        {"rows": SEQ_SCAN_MIN_ROWS},
+    )
+    return set(rows.scalars())
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seed_ids(seeded_connection: AsyncConnection) -> SimpleNamespace:
+    ids = SimpleNamespace(**(await seeded_connection.execute(text(SEED_IDS))).one())
+    async with AsyncSession(seeded_connection) as session:
+        ids.user = await session.get(User, ids.user_id)
+        session.expunge(ids.user)
+    return ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", SCENARIOS)
+async def test_query_plan(
+    name: str,
+    async_engine: AsyncEngine,
+    seeded_connection: AsyncConnection,
+    large_tables: set[str],
+    seed_ids: SimpleNamespace,
+):
+    async with AsyncSession(seeded_connection, expire_on_commit=False) as session:
+        await seeded_connection.begin_nested()
+        with StatementCapture(async_engine) as capture:
+            await SCENARIOS[name](session, seed_ids)
+        plans = []
+        for statement, parameters in capture.statements:
+            plan = (
+                await seeded_connection.exec_driver_sql(
+                    "EXPLAIN (FORMAT JSON) " + statement, parameters
+                )
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plans.append((statement, plan[0]["Plan"]))
+        await seeded_connection.get_nested_transaction().rollback()
+
+    assert plans, f"{name} issued no statements"
+    for statement, plan in plans:
+        seq_scans = {
+            node["Relation Name"]
+            for node in plan_nodes(plan)
+            if node["Node Type"] == "Seq Scan" and node["Relation Name"] in large_tables
+        } - FULL_SCANS.get(name, set())
+        assert not seq_scans, f"{name} scans {seq_scans} sequentially: {statement}"
+
+    costs = [plan["Total Cost"] for statement, plan in plans]
+    if UPDATE_BASELINE:
+        baseline[name] = costs
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return
+
+    assert name in baseline, f"No baseline for {name}; see the module docstring."
+    assert len(costs) == len(
+        baseline[name]
+    ), f"{name} issues a different number of statements"
+    for (statement, plan), cost, baseline_cost in zip(plans, costs, baseline[name]):
+        assert (
+            cost <= baseline_cost * COST_TOLERANCE
+        ), f"{name} costs {cost}, baseline {baseline_cost}: {statement}"
@@ -0,0 +1,160 @@
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.responses import StreamingResponse
+
+from src.database.routing import (
+    ReplicaRouter,
+    complete_sessions,
+    release_read_session,
+    write_pin,
+)
+
+
+class SpySession(AsyncSession):
+    closed = False
+    committed = False
+
+    async def close(self):
+        self.closed = True
+        await super().close()
+
+    async def commit(self):
+        self.committed = True
+        await super().commit()
+
+
+@pytest.mark.asyncio
+async def test_complete_sessions_closes_read_and_commits_write_sessions():
+    async def endpoint(read_session: AsyncSession, session: AsyncSession) -> str:
+        return "response"
+
+    read_session = SpySession(info={"read_only": True})
+    session = SpySession()
+
+    response = await complete_sessions(endpoint)(
+        read_session=read_session, session=session
+    )
+
+    assert response == "response"
+    assert read_session.closed
+    assert not read_session.committed
+    assert session.committed
+    assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_release_read_session_closes_only_read_sessions():
+    read_session = SpySession(info={"read_only": True})
+    session = SpySession()
+
+    await release_read_session(read_session)
+    await release_read_session(session)
+
+    assert read_session.closed
+    assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_complete_sessions_passes_on_pin_of_committed_writes():
+    async def endpoint(session: AsyncSession) -> str:
+        session.info["write_pin"] = "pin"
+        return "response"
+
+    session = SpySession()
+    token = write_pin.set(None)
+
+    await complete_sessions(endpoint)(session=session)
+
+    assert session.committed
+    assert write_pin.get() == "pin"
+    assert "write_pin" not in session.info
+    write_pin.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_complete_sessions_does_not_commit_after_failure():
+    async def endpoint(session: AsyncSession) -> str:
+        raise ValueError
+
+    session = SpySession()
+
+    with pytest.raises(ValueError):
+        await complete_sessions(endpoint)(session=session)
+
+    assert not session.committed
+
+
+@pytest.mark.asyncio
+async def test_complete_sessions_leaves_streamed_response_sessions_open():
+    response = StreamingResponse(iter([]))
+
+    async def endpoint(read_session: AsyncSession) -> StreamingResponse:
+        return response
+
+    read_session = SpySession(info={"read_only": True})
+
+    assert await complete_sessions(endpoint)(read_session=read_session) is response
+    assert not read_session.closed
+
+
+def test_complete_sessions_keeps_sync_endpoints():
+    def endpoint() -> None:
+        return None
+
+    assert complete_sessions(endpoint) is endpoint
+
+
+def test_replica_router_without_replicas_reads_from_primary():
+    primary = object()
+    router = ReplicaRouter(primary=primary, replicas=[], window=5, secret_key="secret")
+
+    assert router.get_read_engine() is primary
+    assert router.get_read_engine(router.record_write()) is primary
+
+
+def test_replica_router_spreads_reads_over_replicas():
+    primary, first, second = object(), object(), object()
+    router = ReplicaRouter(
+        primary=primary, replicas=[first, second], window=5, secret_key="secret"
+    )
+
+    assert [router.get_read_engine() for _ in range(3)] == [first, second, first]
+
+
+def test_replica_router_honours_pins_recorded_by_other_workers():
+    primary, replica = object(), object()
+    writer = ReplicaRouter(
+        primary=primary, replicas=[replica], window=5, secret_key="secret"
+    )
+    reader = ReplicaRouter(
+        primary=primary, replicas=[replica], window=5, secret_key="secret"
+    )
+
+    pin = writer.record_write()
+
+    assert reader.get_read_engine(pin) is primary
+    assert reader.get_read_engine() is replica
+
+
+def test_replica_router_rejects_forged_pins():
+    primary, replica = object(), object()
+    router = ReplicaRouter(
+        primary=primary, replicas=[replica], window=5, secret_key="secret"
+    )
+    other = ReplicaRouter(
+        primary=primary, replicas=[replica], window=5, secret_key="other"
+    )
+    written_at, _, _ = router.record_write().rpartition(".")
+
+    assert router.get_read_engine(other.record_write()) is replica
+    assert router.get_read_engine(f"{written_at}.forged") is replica
+    assert router.get_read_engine("forged") is replica
+
+
+def test_replica_router_releases_pin_after_window():
+    primary, replica = object(), object()
+    router = ReplicaRouter(
+        primary=primary, replicas=[replica], window=0, secret_key="secret"
+    )
+
+    assert router.get_read_engine(router.record_write()) is replica